@@ -1,21 +1,32 @@
 import timeit
+import tracemalloc
+from datetime import timedelta
+from glob import glob
 from os import remove, path
+from shutil import rmtree
 from dataclasses import dataclass
+from copy import deepcopy
 from typing import Optional
+from unittest import mock
 
 from matplotlib import pyplot as plt
+import networkx as nx
 import numpy as np
 
 import oopnet as on
+from oopnet.hydraulics import GGASolver
+from oopnet.writer.write import write_string
 
 poulakis_filename = path.join('testing', 'networks', 'Poulakis_enhanced_PDA.inp')
 ctown_filename = path.join('examples', 'data', 'C-town.inp')
+ltown_filename = path.join('examples', 'data', 'L-TOWN_AreaC.inp')
 
 
 @dataclass
 class OOPNETBenchmark:
     filename: str
     network: Optional[on.Network] = None
+    report_filename: Optional[str] = None
 
     def __post_init__(self):
         self.reset()
@@ -26,10 +37,61 @@ class OOPNETBenchmark:
     def read(self):
         network = on.Network.read(self.filename)
 
+    def read_peak_memory(self) -> float:
+        """Returns the peak memory allocated while reading the model in MB."""
+        tracemalloc.start()
+        self.read()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak / 1e6
+
+    def deepcopy(self):
+        deepcopy(self.network)
+
+    def clone(self):
+        self.network.clone()
+
+    def write_scenarios(self):
+        junction_ids = on.get_junction_ids(self.network)
+        for i in range(100):
+            scenario = on.Scenario(self.network)
+            scenario.set_node(junction_ids[i % len(junction_ids)], demand=1.0)
+            scenario.write('test.inp')
+        remove('test.inp')
+
+    def write_copies(self):
+        junction_ids = on.get_junction_ids(self.network)
+        for i in range(100):
+            network = self.network.clone()
+            on.get_junction(network, junction_ids[i % len(junction_ids)]).demand = 1.0
+            network.write('test.inp')
+        remove('test.inp')
+
     def increase_demand(self):
         for j in on.get_junctions(self.network):
             j.demand += 0.0001
 
+    def increase_demand_bulk(self):
+        on.set_basedemand(self.network, on.get_basedemand(self.network) + 0.0001)
+
+    def change_length_bulk(self):
+        on.set_length(self.network, on.get_length(self.network) - 0.0001)
+
+    def increase_demand_column_store(self):
+        columns = self.network._nodes['junctions'].columns
+        columns.assign('demand', columns.array('demand') + 0.0001)
+
+    def vector_getters(self):
+        on.get_length(self.network)
+        on.get_diameter(self.network)
+        on.get_elevation(self.network)
+        on.get_basedemand(self.network)
+
+    def coordinate_getters(self):
+        on.get_coordinates(self.network)
+        on.get_startendcoordinates(self.network)
+        on.get_linkcenter_coordinates(self.network)
+
     def change_length(self):
         for p in on.get_pipes(self.network):
             p.length -= 0.0001
@@ -59,16 +121,68 @@ class OOPNETBenchmark:
         for link in on.get_links(self.network):
             id = link.id
 
+    def neighbor_sweep(self):
+        for node in on.get_nodes(self.network):
+            on.get_next_neighbor_nodes(self.network, node)
+
     def create_graph(self):
         g = on.MultiGraph(self.network)
 
+    def convert_edge_result(self):
+        g = on.MultiGraph(self.network)
+        on.edgeresult2pandas(g, {edge: 1.0 for edge in g.edges(keys=True)})
+
+    def csr_graph_queries(self):
+        sources = on.get_reservoir_ids(self.network) + on.get_tank_ids(self.network)
+        g = on.CSRGraph(self.network)
+        g.shortest_path_lengths(sources)
+        g.connected_components()
+        g.bridges()
+
+    def networkx_graph_queries(self):
+        sources = on.get_reservoir_ids(self.network) + on.get_tank_ids(self.network)
+        g = on.MultiGraph(self.network, switch_direction=False)
+        nx.multi_source_dijkstra_path_length(g, sources)
+        list(nx.connected_components(g))
+        list(nx.bridges(g))
+
+    def create_matrices(self):
+        on.incidence_matrix(self.network, oriented=True)
+        on.laplacian_matrix(self.network, weight='length')
+
     def simulate(self):
         rpt = self.network.run()
 
+    def solve_steady_state(self):
+        rpt = GGASolver(self.network).run()
+
+    def read_report(self):
+        on.ReportFileReader(self.report_filename)
+
+    def read_report_lst2xray(self):
+        # the vectorised parser's fallback parses every table with lst2xray like the previous parser
+        with mock.patch('oopnet.simulator.reportfile_reader._parse_blocks', return_value=None):
+            on.ReportFileReader(self.report_filename)
+
+    def write_report(self, duration: timedelta = timedelta(hours=24)):
+        network = on.Network.read(self.filename)
+        network.times.duration = duration
+        rmtree('benchmark_tmp', ignore_errors=True)
+        network.run(delete=False, path='benchmark_tmp')
+        self.report_filename = glob(path.join('benchmark_tmp', '*.rpt'))[0]
+
     def write(self):
         self.network.write('test.inp')
         remove('test.inp')
 
+    def write_memory(self):
+        write_string(self.network)
+
+    def write_throughput(self, n) -> float:
+        """Returns the number of Nodes and Links written per second."""
+        components = len(on.get_node_ids(self.network)) + len(on.get_link_ids(self.network))
+        return components * n / min(timeit.Timer(stmt=self.write_memory).repeat(number=n))
+
     def plot(self):
         self.network.plot()
         plt.close()
@@ -91,14 +205,65 @@ class OOPNETBenchmark:
         print(np.mean(timeit.Timer(stmt=self.read).repeat(number=n)))
         self.reset()
 
+        print('\nReading file (peak memory in MB)')
+        print(self.read_peak_memory())
+        self.reset()
+
+        print('\nCopying the network with deepcopy')
+        print(np.mean(timeit.Timer(stmt=self.deepcopy).repeat(number=n)))
+
+        print('\nCopying the network with Network.clone')
+        print(np.mean(timeit.Timer(stmt=self.clone).repeat(number=n)))
+
+        print('\nWriting 100 scenarios')
+        print(np.mean(timeit.Timer(stmt=self.write_scenarios).repeat(number=n)))
+
+        print('\nWriting 100 modified copies')
+        print(np.mean(timeit.Timer(stmt=self.write_copies).repeat(number=n)))
+
         print('\nChanging demands')
         print(np.mean(timeit.Timer(stmt=self.increase_demand).repeat(number=n)))
         self.reset()
 
+        print('\nChanging demands with a bulk setter')
+        print(np.mean(timeit.Timer(stmt=self.increase_demand_bulk).repeat(number=n)))
+        self.reset()
+
+        print('\nChanging demands with a bulk setter and column store')
+        on.enable_column_store(self.network)
+        print(np.mean(timeit.Timer(stmt=self.increase_demand_bulk).repeat(number=n)))
+        self.reset()
+
+        print('\nChanging demands with column store')
+        on.enable_column_store(self.network)
+        print(np.mean(timeit.Timer(stmt=self.increase_demand_column_store).repeat(number=n)))
+        self.reset()
+
+        print('\nGetting lengths, diameters, elevations and demands')
+        print(np.mean(timeit.Timer(stmt=self.vector_getters).repeat(number=n)))
+
+        print('\nGetting lengths, diameters, elevations and demands with column store')
+        on.enable_column_store(self.network)
+        print(np.mean(timeit.Timer(stmt=self.vector_getters).repeat(number=n)))
+        self.reset()
+
+        print('\nGetting coordinates of an unchanged Network repeatedly')
+        print(np.mean(timeit.Timer(stmt=self.coordinate_getters).repeat(number=n)))
+        self.reset()
+
         print('\nChanging lengths')
         print(np.mean(timeit.Timer(stmt=self.change_length).repeat(number=n)))
         self.reset()
 
+        print('\nChanging lengths with a bulk setter')
+        print(np.mean(timeit.Timer(stmt=self.change_length_bulk).repeat(number=n)))
+        self.reset()
+
+        print('\nChanging lengths with a bulk setter and column store')
+        on.enable_column_store(self.network)
+        print(np.mean(timeit.Timer(stmt=self.change_length_bulk).repeat(number=n)))
+        self.reset()
+
         print('\nRandomly accessing Nodes')
         print(np.mean(timeit.Timer(stmt=self.random_node_access).repeat(number=n)))
         self.reset()
@@ -111,25 +276,95 @@ class OOPNETBenchmark:
         print(np.mean(timeit.Timer(stmt=self.lookup_ids).repeat(number=n)))
         self.reset()
 
+        print('\nQuerying next neighbors of all Nodes')
+        print(np.mean(timeit.Timer(stmt=self.neighbor_sweep).repeat(number=n)))
+        self.reset()
+
         print('\nGenerating MultiGraph')
         print(np.mean(timeit.Timer(stmt=self.create_graph).repeat(number=n)))
         self.reset()
 
+        print('\nGenerating MultiGraph and converting an edge result')
+        print(np.mean(timeit.Timer(stmt=self.convert_edge_result).repeat(number=n)))
+        self.reset()
+
+        print('\nShortest paths from sources, connected components and bridges with CSRGraph')
+        print(np.mean(timeit.Timer(stmt=self.csr_graph_queries).repeat(number=n)))
+        self.reset()
+
+        print('\nShortest paths from sources, connected components and bridges with NetworkX')
+        print(np.mean(timeit.Timer(stmt=self.networkx_graph_queries).repeat(number=n)))
+        self.reset()
+
+        print('\nGenerating incidence and Laplacian matrix')
+        print(np.mean(timeit.Timer(stmt=self.create_matrices).repeat(number=n)))
+        self.reset()
+
         print('\nSimulating model')
         print(np.mean(timeit.Timer(stmt=self.simulate).repeat(number=n)))
         self.reset()
 
+        print('\nSimulating model and reporting pressures of 50 Nodes and flows of 10 Links')
+        nodes, links = on.get_node_ids(self.network)[:50], on.get_link_ids(self.network)[:10]
+        print(np.mean(timeit.Timer(
+            stmt=lambda: self.network.run(nodes=nodes, links=links, variables=['pressure', 'flow'])
+        ).repeat(number=n)))
+        self.reset()
+
+        print('\nSimulating model with a result cache')
+        cache = on.ResultCache()
+        print(np.mean(timeit.Timer(stmt=lambda: self.network.run(cache=cache)).repeat(number=n)))
+        self.reset()
+
+        print('\nSimulating model in-process with the EPANET toolkit')
+        with on.ToolkitSimulator(self.network) as simulator:
+            print(np.mean(timeit.Timer(stmt=simulator.run).repeat(number=n)))
+        self.reset()
+
+        print('\nSimulating model with a persistent worker pool')
+        with on.SimulationPool(self.network, workers=2) as pool:
+            print(np.mean(timeit.Timer(stmt=pool.run).repeat(number=n)))
+        self.reset()
+
+        print('\nSolving the steady state in-process with GGASolver')
+        print(np.mean(timeit.Timer(stmt=self.solve_steady_state).repeat(number=n)))
+        self.reset()
+
+        print('\nParsing report file')
+        self.write_report()
+        print(np.mean(timeit.Timer(stmt=self.read_report).repeat(number=n)))
+        print('\nParsing report file with lst2xray')
+        print(np.mean(timeit.Timer(stmt=self.read_report_lst2xray).repeat(number=n)))
+        rmtree('benchmark_tmp')
+        self.reset()
+
         print('\nWriting file')
         print(np.mean(timeit.Timer(stmt=self.write).repeat(number=n)))
         self.reset()
 
+        print('\nWriting to memory (Nodes and Links per second)')
+        print(self.write_throughput(n))
+        self.reset()
+
         print('\nPlotting network')
         print(np.mean(timeit.Timer(stmt=self.plot).repeat(number=n)))
         self.reset()
 
 
+def run_report_benchmark(n):
+    """Compares the vectorised report file parser with lst2xray on 24 h report files of C-town and L-TOWN."""
+    for filename in (ctown_filename, ltown_filename):
+        benchmark = OOPNETBenchmark(filename=filename)
+        benchmark.write_report()
+        print(f'\nParsing the report file of {path.split(filename)[-1]} (lst2xray, vectorised)')
+        print(min(timeit.Timer(stmt=benchmark.read_report_lst2xray).repeat(repeat=3, number=n)) / n)
+        print(min(timeit.Timer(stmt=benchmark.read_report).repeat(repeat=3, number=n)) / n)
+        rmtree('benchmark_tmp')
+
+
 if __name__ == '__main__':
     n = 1_000
     filename = ctown_filename
     OOPNETBenchmark(filename=filename).run_bechmark(n)
+    run_report_benchmark(1)
     # OOPNETBenchmark(filename=filename).run_single_instance()
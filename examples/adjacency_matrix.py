@@ -1,31 +1,27 @@
 import os
 
-import networkx as nx
 from matplotlib import pyplot as plt
 import oopnet as on
 
 filename = os.path.join('data', 'anytown.inp')
 net = on.Network.read(filename)
 
-G = on.Graph(net)
 nodes = on.get_node_ids(net)
-links = on.onlinks2nxlinks(net)
+links = on.get_link_ids(net)
 
-A = nx.incidence_matrix(G, nodelist=nodes, edgelist=links)
+A = on.incidence_matrix(net)
 print('Incidence Matrix - not oriented')
 print(A)
 
-B = nx.incidence_matrix(G, nodelist=nodes, edgelist=links, oriented=True)
+B = on.incidence_matrix(net, oriented=True)
 print('Incidence matrix - oriented')
 print(B)
 
-
-C = nx.adjacency_matrix(G, nodelist=nodes)
+C = on.adjacency_matrix(net)
 print('Adjacency matrix; undirected graph')
 print(C)
 
-G = on.DiGraph(net)
-D = nx.adjacency_matrix(G, nodelist=nodes)
+D = on.adjacency_matrix(net, directed=True)
 print('Adjacency matrix; directed graph')
 print(D)
 
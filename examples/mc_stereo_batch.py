@@ -0,0 +1,36 @@
+import os
+
+import numpy as np
+import pandas as pd
+import oopnet as on
+from matplotlib import pyplot as plt
+
+
+def roll_the_dice(network: on.Network, mcruns: int):
+    rng = np.random.default_rng()
+    junctions = on.get_junctions(network)
+    ids = [j.id for j in junctions]
+    demands = np.array([j.demand for j in junctions])
+    for _ in range(mcruns):
+        yield {'demand': dict(zip(ids, demands + rng.normal(0.0, 1.0, len(ids))))}
+
+
+if __name__ == '__main__':
+    filename = os.path.join('data', 'Poulakis.inp')
+
+    net = on.Network.read(filename)
+    mcruns = 1_000
+
+    p = [rpt.pressure for rpt in on.run_batch(net, roll_the_dice(net, mcruns))]
+
+    p = pd.DataFrame(p, index=list(range(len(p))))
+    print(p)
+
+    p_mean = p.mean()
+    print(p_mean)
+
+    p_sub = p.sub(p_mean, axis=1)
+
+    x = np.linspace(-1.5, 1.5, 40)
+    p_sub[['J-03', 'J-31']].hist(bins=x, layout=(2, 1))
+    plt.show()
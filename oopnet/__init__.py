@@ -8,4 +8,9 @@ from .simulator import *
 from .utils.adders import *
 from .utils.getters import *
 from .utils.removers import *
+from .utils.setters import *
 from .utils import *
+from .simulator.batch import run_batch
+from .simulator.cache import ResultCache
+from .simulator.pool import SimulationPool
+from .simulator.toolkit import ToolkitSimulator
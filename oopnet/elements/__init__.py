@@ -26,3 +26,5 @@ from .system_operation import (
     Energy,
 )
 from .component_registry import ComponentNotExistingError, IdenticalIDError
+from .column_store import enable_column_store, disable_column_store
+from .scenario import Scenario
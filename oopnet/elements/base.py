@@ -2,14 +2,130 @@
 This module contains all the base classes of OOPNET
 """
 from __future__ import annotations
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Optional, TYPE_CHECKING
 from abc import ABC, abstractmethod
 
+from oopnet.elements.component_registry import IdenticalIDError
+
 if TYPE_CHECKING:
     from oopnet.elements.network import Network
 
 
+# subclasses of the component classes used for components that are part of a Network and their original classes
+_TRACKED_CLASSES: dict[type, type] = {}
+_PLAIN_CLASSES: dict[type, type] = {}
+
+
+def component_type(component: NetworkComponent) -> type:
+    """Returns the class of a component as defined by OOPNET.
+
+    Components that are part of a Network or of a column store use subclasses of these classes that share their names.
+    Use this function instead of type() to look up values by component class.
+
+    Args:
+        component: OOPNET NetworkComponent
+
+    Returns:
+        component class, e.g. Junction or PRV
+
+    """
+    cls = type(component)
+    return _PLAIN_CLASSES.get(cls, cls)
+
+
+def _component_eq(self, other) -> bool:
+    """Compares components like the dataclass __eq__ method, no matter which subclass they currently use."""
+    if component_type(other) is not component_type(self):
+        return NotImplemented
+    names = [field.name for field in fields(self) if field.compare]
+    return tuple(getattr(self, name) for name in names) == tuple(getattr(other, name) for name in names)
+
+
+def _data_descriptors(cls: type) -> frozenset[str]:
+    """Returns the names of a class's attributes that are data descriptors, e.g. properties with setters."""
+    return frozenset(
+        name for base in cls.__mro__ for name, value in vars(base).items() if hasattr(type(value), "__set__")
+    )
+
+
+def _tracked_setattr(self, name: str, value):
+    """Sets an attribute and increments the version of the component's Network."""
+    # object.__setattr__ is comparably slow and only needed for properties, plain fields are set directly
+    if name in self._data_descriptors_:
+        object.__setattr__(self, name, value)
+    else:
+        self.__dict__[name] = value
+    network = self.__dict__.get("_network_")
+    if network is not None:
+        network._version_ += 1
+
+
+def _tracked_reduce_ex(self, protocol: int):
+    """Pickles components that are part of a Network by their original class."""
+    return _new_tracked, (component_type(self),), self.__dict__
+
+
+def _variant_namespace(cls: type) -> dict:
+    """Returns the namespace shared by all subclasses of a component class created by OOPNET.
+
+    The subclasses share the original class's name and representation and compare equal to it.
+
+    """
+    return {
+        "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__,
+        "__doc__": cls.__doc__,
+        "__eq__": _component_eq,
+        "__hash__": cls.__hash__,
+    }
+
+
+def _register_variant(variant: type, cls: type):
+    """Registers a subclass of a component class created by OOPNET."""
+    _PLAIN_CLASSES[variant] = cls
+
+
+def _tracked_class(cls: type) -> type:
+    """Returns a subclass of a component class that notices attribute changes.
+
+    Components are switched to this subclass when they are added to a Network. Its __setattr__ method increments the
+    Network's version, so that memoised getters (see :mod:`oopnet.utils.getters.property_getters`) notice changed
+    attributes. Components outside of a Network don't pay for this, e.g. while a model is being read.
+
+    Args:
+        cls: component class
+
+    Returns:
+        component class with a version tracking __setattr__ method
+
+    """
+    cls = _PLAIN_CLASSES.get(cls, cls)
+    try:
+        return _TRACKED_CLASSES[cls]
+    except KeyError:
+        pass
+    namespace = _variant_namespace(cls)
+    namespace.update(
+        __setattr__=_tracked_setattr, __reduce_ex__=_tracked_reduce_ex, _data_descriptors_=_data_descriptors(cls)
+    )
+    tracked = type(cls.__name__, (cls,), namespace)
+    _TRACKED_CLASSES[cls] = tracked
+    _register_variant(tracked, cls)
+    return tracked
+
+
+def _new_tracked(cls: type) -> NetworkComponent:
+    """Creates an empty component that is part of a Network while unpickling or copying."""
+    return object.__new__(_tracked_class(cls))
+
+
+def _restore_class(component: NetworkComponent):
+    """Switches a component to the class matching its Network membership, e.g. after leaving a column store."""
+    cls = component_type(component)
+    component.__class__ = cls if component.__dict__.get("_network_") is None else _tracked_class(cls)
+
+
 @dataclass
 class NetworkComponent(ABC):
     """This is OOPNET's base class for all objects having a name (id) in EPANET Input files
@@ -46,6 +162,9 @@ class NetworkComponent(ABC):
     def _network(self, value: Optional[Network]):
         if not self._network_ or value is None:
             self._network_ = value
+            # components in a column store keep their class, it is restored when they leave the store
+            if "_columns_" not in self.__dict__:
+                _restore_class(self)
         else:
             raise RuntimeError(
                 "NetworkComponents cannot be added to two different Networks."
@@ -53,5 +172,10 @@ class NetworkComponent(ABC):
 
     def _rename(self, id: str, hashtable: dict) -> None:
         if hashtable:
-            hashtable[id] = hashtable.pop(self.id)
+            component = hashtable.pop(self.id)
+            try:
+                hashtable[id] = component
+            except IdenticalIDError:
+                hashtable[self.id] = component
+                raise
         self._id = id
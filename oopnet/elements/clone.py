@@ -0,0 +1,141 @@
+from __future__ import annotations
+from copy import copy, deepcopy
+from dataclasses import fields, is_dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from oopnet.elements.column_store import ComponentColumns
+from oopnet.elements.component_registry import (
+    ComponentRegistry,
+    SuperComponentRegistry,
+)
+
+if TYPE_CHECKING:
+    from oopnet.elements.network import Network
+    from oopnet.elements.base import NetworkComponent
+
+# types that can be shared between a Network and its clone
+_IMMUTABLE = frozenset(
+    {str, int, float, bool, type(None), np.float64, datetime, timedelta}
+)
+
+# attributes containing static data (coordinates, curve and pattern values) that can be shared between clones
+_STATIC = frozenset({"vertices", "xvalues", "yvalues", "multipliers"})
+
+# Network attributes that are rebuilt by the clone function or that contain caches
+_REBUILT = frozenset(
+    {"_nodes", "_links", "_curves", "_patterns", "_rules", "_adjacency_", "_graphs_", "_version_", "_getters_"}
+)
+
+
+def _copy_value(value, memo: dict):
+    """Copies an attribute value like :func:`copy.deepcopy`, but takes shortcuts for common types.
+
+    Lists are copied item by item and dataclass objects without mutable attributes (e.g., Vertices) are copied
+    shallowly. All other values are deep copied. Objects in the memo (components and the Network) are replaced by their
+    copies.
+
+    """
+    cls = type(value)
+    if cls in _IMMUTABLE:
+        return value
+    if cls is list:
+        return [_copy_value(item, memo) for item in value]
+    try:
+        return memo[id(value)]
+    except KeyError:
+        pass
+    if is_dataclass(value) and all(type(item) in _IMMUTABLE for item in value.__dict__.values()):
+        new = cls.__new__(cls)
+        new.__dict__.update(value.__dict__)
+        memo[id(value)] = new
+        return new
+    return deepcopy(value, memo)
+
+
+def _copy_component(component: NetworkComponent, memo: dict) -> NetworkComponent:
+    """Creates a shallow copy of a component and registers it in the memo."""
+    cls = type(component)
+    new = cls.__new__(cls)
+    new.__dict__.update(component.__dict__)
+    memo[id(component)] = new
+    return new
+
+
+def _copy_columns(columns: ComponentColumns, components: list[NetworkComponent]) -> ComponentColumns:
+    """Copies a column store for the copies of its components."""
+    new = copy(columns)
+    new.arrays = {name: array.copy() for name, array in columns.arrays.items()}
+    new._objects = columns._objects.copy()
+    new.components = components
+    for component in components:
+        component.__dict__["_columns_"] = new
+    return new
+
+
+def _copy_registry(
+    registry: ComponentRegistry, memo: dict, super_registry: SuperComponentRegistry = None
+) -> ComponentRegistry:
+    """Copies a ComponentRegistry and shallow copies its components."""
+    new = ComponentRegistry(super_registry)
+    dict.update(new, {key: _copy_component(component, memo) for key, component in registry.items()})
+    if registry.columns is not None:
+        new.columns = _copy_columns(registry.columns, list(new.values()))
+    return new
+
+
+def _copy_super_registry(registry: SuperComponentRegistry, memo: dict) -> SuperComponentRegistry:
+    """Copies a SuperComponentRegistry together with its ComponentRegistries and their components."""
+    new = SuperComponentRegistry([])
+    for key, component_registry in registry.items():
+        new_registry = _copy_registry(component_registry, memo, new)
+        dict.__setitem__(new, key, new_registry)
+        new._index.update((id, (new_registry, component)) for id, component in new_registry.items())
+    return new
+
+
+def clone_network(network: Network, share_static: bool = False) -> Network:
+    """Creates an independent copy of a Network.
+
+    Unlike :func:`copy.deepcopy`, the Network's registries are rebuilt directly. Every component is copied exactly
+    once, and references to other components (e.g., a Link's start and end Nodes, Patterns or Curves) and to the
+    Network are redirected to the copies. Values that can't be changed in place (numbers, strings, ...) are shared.
+    Caches like NetworkX graphs or memoised getter results aren't copied.
+
+    Args:
+        network: OOPNET network object
+        share_static: If True, the Links' vertices, the Curves' x and y values and the Patterns' multipliers aren't
+            copied but shared with the original Network. This is safe as long as these lists are replaced instead of
+            being changed in place.
+
+    Returns:
+        copy of the Network
+
+    """
+    new = copy(network)
+    memo = {id(network): new}
+    new._nodes = _copy_super_registry(network._nodes, memo)
+    new._links = _copy_super_registry(network._links, memo)
+    new._curves = _copy_registry(network._curves, memo)
+    new._patterns = _copy_registry(network._patterns, memo)
+    new._rules = _copy_registry(network._rules, memo)
+    new._adjacency_ = None
+    new._graphs_ = {}
+    new._version_ = 0
+    new._getters_ = {}
+
+    # redirect references to the copied components and copy mutable attribute values
+    components = [component for component in memo.values() if component is not new]
+    for component in components:
+        attributes = component.__dict__
+        for name, value in attributes.items():
+            if type(value) in _IMMUTABLE or name == "_columns_" or share_static and name in _STATIC:
+                continue
+            attributes[name] = _copy_value(value, memo)
+
+    for field in fields(network):
+        if field.name not in _REBUILT:
+            setattr(new, field.name, _copy_value(getattr(network, field.name), memo))
+    return new
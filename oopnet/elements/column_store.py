@@ -0,0 +1,416 @@
+from __future__ import annotations
+import numbers
+from typing import Any, Iterable, Optional, TYPE_CHECKING
+
+import numpy as np
+
+from oopnet.elements.base import component_type, _register_variant, _restore_class, _tracked_class, _variant_namespace
+
+if TYPE_CHECKING:
+    from oopnet.elements.network import Network
+    from oopnet.elements.base import NetworkComponent
+    from oopnet.elements.component_registry import ComponentRegistry
+
+COLUMNS = {
+    "junctions": ("xcoordinate", "ycoordinate", "elevation", "emittercoefficient", "demand"),
+    "tanks": (
+        "xcoordinate",
+        "ycoordinate",
+        "elevation",
+        "initlevel",
+        "minlevel",
+        "maxlevel",
+        "diameter",
+        "minvolume",
+    ),
+    "reservoirs": ("xcoordinate", "ycoordinate", "elevation", "head"),
+    "pipes": ("length", "diameter", "roughness", "minorloss"),
+    "valves": ("diameter", "minorloss"),
+}
+
+
+def _is_scalar(value: Any) -> bool:
+    """Checks if a value can be stored in a column.
+
+    Real numbers (e.g., integers or numpy floats) are stored as floats, booleans and other values are kept in the
+    component.
+
+    """
+    return isinstance(value, numbers.Real) and not isinstance(value, (bool, np.bool_))
+
+
+def column_property(name: str) -> property:
+    """Creates a property for a numerical component attribute stored in a column store.
+
+    Scalar values are stored in the store's arrays, while other values (e.g., lists of demands) are still stored in the
+    component's __dict__, which the property shadows. The properties are added to subclasses that extend the subclass
+    used for components in a Network, whose __setattr__ method increments the Network's version.
+
+    Args:
+        name: name of the attribute
+
+    Returns:
+        property storing the attribute's value in a column store
+
+    """
+
+    def getter(self):
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            return self._columns_.arrays[name].item(self._row_)
+
+    def setter(self, value):
+        columns = self.__dict__.get("_columns_")
+        if columns is None:
+            self.__dict__[name] = value
+        else:
+            columns.set_value(self, name, value)
+
+    return property(getter, setter)
+
+
+# classes of components in a column store
+_COLUMNAR_CLASSES: dict[tuple[type, tuple[str, ...]], type] = {}
+
+
+def _columnar_reduce_ex(self, protocol: int):
+    """Pickles components in a column store by their original class and the stored attribute names."""
+    return _new_columnar, (component_type(self), type(self)._column_names_), self.__dict__
+
+
+def _columnar_class(cls: type, names: tuple[str, ...]) -> type:
+    """Returns a subclass of a component class that stores the passed attributes in a column store.
+
+    The properties are only added to components in a column store (by changing their class), so that components
+    without a column store keep using plain dataclass fields. The subclasses are created once per class and extend the
+    subclass used for components in a Network.
+
+    Args:
+        cls: component class
+        names: names of the attributes stored in the column store
+
+    Returns:
+        component class with column properties
+
+    """
+    try:
+        return _COLUMNAR_CLASSES[cls, names]
+    except KeyError:
+        pass
+    namespace = _variant_namespace(cls)
+    namespace.update({name: column_property(name) for name in names})
+    namespace.update(
+        __reduce_ex__=_columnar_reduce_ex,
+        _column_names_=names,
+        _data_descriptors_=_tracked_class(cls)._data_descriptors_ | frozenset(names),
+    )
+    columnar = type(cls.__name__, (_tracked_class(cls),), namespace)
+    _COLUMNAR_CLASSES[cls, names] = columnar
+    _register_variant(columnar, cls)
+    return columnar
+
+
+def _new_columnar(cls: type, names: tuple[str, ...]) -> NetworkComponent:
+    """Creates an empty component in a column store while unpickling or copying."""
+    return object.__new__(_columnar_class(cls, names))
+
+
+def _release(component: NetworkComponent):
+    """Moves the stored attribute values of a component back to the component, if it is a view of a column store.
+
+    This is necessary for copies of components that are views of another network's column store.
+
+    """
+    columns = component.__dict__.pop("_columns_", None)
+    if columns is not None:
+        row = component.__dict__.pop("_row_")
+        for name, array in columns.arrays.items():
+            component.__dict__.setdefault(name, array.item(row))
+        _restore_class(component)
+
+
+class ComponentColumns:
+    """Struct-of-arrays storage for the numerical attributes of the components in a ComponentRegistry.
+
+    Every attribute is stored in a contiguous numpy array with one row per component in the order of the registry. The
+    components become views of their rows: their class is replaced by a subclass with properties for the stored
+    attributes, so that reading or writing one of them reads or writes the respective array element. Values that are
+    not scalars (e.g., a list of demands) are kept in the component, their array elements are NaN. Components removed
+    from the store get their original class back.
+
+    Attributes:
+        names: names of the stored attributes
+        arrays: dictionary with attribute names as keys and arrays as values. Only the first len(self) rows are in use.
+        components: stored components in the order of their rows
+
+    """
+
+    def __init__(self, names: Iterable[str], components: Iterable[NetworkComponent] = ()):
+        """ComponentColumns init method.
+
+        Args:
+            names: names of the attributes to be stored
+            components: components to be added to the store
+
+        """
+        self.names = tuple(names)
+        self.components: list[NetworkComponent] = []
+        self.arrays = {name: np.empty(0) for name in self.names}
+        self._objects = {name: 0 for name in self.names}
+        self.extend(components)
+
+    def __len__(self) -> int:
+        return len(self.components)
+
+    def _reserve(self, size: int):
+        """Makes sure the arrays have room for at least size rows."""
+        capacity = len(next(iter(self.arrays.values()), ()))
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity, 16)
+        for name, array in self.arrays.items():
+            new = np.empty(capacity)
+            new[: len(self)] = array[: len(self)]
+            self.arrays[name] = new
+
+    def extend(self, components: Iterable[NetworkComponent]):
+        """Adds components to the store.
+
+        The components' current attribute values are moved to the arrays and the components' classes are replaced by
+        subclasses with properties for the stored attributes.
+
+        Args:
+            components: components to be added
+
+        """
+        components = list(components)
+        for component in components:
+            _release(component)
+        start = len(self)
+        self._reserve(start + len(components))
+        for name, array in self.arrays.items():
+            values = [component.__dict__.pop(name) for component in components]
+            if all(type(value) is float for value in values):
+                array[start : start + len(values)] = values
+            else:
+                for row, (component, value) in enumerate(zip(components, values), start):
+                    if _is_scalar(value):
+                        array[row] = value
+                    else:
+                        array[row] = np.nan
+                        component.__dict__[name] = value
+                        self._objects[name] += 1
+        for row, component in enumerate(components, start):
+            component.__dict__["_columns_"] = self
+            component.__dict__["_row_"] = row
+            component.__class__ = _columnar_class(component_type(component), self.names)
+        self.components.extend(components)
+
+    def append(self, component: NetworkComponent):
+        """Adds a component to the store.
+
+        Args:
+            component: component to be added
+
+        """
+        self.extend([component])
+
+    def remove(self, component: NetworkComponent):
+        """Removes a component from the store.
+
+        The component's attribute values are moved back to the component and the rows of the following components are
+        shifted up.
+
+        Args:
+            component: component to be removed
+
+        """
+        row = component._row_
+        self._detach(component)
+        n = len(self)
+        for array in self.arrays.values():
+            array[row : n - 1] = array[row + 1 : n]
+        del self.components[row]
+        for following in self.components[row:]:
+            following._row_ -= 1
+
+    def clear(self):
+        """Removes all components from the store and moves their attribute values back to the components."""
+        for component in self.components:
+            self._detach(component)
+        self.components = []
+        self._objects = {name: 0 for name in self.names}
+
+    def _detach(self, component: NetworkComponent):
+        """Moves a component's attribute values from the arrays back to the component and restores its class."""
+        for name, array in self.arrays.items():
+            if name in component.__dict__:
+                self._objects[name] -= 1
+            else:
+                component.__dict__[name] = array.item(component._row_)
+        del component.__dict__["_columns_"]
+        del component.__dict__["_row_"]
+        _restore_class(component)
+
+    def set_value(self, component: NetworkComponent, name: str, value: Any):
+        """Sets the value of a stored attribute of a component.
+
+        Args:
+            component: component in the store
+            name: attribute name
+            value: new value
+
+        """
+        stored_object = name in component.__dict__
+        if _is_scalar(value):
+            self.arrays[name][component._row_] = value
+            if stored_object:
+                del component.__dict__[name]
+                self._objects[name] -= 1
+        else:
+            self.arrays[name][component._row_] = np.nan
+            component.__dict__[name] = value
+            if not stored_object:
+                self._objects[name] += 1
+
+    def is_numeric(self, name: str) -> bool:
+        """Checks if all values of an attribute are stored in its array.
+
+        Args:
+            name: attribute name
+
+        Returns:
+            False if at least one component stores a value that isn't a scalar (e.g., a list of demands), True otherwise.
+
+        """
+        return self._objects[name] == 0
+
+    def array(self, name: str) -> np.ndarray:
+        """Gets the values of an attribute as an array without copying them.
+
+        The array is a read-only view of the store. Its values change when the attribute of one of the components
+        changes. After components have been added or removed, it might not reflect the store anymore.
+
+        Args:
+            name: attribute name
+
+        Returns:
+            array with one value for every component in the order of the ComponentRegistry
+
+        """
+        view = self.arrays[name][: len(self)]
+        view.flags.writeable = False
+        return view
+
+    def assign(self, name: str, values, rows: Optional[np.ndarray] = None):
+        """Assigns values to an attribute of all or several components in a single vectorised operation.
+
+        Args:
+            name: attribute name
+            values: scalar or array with the new values
+            rows: rows of the components to be changed or None, to change all components
+
+        """
+        array = self.arrays[name][: len(self)]
+        if not self.is_numeric(name):
+            if rows is None:
+                targets = self.components
+            else:
+                targets = [self.components[row] for row in np.arange(len(self))[rows]]
+            for component in targets:
+                if name in component.__dict__:
+                    del component.__dict__[name]
+                    self._objects[name] -= 1
+        if rows is None:
+            array[:] = values
+        else:
+            array[rows] = values
+        network = self.components[0]._network_ if self.components else None
+        if network is not None:
+            network._version_ += 1
+
+
+def stored_values(registries: Iterable[ComponentRegistry], name: str) -> Optional[np.ndarray]:
+    """Gets the values of an attribute from the column stores of one or several ComponentRegistries.
+
+    Args:
+        registries: ComponentRegistries in the order their values should be returned
+        name: attribute name
+
+    Returns:
+        A read-only view of the store's array if a single ComponentRegistry is passed, an array with the concatenated
+        values of several ComponentRegistries or None, if a ComponentRegistry doesn't have a column store or if one of
+        its components stores a value that isn't a scalar.
+
+    """
+    arrays = []
+    for registry in registries:
+        columns = getattr(registry, "columns", None)
+        if columns is None or name not in columns.names or not columns.is_numeric(name):
+            return None
+        arrays.append(columns.array(name))
+    return arrays[0] if len(arrays) == 1 else np.concatenate(arrays)
+
+
+def attribute_values(registries: Iterable[ComponentRegistry], name: str) -> np.ndarray:
+    """Gets the values of an attribute of all components in one or several ComponentRegistries as an array.
+
+    If the ComponentRegistries have column stores, the values are taken from the stores (see :func:`stored_values`).
+    Otherwise, they are collected from the components.
+
+    Args:
+        registries: ComponentRegistries in the order their values should be returned
+        name: attribute name
+
+    Returns:
+        array with the attribute values
+
+    """
+    registries = list(registries)
+    values = stored_values(registries, name)
+    if values is None:
+        values = np.asarray(
+            [getattr(component, name) for registry in registries for component in registry.values()]
+        )
+    return values
+
+
+def enable_column_store(network: Network):
+    """Stores the numerical attributes of a network's Nodes and Links in contiguous numpy arrays.
+
+    Afterwards, the network's components are views of the rows of these arrays. Getters like
+    :func:`~oopnet.utils.getters.v_length` or :func:`~oopnet.utils.getters.get_length` return the arrays without
+    building them from the components first. Networks without a column store don't pay for any of this, their
+    components' attributes are plain dataclass fields.
+
+    The following attributes are stored:
+
+    - Junctions: xcoordinate, ycoordinate, elevation, emittercoefficient, demand
+    - Tanks: xcoordinate, ycoordinate, elevation, initlevel, minlevel, maxlevel, diameter, minvolume
+    - Reservoirs: xcoordinate, ycoordinate, elevation, head
+    - Pipes: length, diameter, roughness, minorloss
+    - Valves: diameter, minorloss
+
+    Args:
+      network: OOPNET network object
+
+    """
+    for registry in (network._nodes, network._links):
+        for key, names in COLUMNS.items():
+            if key in registry and registry[key].columns is None:
+                registry[key].columns = ComponentColumns(names, registry[key].values())
+
+
+def disable_column_store(network: Network):
+    """Moves the attributes stored by :func:`enable_column_store` back to the network's components.
+
+    Args:
+      network: OOPNET network object
+
+    """
+    for registry in (network._nodes, network._links):
+        for component_registry in registry.values():
+            if component_registry.columns is not None:
+                component_registry.columns.clear()
+                component_registry.columns = None
@@ -1,32 +1,62 @@
 from __future__ import annotations
-from typing import Optional, TYPE_CHECKING
+from typing import Iterable, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from oopnet.elements.base import NetworkComponent
+    from oopnet.elements.column_store import ComponentColumns
+
+_MISSING = object()
 
 
 class ComponentRegistry(dict):
     """Class for storing NetworkComponents in a Network object or a SuperComponentRegistry.
 
     Based on built-in dict but prevents overwriting an existing key and raises a ComponentNotExistingError error,
-    when trying to look up a not exiting Component (instead of default KeyErrors).
+    when trying to look up a not exiting Component (instead of default KeyErrors). If the registry is part of a
+    SuperComponentRegistry, all changes are reflected in the SuperComponentRegistry's ID index.
+
+    Attributes:
+        super_registry: SuperComponentRegistry the registry is part of or None
+        columns: column store of the registry's components or None (see
+            :func:`~oopnet.elements.column_store.enable_column_store`)
 
     """
 
     def __init__(self, super_registry: Optional[SuperComponentRegistry] = None):
         super().__init__()
         self.super_registry = super_registry
+        self.columns: Optional[ComponentColumns] = None
+
+    @property
+    def _super_registry(self) -> Optional[SuperComponentRegistry]:
+        """SuperComponentRegistry the registry is part of or None.
+
+        While unpickling, items are added before the super_registry attribute is restored. The SuperComponentRegistry
+        rebuilds its index afterwards.
+
+        """
+        return getattr(self, "super_registry", None)
+
+    @property
+    def _columns(self) -> Optional[ComponentColumns]:
+        """Column store of the registry or None.
+
+        While unpickling, items are added before the column store is restored. While deep copying, the column store is
+        restored first. In both cases, the store already contains the items.
+
+        """
+        return getattr(self, "columns", None)
 
     def __setitem__(self, key: str, value: NetworkComponent):
-        if (
-            key in self
-            or hasattr(self, "super_registry")
-            and self.super_registry is not None
-            and self.super_registry.check_id_exists(key)
-        ):
+        super_registry = self._super_registry
+        if key in self or super_registry is not None and key in super_registry._index:
             raise IdenticalIDError(key)
-        else:
-            super().__setitem__(key, value)
+        super().__setitem__(key, value)
+        if super_registry is not None:
+            super_registry._register(key, self, value)
+        columns = self._columns
+        if columns is not None and len(columns) < len(self):
+            columns.append(value)
 
     def __getitem__(self, item) -> NetworkComponent:
         if item not in self:
@@ -34,11 +64,59 @@ class ComponentRegistry(dict):
         else:
             return super().__getitem__(item)
 
+    def __delitem__(self, key: str):
+        self.pop(key)
+
+    def pop(self, key: str, default=_MISSING) -> NetworkComponent:
+        if key not in self:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        value = super().pop(key)
+        if self._super_registry is not None:
+            self._super_registry._unregister(key)
+        if self._columns is not None:
+            self.columns.remove(value)
+        return value
+
+    def popitem(self) -> tuple[str, NetworkComponent]:
+        key, value = super().popitem()
+        if self._super_registry is not None:
+            self._super_registry._unregister(key)
+        if self._columns is not None:
+            self.columns.remove(value)
+        return key, value
+
+    def clear(self):
+        if self._super_registry is not None:
+            for key in self:
+                self._super_registry._unregister(key)
+        if self._columns is not None:
+            self.columns.clear()
+        super().clear()
+
+    def setdefault(self, key: str, default: NetworkComponent = None) -> NetworkComponent:
+        if key not in self:
+            self[key] = default
+        return super().__getitem__(key)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
 
 class SuperComponentRegistry(dict):
     """Registry for Link and Node components.
 
-    Components are stored in ComponentRegistries for the individual subclasses (junctions, pipes, tanks, ...).
+    Components are stored in ComponentRegistries for the individual subclasses (junctions, pipes, tanks, ...). An index
+    mapping the IDs of all components to their ComponentRegistry and the component itself is kept up to date by the
+    ComponentRegistries, so that looking up a component or checking if an ID exists doesn't have to search every
+    ComponentRegistry.
+
+    Attributes:
+        version: counter that is incremented whenever a component is added, removed or renamed. For Links, it is
+            incremented as well, when a Link's start or end node changes. Caches derived from the network's topology
+            can compare it to the version they were created with to detect changes.
 
     """
 
@@ -50,9 +128,34 @@ class SuperComponentRegistry(dict):
 
         """
         super().__init__()
+        self._index: dict[str, tuple[ComponentRegistry, NetworkComponent]] = {}
+        self.version = 0
         for cls in classes:
             self[cls] = ComponentRegistry(super_registry=self)
 
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_index"]
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._index = {
+            id: (registry, component)
+            for registry in self.values()
+            for id, component in registry.items()
+        }
+
+    def _register(self, id: str, registry: ComponentRegistry, component: NetworkComponent):
+        """Adds a component to the index."""
+        self._index[id] = (registry, component)
+        self.version += 1
+
+    def _unregister(self, id: str):
+        """Removes a component from the index."""
+        del self._index[id]
+        self.version += 1
+
     def check_id_exists(self, id) -> bool:
         """Checks if a component with the specified ID already exists in one of the ComponentRegistries.
 
@@ -63,7 +166,7 @@ class SuperComponentRegistry(dict):
             True, if the ID exists, False otherwise.
 
         """
-        return any(id in x for x in self.values())
+        return id in self._index
 
     def get_by_id(self, id: str) -> NetworkComponent:
         """Returns a component with a specified ID from the ComponentRegistries.
@@ -78,11 +181,43 @@ class SuperComponentRegistry(dict):
             Requested NetworkComponent
 
         """
-        self.check_id_exists(id=id)
-        for registry in self.values():
-            if id in registry:
-                return registry[id]
-        raise ComponentNotExistingError(id=id)
+        try:
+            return self._index[id][1]
+        except KeyError:
+            raise ComponentNotExistingError(id=id) from None
+
+    def add_many(self, components: dict[str, Iterable[NetworkComponent]]):
+        """Adds components to several ComponentRegistries at once.
+
+        All IDs are checked for uniqueness at once before any of the components is added.
+
+        Args:
+            components: dictionary with ComponentRegistry keys (e.g., "junctions") as keys and the components to be added
+                to the respective ComponentRegistry as values
+
+        Raises:
+            IdenticalIDError if an ID is used more than once or already exists in one of the ComponentRegistries
+
+        """
+        components = {key: list(group) for key, group in components.items()}
+        new = {}
+        for group in components.values():
+            for component in group:
+                if component.id in new:
+                    raise IdenticalIDError(component.id)
+                new[component.id] = component
+        conflicts = new.keys() & self._index.keys()
+        if conflicts:
+            raise IdenticalIDError(next(iter(conflicts)))
+        for key, group in components.items():
+            registry = self[key]
+            dict.update(registry, {component.id: component for component in group})
+            self._index.update(
+                (component.id, (registry, component)) for component in group
+            )
+            if registry.columns is not None:
+                registry.columns.extend(group)
+        self.version += 1
 
 
 class NodeRegistry:
@@ -112,6 +247,11 @@ class ComponentNotExistingError(Exception):
     """Raised when a no component with the ID exists in the network."""
 
     def __init__(self, id, message=None):
+        self.id = id
         if not message:
             self.message = f"No Component with ID {id} found in the network."
         super().__init__(self.message)
+
+    def __reduce__(self):
+        # required for sending errors from worker processes
+        return type(self), (self.id,)
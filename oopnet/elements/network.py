@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Optional, TYPE_CHECKING, Union
+from typing import Optional, TYPE_CHECKING, Type, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -8,6 +8,7 @@ if TYPE_CHECKING:
     from matplotlib.pyplot import Figure as PyPlotFigure
     from matplotlib.pyplot import Axes
     from matplotlib.animation import FuncAnimation
+    import asyncio
     import pandas as pd
 
 from oopnet.writer.write import write
@@ -15,7 +16,9 @@ from oopnet.reader.read import read
 from oopnet.plotter.pyplot import NetworkPlotter
 from oopnet.plotter.bokehplot import Plotsimulation as BokehPlot
 from oopnet.simulator.epanet2 import ModelSimulator
+from oopnet.simulator.reportfile_reader import ReportFileReader
 from oopnet.elements.water_quality import Reaction
+from oopnet.elements.clone import clone_network
 from oopnet.elements.options_and_reporting import (
     Options,
     Times,
@@ -34,6 +37,11 @@ if TYPE_CHECKING:
     from oopnet.elements.system_operation import Energy, Control, Rule, Curve, Pattern
     from oopnet.elements.network_map_tags import Vertex, Label, Backdrop
     from oopnet.report.report import SimulationReport
+    from oopnet.simulator.binaryfile_reader import (
+        BinaryFileReader,
+        LazyBinaryFileReader,
+    )
+    from oopnet.simulator.cache import ResultCache
 
 
 @dataclass
@@ -61,6 +69,11 @@ class Network:
       _links: SuperComponentRegistry for all Link objects in the network
       _curves: ComponentRegistry of for Curve objects belonging to the network
       _patterns: ComponentRegistry of for Pattern objects belonging to the network
+      _adjacency_: cached Node-Link adjacency index used by the topology getters together with the Node and Link
+        registry versions it was created with
+      _graphs_: NetworkX graphs cached by :func:`oopnet.graph.get_cached_graph`
+      _version_: counter that is incremented whenever an attribute of one of the Network's components changes
+      _getters_: results of memoised getter functions together with the versions they were created with
 
     """
 
@@ -82,9 +95,15 @@ class Network:
     _curves: ComponentRegistry = field(default_factory=ComponentRegistry)
     _patterns: ComponentRegistry = field(default_factory=ComponentRegistry)
     _rules: ComponentRegistry = field(default_factory=ComponentRegistry)
+    _adjacency_: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _graphs_: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _version_: int = field(default=0, init=False, repr=False, compare=False)
+    _getters_: dict = field(default_factory=dict, init=False, repr=False, compare=False)
 
     @classmethod
-    def read(cls, filename=Optional[str], content=Optional[str]):
+    def read(cls, filename: Optional[str] = None, content: Optional[str] = None):
         """Reads an EPANET input file.
 
         Args:
@@ -106,6 +125,29 @@ class Network:
         """
         return write(self, filename)
 
+    def clone(self, share_static: bool = False) -> Network:
+        """Creates an independent copy of the Network.
+
+        This is considerably faster than :func:`copy.deepcopy`, since the registries are rebuilt directly and every
+        component is copied exactly once.
+
+        Args:
+          share_static: If True, the Links' vertices, the Curves' x and y values and the Patterns' multipliers are
+            shared with the original Network instead of being copied. Replace these lists instead of changing them in
+            place afterwards.
+
+        Returns:
+          copy of the Network
+
+        Examples:
+          The following will create a copy of a Network and change the demands of the copy only:
+          >>> new_network = network.clone()
+          >>> for j in get_junctions(new_network):
+          ...     j.demand *= 1.1
+
+        """
+        return clone_network(self, share_static=share_static)
+
     def run(
         self,
         filename: Optional[str] = None,
@@ -113,6 +155,14 @@ class Network:
         path: Optional[str] = None,
         startdatetime: Optional[datetime] = None,
         output: bool = False,
+        reader: Union[
+            Type[BinaryFileReader], Type[LazyBinaryFileReader], Type[ReportFileReader]
+        ] = ReportFileReader,
+        scratch: bool = False,
+        cache: Optional[ResultCache] = None,
+        nodes: Optional[list[str]] = None,
+        links: Optional[list[str]] = None,
+        variables: Optional[list[str]] = None,
     ) -> SimulationReport:
         """Runs an EPANET simulation by calling command line EPANET
 
@@ -121,6 +171,12 @@ class Network:
           delete: if delete is True the EPANET Input and SimulationReport file is deleted, if False then the simulation results won't be deleted and are stored in a folder named path
           path: Path were to perform the simulations. If path is a Python None object then a tmp-folder is generated
           output: If True, stdout and strerr will be printed to console and logged.
+          reader: Reader used for parsing the simulation results. Use BinaryFileReader to read the results from EPANET's binary output file instead of the report file. This is faster for large models and returns results with full precision. LazyBinaryFileReader only loads results from the binary output file when they are accessed, which keeps memory usage low for long extended period simulations.
+          scratch: If True, the simulation files are placed in a persistent per-process scratch directory on a RAM-backed file system (e.g., /dev/shm) and reused by subsequent simulations, and the EPANET input file is generated in memory. path and filename are ignored in this case. This speeds up frequently repeated simulations.
+          cache: Optional ResultCache. Results of identical input files are then returned from the cache instead of running EPANET again.
+          nodes: IDs of the Nodes whose results are required. If None, the network's report settings are used.
+          links: IDs of the Links whose results are required. If None, the network's report settings are used.
+          variables: Names of the required result variables (e.g., "pressure" or "flow"). If None, the network's report parameters are used. EPANET then only writes the requested results to the report file, which considerably reduces the time required for writing and parsing it for large models.
 
         Returns:
           OOPNET report object
@@ -133,9 +189,71 @@ class Network:
             path=path,
             startdatetime=startdatetime,
             output=output,
+            reader=reader,
+            scratch=scratch,
+            cache=cache,
+            nodes=nodes,
+            links=links,
+            variables=variables,
         )
         return sim.run()
 
+    async def run_async(
+        self,
+        filename: Optional[str] = None,
+        delete: bool = True,
+        path: Optional[str] = None,
+        startdatetime: Optional[datetime] = None,
+        output: bool = False,
+        reader: Union[
+            Type[BinaryFileReader], Type[LazyBinaryFileReader], Type[ReportFileReader]
+        ] = ReportFileReader,
+        scratch: bool = False,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        cache: Optional[ResultCache] = None,
+        nodes: Optional[list[str]] = None,
+        links: Optional[list[str]] = None,
+        variables: Optional[list[str]] = None,
+    ) -> SimulationReport:
+        """Runs an EPANET simulation without blocking the event loop.
+
+        The EPANET input file is written as soon as the coroutine starts, EPANET runs as an asyncio subprocess and the
+        simulation results are parsed in the event loop's default executor. This allows for running many simulations
+        concurrently, e.g. with asyncio.gather.
+
+        Attributes:
+          filename: if thing is an OOPNET network, filename is an option to perform command line EPANET simulations with a specific filename. If filename is a Python None object then a file with a random UUID (universally unique identifier) is generated
+          delete: if delete is True the EPANET Input and SimulationReport file is deleted, if False then the simulation results won't be deleted and are stored in a folder named path
+          path: Path were to perform the simulations. If path is a Python None object then a tmp-folder is generated
+          output: If True, stdout and strerr will be printed to console and logged.
+          reader: Reader used for parsing the simulation results.
+          scratch: If True, the simulation files are placed in a persistent per-process scratch directory on a RAM-backed file system.
+          semaphore: Semaphore limiting the number of concurrently running EPANET processes. If None, a semaphore shared by all simulations in the running event loop is used, that allows for oopnet.simulator.epanet2.MAX_CONCURRENT_SIMULATIONS processes.
+          cache: Optional ResultCache. Results of identical input files are then returned from the cache instead of running EPANET again.
+          nodes: IDs of the Nodes whose results are required. If None, the network's report settings are used.
+          links: IDs of the Links whose results are required. If None, the network's report settings are used.
+          variables: Names of the required result variables (e.g., "pressure" or "flow"). If None, the network's report parameters are used. EPANET then only writes the requested results to the report file, which considerably reduces the time required for writing and parsing it for large models.
+
+        Returns:
+          OOPNET report object
+
+        """
+        sim = ModelSimulator(
+            thing=self,
+            filename=filename,
+            delete=delete,
+            path=path,
+            startdatetime=startdatetime,
+            output=output,
+            reader=reader,
+            scratch=scratch,
+            cache=cache,
+            nodes=nodes,
+            links=links,
+            variables=variables,
+        )
+        return await sim.run_async(semaphore=semaphore)
+
     def plot(
         self,
         fignum: Optional[int] = None,
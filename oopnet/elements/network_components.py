@@ -111,6 +111,37 @@ class Link(NetworkComponent):
         self.vertices = self.vertices[::-1]
 
 
+def _link_node_property(name: str) -> property:
+    """Creates a property for a Link's start or end node.
+
+    Changing the Node increments the version of the Network's Link registry, so that caches derived from the Network's
+    topology notice the change. The properties are added after the dataclass has been created to keep the fields'
+    default values.
+
+    Args:
+        name: name of the attribute ("startnode" or "endnode")
+
+    Returns:
+        property storing the Node in a private attribute
+
+    """
+    private = f"_{name}_"
+
+    def getter(self) -> Optional[Node]:
+        return self.__dict__[private]
+
+    def setter(self, node: Optional[Node]):
+        self.__dict__[private] = node
+        if self._network_ is not None:
+            self._network_._links.version += 1
+
+    return property(getter, setter)
+
+
+Link.startnode = _link_node_property("startnode")
+Link.endnode = _link_node_property("endnode")
+
+
 @dataclass
 class Junction(Node):
     """Junction node.
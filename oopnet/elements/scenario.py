@@ -0,0 +1,215 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, TypeVar
+
+from oopnet.writer.write import write
+
+if TYPE_CHECKING:
+    from oopnet.elements.network import Network
+    from oopnet.elements.base import NetworkComponent
+    from oopnet.elements.component_registry import SuperComponentRegistry
+    from oopnet.report.report import SimulationReport
+
+Result = TypeVar("Result")
+
+
+class Scenario:
+    """Variant of a base Network that only stores the attributes changed by the variant.
+
+    A Scenario is a lightweight overlay: the base Network isn't copied, only the overridden attribute values of Nodes
+    and Links are recorded. Thousands of Scenarios sharing a base Network therefore need hardly more memory than the
+    base Network itself.
+
+    To use the Scenario, the overrides are temporarily applied to the base Network, e.g. for writing an EPANET input
+    file, running a simulation or calling getter functions. Afterwards, the base Network's original values are restored.
+    All attributes that aren't overridden are taken from the base Network, including later changes to the base Network.
+
+    Warning:
+        While the overrides are applied, the base Network must not be used for anything else (e.g., by other threads or
+        other Scenarios).
+
+    Attributes:
+        base: base Network
+        name: optional name of the Scenario
+        nodes: dictionary with Node IDs as keys and dictionaries of overridden attribute names and values as values
+        links: dictionary with Link IDs as keys and dictionaries of overridden attribute names and values as values
+
+    Examples:
+        The following will create a Scenario with a closed Pipe and an increased demand and simulate it:
+        >>> scenario = Scenario(network)
+        >>> scenario.set_link('P-1', status='CLOSED')
+        >>> scenario.set_node('J-1', demand=10.0)
+        >>> rpt = scenario.run()
+
+    """
+
+    __slots__ = ("base", "name", "nodes", "links")
+
+    def __init__(self, base: Network, name: Optional[str] = None):
+        """Scenario init method.
+
+        Args:
+            base: base Network
+            name: optional name of the Scenario
+
+        """
+        self.base = base
+        self.name = name
+        self.nodes: dict[str, dict[str, Any]] = {}
+        self.links: dict[str, dict[str, Any]] = {}
+
+    def __repr__(self) -> str:
+        n_overrides = sum(len(attributes) for attributes in self.nodes.values()) + sum(
+            len(attributes) for attributes in self.links.values()
+        )
+        return f"Scenario(name={self.name!r}, overrides={n_overrides})"
+
+    @staticmethod
+    def _set(
+        registry: SuperComponentRegistry,
+        overrides: dict[str, dict[str, Any]],
+        id: str,
+        attributes: dict[str, Any],
+    ):
+        """Validates and records overrides for a component."""
+        component = registry.get_by_id(id)
+        for attribute in attributes:
+            if attribute.startswith("_") or not hasattr(component, attribute):
+                raise AttributeError(
+                    f"{type(component).__name__} {id!r} has no attribute {attribute!r}"
+                )
+        overrides.setdefault(id, {}).update(attributes)
+
+    def set_node(self, id: str, **attributes: Any):
+        """Overrides attributes of a Node of the base Network.
+
+        Args:
+            id: Node ID
+            **attributes: attribute names and the Scenario's values
+
+        Raises:
+            ComponentNotExistingError if the Node doesn't exist. AttributeError if the Node doesn't have one of the
+            attributes.
+
+        """
+        self._set(self.base._nodes, self.nodes, id, attributes)
+
+    def set_link(self, id: str, **attributes: Any):
+        """Overrides attributes of a Link of the base Network.
+
+        Args:
+            id: Link ID
+            **attributes: attribute names and the Scenario's values
+
+        Raises:
+            ComponentNotExistingError if the Link doesn't exist. AttributeError if the Link doesn't have one of the
+            attributes.
+
+        """
+        self._set(self.base._links, self.links, id, attributes)
+
+    def reset(self):
+        """Removes all overrides."""
+        self.nodes.clear()
+        self.links.clear()
+
+    def to_modification(self) -> dict[str, dict[str, Any]]:
+        """Converts the Scenario's overrides to a modification that can be simulated with
+        :func:`~oopnet.simulator.batch.run_batch`.
+
+        Returns:
+            dictionary with attribute names as keys and dictionaries mapping Node and Link IDs to the Scenario's values
+            as values
+
+        """
+        modification = {}
+        for overrides in (self.nodes, self.links):
+            for id, attributes in overrides.items():
+                for attribute, value in attributes.items():
+                    modification.setdefault(attribute, {})[id] = value
+        return modification
+
+    def _components(self) -> Iterator[tuple[NetworkComponent, dict[str, Any]]]:
+        """Yields the base Network's overridden components together with their overrides."""
+        for registry, overrides in (
+            (self.base._nodes, self.nodes),
+            (self.base._links, self.links),
+        ):
+            for id, attributes in overrides.items():
+                yield registry.get_by_id(id), attributes
+
+    @contextmanager
+    def applied(self) -> Iterator[Network]:
+        """Context manager that applies the Scenario's overrides to the base Network and restores the original values.
+
+        Yields:
+            base Network with the Scenario's overrides applied
+
+        Examples:
+            >>> with scenario.applied() as network:
+            ...     demands = get_basedemand(network)
+
+        """
+        originals = []
+        try:
+            for component, attributes in self._components():
+                for attribute, value in attributes.items():
+                    originals.append((component, attribute, getattr(component, attribute)))
+                    setattr(component, attribute, value)
+            yield self.base
+        finally:
+            for component, attribute, value in reversed(originals):
+                setattr(component, attribute, value)
+
+    def get(self, getter: Callable[..., Result], *args, **kwargs) -> Result:
+        """Calls a getter function with the Scenario's overrides applied to the base Network.
+
+        Args:
+            getter: function taking a Network as first argument, e.g. :func:`~oopnet.utils.getters.get_basedemand`
+            *args: further positional arguments passed to the getter
+            **kwargs: keyword arguments passed to the getter
+
+        Returns:
+            the getter's result
+
+        """
+        with self.applied() as network:
+            return getter(network, *args, **kwargs)
+
+    def write(self, filename: str) -> int:
+        """Writes the Scenario to an EPANET input file.
+
+        Values that aren't overridden by the Scenario are taken from the base Network.
+
+        Args:
+          filename: desired filename/path were the user wants to store the file
+
+        Returns:
+          0 if successful
+
+        """
+        with self.applied() as network:
+            return write(network, filename)
+
+    def run(self, **kwargs) -> SimulationReport:
+        """Runs an EPANET simulation of the Scenario.
+
+        Args:
+            **kwargs: arguments passed to :meth:`oopnet.elements.network.Network.run`
+
+        Returns:
+          OOPNET report object
+
+        """
+        with self.applied() as network:
+            return network.run(**kwargs)
+
+    def materialise(self) -> Network:
+        """Creates an independent Network with the Scenario's overrides applied.
+
+        Returns:
+            copy of the base Network with the overrides applied
+
+        """
+        with self.applied() as network:
+            return network.clone()
@@ -8,3 +8,6 @@ from .graph import (
     edgeresult2pandas,
     nxedge2onlink_id,
 )
+from .cache import get_cached_graph, invalidate_graph_cache
+from .matrices import incidence_matrix, adjacency_matrix, laplacian_matrix
+from .csr import CSRGraph
@@ -0,0 +1,228 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Type, Union
+import logging
+
+import networkx as nx
+
+from oopnet.graph.graph import (
+    Graph,
+    DiGraph,
+    MultiGraph,
+    MultiDiGraph,
+    _link_weight,
+    _edge_nodes,
+    _store_edge_link_ids,
+)
+from oopnet.utils.getters import get_node_ids, get_links
+
+if TYPE_CHECKING:
+    from oopnet.elements import Network
+    from oopnet.elements.network_components import Link
+
+logger = logging.getLogger(__name__)
+
+_GRAPH_CLASSES = {
+    Graph: nx.Graph,
+    DiGraph: nx.DiGraph,
+    MultiGraph: nx.MultiGraph,
+    MultiDiGraph: nx.MultiDiGraph,
+}
+
+
+@dataclass
+class _CachedGraph:
+    """Cached NetworkX graph together with the state of the Network it represents.
+
+    Attributes:
+        graph: NetworkX graph
+        versions: Node and Link registry versions the graph is based on
+        edges: dictionary with Link IDs as keys and the edges representing the Links as values
+        weights: dictionary with Link IDs as keys and the Links' weights as values
+        edge_link_ids: dictionary with edges as keys and the IDs of the Links they represent as values
+
+    """
+
+    graph: nx.Graph
+    versions: tuple[int, int]
+    edges: dict[str, tuple] = field(default_factory=dict)
+    weights: dict[str, float] = field(default_factory=dict)
+    edge_link_ids: dict[tuple, str] = field(default_factory=dict)
+
+    def add_edge(self, link: Link, weight_value: float, switch_direction: bool):
+        """Adds an edge representing a Link to the graph."""
+        u, v = _edge_nodes(link, weight_value, switch_direction)
+        key = self.graph.add_edge(u, v, weight=weight_value, id=link.id)
+        edge = (u, v) if key is None else (u, v, key)
+        self.edges[link.id] = edge
+        self.weights[link.id] = weight_value
+        self.edge_link_ids[edge] = link.id
+        if not self.graph.is_directed():
+            self.edge_link_ids[(v, u, *edge[2:])] = link.id
+
+    def remove_edge(self, link_id: str):
+        """Removes the edge representing a Link from the graph."""
+        u, v, *key = edge = self.edges.pop(link_id)
+        self.graph.remove_edge(*edge)
+        del self.weights[link_id]
+        del self.edge_link_ids[edge]
+        if not self.graph.is_directed():
+            self.edge_link_ids.pop((v, u, *key), None)
+
+
+def _build(
+    network: Network,
+    graph_class: Type[nx.Graph],
+    weight: str,
+    default: float,
+    switch_direction: bool,
+) -> _CachedGraph:
+    """Creates a graph from scratch."""
+    logger.debug("Creating cached graph from Network")
+    cached = _CachedGraph(
+        graph=graph_class(),
+        versions=(network._nodes.version, network._links.version),
+    )
+    cached.graph.add_nodes_from(get_node_ids(network))
+    for link in get_links(network):
+        cached.add_edge(link, _link_weight(link, weight, default), switch_direction)
+    _store_edge_link_ids(cached.graph, cached.edge_link_ids)
+    return cached
+
+
+def _update(
+    cached: _CachedGraph,
+    network: Network,
+    weight: str,
+    default: float,
+    switch_direction: bool,
+) -> bool:
+    """Patches a cached graph to reflect the current state of the Network.
+
+    Args:
+        cached: cached graph
+        network: OOPNET network object
+        weight: name of the Link attribute used as weight
+        default: default weight for Links that don't have the weight attribute
+        switch_direction: If a Link's weight is <0 and switch_direction is True, the Links start and end nodes will be switched.
+
+    Returns:
+        False, if the graph cannot be patched and has to be rebuilt, True otherwise.
+
+    """
+    versions = (network._nodes.version, network._links.version)
+    multigraph = cached.graph.is_multigraph()
+    if versions[0] != cached.versions[0]:
+        return False
+    links = get_links(network)
+    changed_links = versions[1] != cached.versions[1]
+    if changed_links:
+        # simple graphs merge parallel Links, so removing an edge might remove another Link's edge as well
+        if not multigraph:
+            return False
+        link_ids = {link.id for link in links}
+        for link_id in [link_id for link_id in cached.edges if link_id not in link_ids]:
+            cached.remove_edge(link_id)
+
+    graph = cached.graph
+    for link in links:
+        weight_value = getattr(link, weight, default)
+        if changed_links and link.id in cached.edges:
+            nodes = _edge_nodes(link, weight_value, switch_direction)
+            previous_nodes = cached.edges[link.id][:2]
+            if graph.is_directed():
+                reconnected = nodes != previous_nodes
+            else:
+                reconnected = set(nodes) != set(previous_nodes)
+            if reconnected:
+                cached.remove_edge(link.id)
+        if link.id not in cached.edges:
+            cached.add_edge(link, weight_value, switch_direction)
+            continue
+        previous = cached.weights[link.id]
+        if weight_value == previous:
+            continue
+        if switch_direction and (weight_value < 0) != (previous < 0):
+            if not multigraph:
+                return False
+            cached.remove_edge(link.id)
+            cached.add_edge(link, weight_value, switch_direction)
+            continue
+        cached.weights[link.id] = weight_value
+        data = graph.edges[cached.edges[link.id]]
+        # in simple graphs, the edge belongs to the last of several parallel Links
+        if data["id"] == link.id:
+            data["weight"] = weight_value
+    if changed_links:
+        _store_edge_link_ids(graph, cached.edge_link_ids)
+    cached.versions = versions
+    return True
+
+
+def get_cached_graph(
+    network: Network,
+    graph_type: Union[
+        Type[Graph], Type[DiGraph], Type[MultiGraph], Type[MultiDiGraph]
+    ] = MultiGraph,
+    weight: str = "length",
+    default: float = 0.00001,
+    switch_direction: bool = True,
+) -> nx.Graph:
+    """Gets a NetworkX graph of a Network that is cached and kept up to date instead of being rebuilt.
+
+    For every graph type and weight setting, one graph is cached in the Network. When the graph is requested again, it is
+    updated to reflect changes of the Network since the last request: changed edge weights are patched, and for
+    MultiGraphs and MultiDiGraphs, edges of added, removed or reconnected Links are added or removed. Graph and DiGraph
+    objects are rebuilt if Links were added, removed or reconnected, since they merge parallel Links. All graphs are
+    rebuilt if Nodes were added, removed or renamed.
+
+    Warning:
+        The returned graph is shared between calls and must not be modified. Create a copy with its ``copy`` method, if
+        you need to modify the graph. Use :func:`invalidate_graph_cache` if the graph was modified by accident.
+
+    Note:
+        Unlike the graphs created by :class:`oopnet.graph.MultiGraph` and :class:`oopnet.graph.MultiDiGraph`, the edge
+        keys of a patched multigraph might not start at 0 for every pair of Nodes.
+
+    Args:
+      network: OOPNET network object
+      graph_type: graph factory (Graph, DiGraph, MultiGraph or MultiDiGraph) defining the type of the graph
+      weight: name of the Link property used as weight
+      default: The default value is used as weight for Links that don't have the defined weight attribute.
+      switch_direction: If a Link's weight is <0 and switch_direction is True, the Links start and end nodes will be switched.
+
+    Returns:
+        NetworkX graph of the passed type containing all nodes and links in the passed Network.
+
+    Examples:
+        The following will create a MultiGraph with link diameters as edge weights and update it after changing a pipe's
+        diameter:
+        >>> g = get_cached_graph(network, MultiGraph, 'diameter')
+        >>> get_pipe(network, 'P-01').diameter = 300.0
+        >>> g = get_cached_graph(network, MultiGraph, 'diameter')
+
+    """
+    if not isinstance(weight, str):
+        raise TypeError(
+            "Cached graphs only support Link attribute names as weight. Use the graph factories for other weights."
+        )
+    key = (graph_type, weight, default, switch_direction)
+    cached = network._graphs_.get(key)
+    if cached is None or not _update(cached, network, weight, default, switch_direction):
+        cached = _build(
+            network, _GRAPH_CLASSES[graph_type], weight, default, switch_direction
+        )
+        network._graphs_[key] = cached
+    return cached.graph
+
+
+def invalidate_graph_cache(network: Network):
+    """Removes all cached graphs of a Network.
+
+    The next call of :func:`get_cached_graph` will rebuild the requested graph.
+
+    Args:
+      network: OOPNET network object
+
+    """
+    network._graphs_.clear()
@@ -0,0 +1,281 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional, Union
+import logging
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse import csgraph
+
+from oopnet.elements.component_registry import ComponentNotExistingError
+from oopnet.graph.matrices import _link_node_indices, _link_weights
+from oopnet.utils.getters import get_node_ids, get_link_ids
+
+if TYPE_CHECKING:
+    from oopnet.elements import Network
+
+logger = logging.getLogger(__name__)
+
+
+def _csr_arrays(
+    n_nodes: int, rows: np.ndarray, columns: np.ndarray, *data: np.ndarray
+) -> tuple[np.ndarray, ...]:
+    """Sorts edges by their rows and creates the index pointer array of a CSR structure.
+
+    Args:
+        n_nodes: number of Nodes
+        rows: row indices of the edges
+        columns: column indices of the edges
+        *data: further arrays with one entry per edge
+
+    Returns:
+        index pointer array, the sorted column indices and the sorted data arrays
+
+    """
+    order = np.argsort(rows, kind="stable")
+    indptr = np.zeros(n_nodes + 1, dtype=np.intp)
+    np.cumsum(np.bincount(rows, minlength=n_nodes), out=indptr[1:])
+    return (indptr, columns[order]) + tuple(array[order] for array in data)
+
+
+class CSRGraph:
+    """Compact graph of a Network for fast shortest path and connectivity queries.
+
+    Instead of NetworkX's dictionaries, the graph is stored in the arrays of a compressed sparse row (CSR) structure.
+    The queries are run by :mod:`scipy.sparse.csgraph` and their results are returned as pandas Series with the Node or
+    Link IDs as index.
+
+    Parallel Links are kept. For shortest paths, the Link with the smallest weight is used.
+
+    Attributes:
+        node_ids: Node IDs in the order of the graph's Node indices
+        link_ids: Link IDs in the order of the graph's Link indices
+        directed: True, if the Links only connect their start Nodes to their end Nodes
+        matrix: sparse matrix with the smallest weight of the Links connecting two Nodes
+
+    """
+
+    def __init__(
+        self,
+        network: Network,
+        weight: Optional[Union[str, pd.Series]] = "length",
+        default: float = 0.00001,
+        directed: bool = False,
+    ):
+        """Creates a CSRGraph from a Network.
+
+        Args:
+          network: OOPNET network object
+          weight: name of the Link property used as weight, a pandas Series with Link IDs as index and weights as values
+            or None, if every Link has the weight 1. Weights must not be negative.
+          default: The default value is used as weight for Links that don't have the defined weight attribute or that
+            are missing in the weight pandas Series.
+          directed: If True, Links only connect their start Node to their end Node.
+
+        """
+        logger.debug("Creating CSRGraph from Network")
+        n_nodes, links, start, end = _link_node_indices(network)
+        self.node_ids = pd.Index(get_node_ids(network))
+        self.link_ids = pd.Index(get_link_ids(network))
+        self.directed = directed
+        self._positions = {node_id: i for i, node_id in enumerate(self.node_ids)}
+
+        weights = _link_weights(links, weight, default)
+        link_indices = np.arange(len(links))
+        both_start = np.concatenate([start, end])
+        both_end = np.concatenate([end, start])
+        both_links = np.concatenate([link_indices, link_indices])
+        # both directions of every Link, used for finding bridges
+        self._indptr, self._neighbors, self._links = _csr_arrays(
+            n_nodes, both_start, both_end, both_links
+        )
+
+        if not directed:
+            start, end, link_indices = both_start, both_end, both_links
+        # keep the Link with the smallest weight of parallel Links only
+        order = np.lexsort((weights[link_indices], end, start))
+        start, end, link_indices = start[order], end[order], link_indices[order]
+        first = np.ones(len(start), dtype=bool)
+        first[1:] = (start[1:] != start[:-1]) | (end[1:] != end[:-1])
+        start, end, link_indices = start[first], end[first], link_indices[first]
+        indptr, columns, self._edge_links = _csr_arrays(
+            n_nodes, start, end, link_indices
+        )
+        self.matrix = sparse.csr_matrix(
+            (weights[self._edge_links], columns, indptr), shape=(n_nodes, n_nodes)
+        )
+
+    def _node_indices(self, node_ids: Union[str, list[str]]) -> list[int]:
+        """Gets the indices of one or several Nodes.
+
+        Raises:
+            ComponentNotExistingError if a Node doesn't exist
+
+        """
+        if isinstance(node_ids, str):
+            node_ids = [node_ids]
+        try:
+            return [self._positions[node_id] for node_id in node_ids]
+        except KeyError as e:
+            raise ComponentNotExistingError(e.args[0]) from None
+
+    def _node_series(self, values: np.ndarray, name: str) -> pd.Series:
+        return pd.Series(values, index=self.node_ids, name=name)
+
+    def shortest_path_lengths(self, sources: Union[str, list[str]]) -> pd.Series:
+        """Calculates the weighted shortest path lengths from one or several source Nodes to all Nodes.
+
+        Args:
+          sources: ID or list of IDs of the source Nodes
+
+        Raises:
+            ComponentNotExistingError if a source Node doesn't exist
+
+        Returns:
+            pandas Series with the Node IDs as index and the length of the shortest path from the closest source Node
+            as values. Unreachable Nodes have an infinite length.
+
+        """
+        lengths = csgraph.dijkstra(
+            self.matrix,
+            directed=self.directed,
+            indices=self._node_indices(sources),
+            min_only=True,
+        )
+        return self._node_series(lengths, "shortest path length")
+
+    def hop_distances(self, sources: Union[str, list[str]]) -> pd.Series:
+        """Calculates the number of Links between one or several source Nodes and all Nodes with a breadth-first search.
+
+        Args:
+          sources: ID or list of IDs of the source Nodes
+
+        Raises:
+            ComponentNotExistingError if a source Node doesn't exist
+
+        Returns:
+            pandas Series with the Node IDs as index and the smallest number of Links between the Node and a source Node
+            as values. Unreachable Nodes have an infinite distance.
+
+        """
+        distances = csgraph.dijkstra(
+            self.matrix,
+            directed=self.directed,
+            indices=self._node_indices(sources),
+            unweighted=True,
+            min_only=True,
+        )
+        return self._node_series(distances, "hop distance")
+
+    def reachable(self, sources: Union[str, list[str]]) -> pd.Series:
+        """Checks which Nodes can be reached from one or several source Nodes, e.g. all Reservoirs and Tanks.
+
+        Args:
+          sources: ID or list of IDs of the source Nodes
+
+        Raises:
+            ComponentNotExistingError if a source Node doesn't exist
+
+        Returns:
+            pandas Series with the Node IDs as index and True for all reachable Nodes as values
+
+        """
+        reachable = np.zeros(len(self.node_ids), dtype=bool)
+        for index in self._node_indices(sources):
+            if not reachable[index]:
+                order = csgraph.breadth_first_order(
+                    self.matrix, index, directed=self.directed, return_predecessors=False
+                )
+                reachable[order] = True
+        return self._node_series(reachable, "reachable")
+
+    def shortest_path(self, source: str, target: str) -> list[str]:
+        """Finds the weighted shortest path between two Nodes.
+
+        Args:
+          source: ID of the source Node
+          target: ID of the target Node
+
+        Raises:
+            ComponentNotExistingError if one of the Nodes doesn't exist. ValueError if there is no path between the
+            Nodes.
+
+        Returns:
+            list of Node IDs along the path, starting with the source Node
+
+        """
+        source_index, target_index = self._node_indices([source, target])
+        _, predecessors = csgraph.dijkstra(
+            self.matrix,
+            directed=self.directed,
+            indices=source_index,
+            return_predecessors=True,
+        )
+        if source_index != target_index and predecessors[target_index] < 0:
+            raise ValueError(f"No path between Nodes {source!r} and {target!r}")
+        path = [target_index]
+        while path[-1] != source_index:
+            path.append(predecessors[path[-1]])
+        return self.node_ids[path[::-1]].tolist()
+
+    def connected_components(self) -> pd.Series:
+        """Labels the connected components of the graph.
+
+        For directed graphs, weakly connected components are labeled.
+
+        Returns:
+            pandas Series with the Node IDs as index and the component labels as values
+
+        """
+        _, labels = csgraph.connected_components(
+            self.matrix, directed=self.directed, connection="weak"
+        )
+        return self._node_series(labels, "component")
+
+    def bridges(self) -> pd.Series:
+        """Finds the bridges of the graph.
+
+        A bridge is a Link whose removal increases the number of connected components. The direction of Links is
+        ignored. Parallel Links are never bridges.
+
+        Returns:
+            pandas Series with the Link IDs as index and True for all bridges as values
+
+        """
+        # iterative version of Tarjan's algorithm, Links are identified by their index to handle parallel Links
+        indptr = self._indptr.tolist()
+        neighbors = self._neighbors.tolist()
+        edge_links = self._links.tolist()
+        discovery = [-1] * len(self.node_ids)
+        low = [0] * len(self.node_ids)
+        is_bridge = np.zeros(len(self.link_ids), dtype=bool)
+        counter = 0
+        for root in range(len(self.node_ids)):
+            if discovery[root] != -1:
+                continue
+            discovery[root] = low[root] = counter
+            counter += 1
+            stack = [(root, -1, indptr[root])]
+            while stack:
+                node, parent_link, position = stack[-1]
+                if position < indptr[node + 1]:
+                    stack[-1] = (node, parent_link, position + 1)
+                    link = edge_links[position]
+                    if link == parent_link:
+                        continue
+                    neighbor = neighbors[position]
+                    if discovery[neighbor] == -1:
+                        discovery[neighbor] = low[neighbor] = counter
+                        counter += 1
+                        stack.append((neighbor, link, indptr[neighbor]))
+                    elif discovery[neighbor] < low[node]:
+                        low[node] = discovery[neighbor]
+                    continue
+                stack.pop()
+                if stack:
+                    parent = stack[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                    if low[node] > discovery[parent]:
+                        is_bridge[parent_link] = True
+        return pd.Series(is_bridge, index=self.link_ids, name="bridge")
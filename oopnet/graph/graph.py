@@ -1,4 +1,5 @@
 from __future__ import annotations
+from itertools import chain
 from typing import TYPE_CHECKING, Union
 import logging
 from warnings import warn
@@ -10,6 +11,7 @@ from oopnet.utils.getters import get_node_ids, get_links
 
 if TYPE_CHECKING:
     from oopnet.elements import Network
+    from oopnet.elements.network_components import Link
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +29,42 @@ def _add_nodes(graph: nx.Graph, network: Network):
     graph.add_nodes_from(get_node_ids(network))
 
 
+def _link_weight(link: Link, weight: Union[str, pd.Series], default: float) -> float:
+    """Gets the weight of a Link.
+
+    Args:
+        link: Link object
+        weight: name of pipe property as a string which is used as weight or a pandas Series with link IDs as index and weights as values.
+        default: default value returned for Links that don't have the defined weight attribute or that are missing in the weight pandas Series.
+
+    Returns:
+        weight of the Link
+
+    """
+    if isinstance(weight, str):
+        return getattr(link, weight, default)
+    elif isinstance(weight, pd.Series) and link.id in weight.index:
+        return weight[link.id]
+    return default
+
+
+def _edge_nodes(link: Link, weight_value: float, switch_direction: bool) -> tuple[str, str]:
+    """Gets the IDs of the Nodes an edge representing a Link connects.
+
+    Args:
+        link: Link object
+        weight_value: weight of the Link
+        switch_direction: If the Link's weight is <0 and switch_direction is True, the Links start and end nodes will be switched.
+
+    Returns:
+        start and end Node IDs of the edge
+
+    """
+    if weight_value < 0 and switch_direction:
+        return link.endnode.id, link.startnode.id
+    return link.startnode.id, link.endnode.id
+
+
 def _add_links(
     graph: nx.Graph,
     network: Network,
@@ -45,18 +83,17 @@ def _add_links(
 
     """
     logger.debug("Adding Link objects to Network")
+    edge_link_ids = {}
+    undirected = not graph.is_directed()
     for l in get_links(network):
-        if isinstance(weight, str):
-            weight_value = getattr(l, weight, default)
-        elif isinstance(weight, pd.Series) and l.id in weight.index:
-            weight_value = weight[l.id]
-        else:
-            weight_value = default
-        if weight_value < 0 and switch_direction:
-            e = (l.endnode.id, l.startnode.id)
-        else:
-            e = (l.startnode.id, l.endnode.id)
-        graph.add_edge(*e, weight=weight_value, id=l.id)
+        weight_value = _link_weight(l, weight, default)
+        u, v = _edge_nodes(l, weight_value, switch_direction)
+        key = graph.add_edge(u, v, weight=weight_value, id=l.id)
+        edge = (u, v) if key is None else (u, v, key)
+        edge_link_ids[edge] = l.id
+        if undirected:
+            edge_link_ids[(v, u, *edge[2:])] = l.id
+    _store_edge_link_ids(graph, edge_link_ids)
 
 
 class Graph:
@@ -235,6 +272,78 @@ def onlinks2nxlinks(network: Network) -> list[tuple[str, str]]:
     return [(l.startnode.id, l.endnode.id) for l in get_links(network)]
 
 
+def _adjacency_size(graph: nx.Graph) -> int:
+    """Counts the entries of a graph's adjacency, which changes whenever an edge is added or removed.
+
+    Unlike graph.number_of_edges(), this doesn't iterate over the graph's degree view, which is several times slower.
+
+    """
+    neighbours = (nbrs for _, nbrs in graph.adjacency())
+    if graph.is_multigraph():
+        return sum(map(len, chain.from_iterable(nbrs.values() for nbrs in neighbours)))
+    return sum(map(len, neighbours))
+
+
+def _store_edge_link_ids(graph: nx.Graph, edge_link_ids: dict[tuple, str]):
+    """Stores a dictionary mapping the edges of a graph to Link IDs in the graph.
+
+    The dictionary is stored together with the size of the graph's adjacency, which is used to detect edges that were
+    added or removed afterwards.
+
+    Args:
+      graph: NetworkX graph
+      edge_link_ids: dictionary with edges as keys and Link IDs as values
+
+    """
+    graph._edge_link_ids_ = (_adjacency_size(graph), edge_link_ids)
+
+
+def _edge_link_ids(graph: nx.Graph) -> dict[tuple, str]:
+    """Gets a dictionary mapping the edges of a graph to the IDs of the Links they represent.
+
+    The dictionary contains the edges as (start, end) tuples or, for multigraphs, as (start, end, key) tuples. For
+    undirected graphs, both orientations of the edges are included. OOPNET's graph factories store the dictionary in
+    the graphs they create. For other graphs, e.g. copies, or if edges were added to or removed from the graph since the
+    dictionary was stored, it is created from the edges' "id" attributes and stored in the graph.
+
+    Args:
+      graph: NetworkX graph
+
+    Returns:
+        dictionary with edges as keys and Link IDs as values
+
+    """
+    size, edge_link_ids = getattr(graph, "_edge_link_ids_", (None, None))
+    if size != _adjacency_size(graph):
+        if graph.is_multigraph():
+            edges = graph.edges(keys=True, data="id")
+        else:
+            edges = graph.edges(data="id")
+        edge_link_ids = {tuple(edge[:-1]): edge[-1] for edge in edges}
+        if not graph.is_directed():
+            edge_link_ids.update(
+                {(u, v, *key): link_id for (v, u, *key), link_id in edge_link_ids.items()}
+            )
+        _store_edge_link_ids(graph, edge_link_ids)
+    return edge_link_ids
+
+
+def _edge_data_link_id(graph: nx.Graph, edge: tuple) -> Union[str, list[str]]:
+    """Looks up the Link ID of an edge in the graph's edge data.
+
+    This is used for single edges and for edges that are not in the graph's edge to Link ID dictionary, e.g. edges
+    without a key in multigraphs, which might represent several Links.
+
+    """
+    if not isinstance(graph, nx.MultiGraph):
+        return graph.get_edge_data(*edge)["id"]
+    edges = graph.get_edge_data(*edge)
+    if "id" in edges:
+        return edges["id"]
+    result = [edges[x]["id"] for x in edges]
+    return result if len(result) > 1 else result[0]
+
+
 def nxlinks2onlinks(graph: nx.Graph) -> list[str]:
     """Converts NetworkX graph edges to OOPNET Link IDs.
 
@@ -245,14 +354,7 @@ def nxlinks2onlinks(graph: nx.Graph) -> list[str]:
         List of OOPNET Link IDs
 
     """
-    if isinstance(graph, nx.MultiGraph):
-        ids = []
-        for n1, n2 in graph.edges():
-            e_data = graph.get_edge_data(n1, n2)
-            for values in e_data.values():
-                ids.append(values["id"])
-        return ids
-    return [graph.get_edge_data(n1, n2)["id"] for n1, n2 in graph.edges()]
+    return [link_id for *_, link_id in graph.edges(data="id")]
 
 
 def nxedge2onlink_id(graph: nx.Graph, edge: tuple[str, str]) -> Union[str, list[str]]:
@@ -266,18 +368,15 @@ def nxedge2onlink_id(graph: nx.Graph, edge: tuple[str, str]) -> Union[str, list[
         ID of corresponding OOPNET Link
 
     """
-    if not isinstance(graph, nx.MultiGraph):
-        return graph.get_edge_data(*edge)["id"]
-    edges = graph.get_edge_data(*edge)
-    if "id" in edges:
-        return edges["id"]
-    result = [edges[x]["id"] for x in edges]
-    return result if len(result) > 1 else result[0]
+    return _edge_data_link_id(graph, edge)
 
 
 def edgeresult2pandas(graph: nx.Graph, result: dict) -> pd.Series:
     """Transforms edge data retrieved e.g. from edge centric centrality measurements to a Pandas Series compatible with OOPNET.
 
+    The Link IDs are looked up in a dictionary mapping edges to Link IDs, that OOPNET's graph factories store in the
+    graphs they create.
+
     Args:
       graph: networkx graph object
       result: dictionary with Link IDs as keys
@@ -286,12 +385,19 @@ def edgeresult2pandas(graph: nx.Graph, result: dict) -> pd.Series:
       transformed result into a pandas Series
 
     """
-    return_dict = {}
-    for edge in list(result.keys()):
-        pipe = nxedge2onlink_id(graph, edge)
-        if isinstance(pipe, list):
-            for lid in pipe:
-                return_dict[lid] = result[edge]
-        else:
-            return_dict[pipe] = result[edge]
-    return pd.Series(return_dict)
+    edge_link_ids = _edge_link_ids(graph)
+    link_ids = [edge_link_ids.get(edge) for edge in result]
+    values = list(result.values())
+    if None in link_ids:
+        stored_link_ids, link_ids, values = link_ids, [], []
+        for edge, link_id, value in zip(result, stored_link_ids, result.values()):
+            if link_id is None:
+                link_id = _edge_data_link_id(graph, edge)
+            if isinstance(link_id, list):
+                link_ids.extend(link_id)
+                values.extend([value] * len(link_id))
+            else:
+                link_ids.append(link_id)
+                values.append(value)
+    series = pd.Series(values, index=link_ids, dtype=None if result else float)
+    return series[~series.index.duplicated(keep="last")]
@@ -0,0 +1,167 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional, Union
+import logging
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from oopnet.utils.getters import get_node_ids, get_links
+
+if TYPE_CHECKING:
+    from oopnet.elements import Network
+    from oopnet.elements.network_components import Link
+
+logger = logging.getLogger(__name__)
+
+
+def _link_node_indices(
+    network: Network,
+) -> tuple[int, list[Link], np.ndarray, np.ndarray]:
+    """Gets the indices of the start and end Nodes of all Links in a Network.
+
+    Args:
+        network: OOPNET network object
+
+    Returns:
+        number of Nodes, list of Links (ordered like :func:`~oopnet.utils.getters.get_link_ids`) and arrays with the
+        indices of the Links' start and end Nodes (ordered like :func:`~oopnet.utils.getters.get_node_ids`)
+
+    """
+    positions = {node_id: i for i, node_id in enumerate(get_node_ids(network))}
+    links = get_links(network)
+    start = np.fromiter(
+        (positions[link.startnode.id] for link in links), dtype=np.intp, count=len(links)
+    )
+    end = np.fromiter(
+        (positions[link.endnode.id] for link in links), dtype=np.intp, count=len(links)
+    )
+    return len(positions), links, start, end
+
+
+def _link_weights(
+    links: list[Link], weight: Optional[Union[str, pd.Series]], default: float
+) -> np.ndarray:
+    """Gets the weights of Links as an array.
+
+    Args:
+        links: list of Links
+        weight: name of the Link property used as weight, a pandas Series with Link IDs as index and weights as values or
+            None, if every Link has the weight 1
+        default: weight of Links that don't have the defined weight attribute or that are missing in the weight Series
+
+    Returns:
+        array of weights in the order of the passed Links
+
+    """
+    if weight is None:
+        return np.ones(len(links))
+    if isinstance(weight, pd.Series):
+        values = weight.reindex([link.id for link in links]).fillna(default)
+        return values.to_numpy(dtype=float)
+    return np.fromiter(
+        (getattr(link, weight, default) for link in links), dtype=float, count=len(links)
+    )
+
+
+def incidence_matrix(network: Network, oriented: bool = False) -> sparse.csr_matrix:
+    """Creates the Node-Link incidence matrix of a Network.
+
+    The matrix is built directly from the Network without creating a graph first. Every Link gets its own column, so
+    parallel Links are kept.
+
+    Rows are ordered like :func:`~oopnet.utils.getters.get_node_ids` and columns like
+    :func:`~oopnet.utils.getters.get_link_ids`.
+
+    Args:
+      network: OOPNET network object
+      oriented: If True, a Link's entries are -1 for its start Node and 1 for its end Node. Otherwise, both entries are 1.
+
+    Returns:
+        sparse matrix with the shape (number of Nodes, number of Links)
+
+    Examples:
+        The following will create the oriented incidence matrix and use it to sum up the flows entering every Node:
+        >>> a = incidence_matrix(network, oriented=True)
+        >>> inflow = a @ rpt.flow.reindex(get_link_ids(network)).values
+
+    """
+    logger.debug("Creating incidence matrix from Network")
+    n_nodes, links, start, end = _link_node_indices(network)
+    columns = np.arange(len(links))
+    values = np.ones(2 * len(links))
+    if oriented:
+        values[: len(links)] = -1
+    return sparse.csr_matrix(
+        (values, (np.concatenate([start, end]), np.concatenate([columns, columns]))),
+        shape=(n_nodes, len(links)),
+    )
+
+
+def adjacency_matrix(
+    network: Network,
+    directed: bool = False,
+    weight: Optional[Union[str, pd.Series]] = None,
+    default: float = 0.00001,
+) -> sparse.csr_matrix:
+    """Creates the adjacency matrix of a Network.
+
+    The matrix is built directly from the Network without creating a graph first. The weights of parallel Links are
+    summed up, so that - unlike with a :class:`networkx.Graph` - no Link is dropped.
+
+    Rows and columns are ordered like :func:`~oopnet.utils.getters.get_node_ids`.
+
+    Args:
+      network: OOPNET network object
+      directed: If True, Links only connect their start Node to their end Node. Otherwise, the matrix is symmetric.
+      weight: name of the Link property used as weight, a pandas Series with Link IDs as index and weights as values or
+        None, if every Link has the weight 1
+      default: The default value is used as weight for Links that don't have the defined weight attribute or that are
+        missing in the weight pandas Series.
+
+    Returns:
+        sparse matrix with the shape (number of Nodes, number of Nodes)
+
+    """
+    logger.debug("Creating adjacency matrix from Network")
+    n_nodes, links, start, end = _link_node_indices(network)
+    values = _link_weights(links, weight, default)
+    if not directed:
+        start, end = np.concatenate([start, end]), np.concatenate([end, start])
+        values = np.concatenate([values, values])
+    return sparse.csr_matrix((values, (start, end)), shape=(n_nodes, n_nodes))
+
+
+def laplacian_matrix(
+    network: Network,
+    weight: Optional[Union[str, pd.Series]] = None,
+    default: float = 0.00001,
+) -> sparse.csr_matrix:
+    """Creates the weighted Laplacian matrix of a Network.
+
+    The Laplacian matrix equals ``A W A^T`` with the oriented incidence matrix ``A`` and a diagonal matrix ``W`` of Link
+    weights, which is the difference of the weighted degree matrix and the undirected adjacency matrix. Parallel Links
+    add up.
+
+    Rows and columns are ordered like :func:`~oopnet.utils.getters.get_node_ids`.
+
+    Args:
+      network: OOPNET network object
+      weight: name of the Link property used as weight, a pandas Series with Link IDs as index and weights as values or
+        None, if every Link has the weight 1
+      default: The default value is used as weight for Links that don't have the defined weight attribute or that are
+        missing in the weight pandas Series.
+
+    Returns:
+        sparse matrix with the shape (number of Nodes, number of Nodes)
+
+    """
+    logger.debug("Creating Laplacian matrix from Network")
+    n_nodes, links, start, end = _link_node_indices(network)
+    values = _link_weights(links, weight, default)
+    rows = np.concatenate([start, end, start, end])
+    columns = np.concatenate([start, end, end, start])
+    return sparse.csr_matrix(
+        (np.concatenate([values, values, -values, -values]), (rows, columns)),
+        shape=(n_nodes, n_nodes),
+    )
@@ -0,0 +1 @@
+from .gga import GGASolver, UnbalancedSystemError
@@ -0,0 +1,919 @@
+from __future__ import annotations
+from math import log, pi
+import logging
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+import xarray as xr
+
+from oopnet.elements.base import component_type
+from oopnet.elements.network_components import PRV, PSV, PBV, FCV, TCV, GPV
+from oopnet.elements.system_operation import Pattern
+from oopnet.report.report import SimulationReport
+from oopnet.simulator.simulation_errors import HydraulicEquationError
+
+if TYPE_CHECKING:
+    from oopnet.elements.network import Network
+    from oopnet.elements.network_components import Junction, Pump
+    from oopnet.elements.system_operation import Curve
+
+logger = logging.getLogger(__name__)
+
+# The solver works in EPANET's internal units (feet and cubic feet per second), so that EPANET's constants and
+# tolerances can be used as they are.
+FLOW_UNITS = {
+    "CFS": 1.0,
+    "GPM": 448.831,
+    "MGD": 0.64632,
+    "IMGD": 0.5382,
+    "AFD": 1.9837,
+    "LPS": 28.317,
+    "LPM": 1699.0,
+    "MLD": 2.4466,
+    "CMH": 101.94,
+    "CMD": 2446.6,
+}  # flow units per cfs
+US_UNITS = frozenset({"CFS", "GPM", "MGD", "IMGD", "AFD"})
+MPERFT = 0.3048
+PSIPERFT = 0.4333
+KWPERHP = 0.7457
+
+VISCOSITY = 1.1e-5  # kinematic viscosity of water at 20 °C in ft²/s
+GRAVITY = 32.2  # ft/s²
+HTOL = 0.0005  # head tolerance for status checks in ft
+QTOL = 0.0001  # flow tolerance for status checks in cfs
+RQTOL = 1e-7  # smallest head loss gradient
+CBIG = 1e8
+CSMALL = 1e-6
+TINY = 1e-6
+QZERO = 1e-6  # flow in closed links
+CHECKFREQ = 2  # iterations between status checks
+MAXCHECK = 10  # iterations after which status checks are only performed after convergence
+
+# link types
+PIPE, CVPIPE, PUMP, PRV_, PSV_, PBV_, FCV_, TCV_, GPV_ = range(9)
+VALVE_TYPES = {PRV: PRV_, PSV: PSV_, PBV: PBV_, FCV: FCV_, TCV: TCV_, GPV: GPV_}
+
+# link status values in the same order as in EPANET, all values <= CLOSED mean closed links
+XHEAD, TEMPCLOSED, CLOSED, OPEN, ACTIVE, XFCV = range(6)
+
+# Darcy-Weisbach friction factor constants (Swamee and Jain, Dunlop)
+A1 = 1000.0 * pi  # Re = 4000
+A2 = 500.0 * pi  # Re = 2000
+A8 = 5.74 * (pi / 4.0) ** 0.9
+A9 = -2.0 / log(10.0)
+AB = 5.74 / 4000.0**0.9
+AC = -2.0 * 0.9 * 2.0 / log(10.0) * AB
+
+# reported variables
+_NODE_VARS = pd.Index(["Elevation", "Demand", "Head", "Pressure"], dtype=object, name="vars")
+_LINK_VARS = pd.Index(["Length", "Diameter", "Flow", "Velocity", "Headloss"], dtype=object, name="vars")
+
+
+class UnbalancedSystemError(Exception):
+    """Error raised if the hydraulic equations haven't converged within the maximum number of trials and the Network's
+    unbalanced Option is STOP."""
+
+
+def _multiplier(pattern: Optional[Pattern], period: int) -> float:
+    """Returns a Pattern's multiplier for a pattern period or 1 if there is no Pattern."""
+    if pattern is None or not pattern.multipliers:
+        return 1.0
+    return pattern.multipliers[period % len(pattern.multipliers)]
+
+
+def _curve_segment(xvalues: np.ndarray, yvalues: np.ndarray, x: float) -> tuple[float, float]:
+    """Finds intercept and slope of the linear curve segment containing x.
+
+    Values outside the curve are extrapolated from the first or last segment.
+
+    """
+    k2 = min(max(int(np.searchsorted(xvalues, x)), 1), len(xvalues) - 1)
+    k1 = k2 - 1
+    slope = (yvalues[k2] - yvalues[k1]) / (xvalues[k2] - xvalues[k1])
+    return yvalues[k1] - slope * xvalues[k1], slope
+
+
+def _friction_factor(q: np.ndarray, e: np.ndarray, s: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Darcy-Weisbach friction factor and its derivative with respect to flow.
+
+    The Swamee and Jain approximation is used for turbulent flow and Dunlop's interpolating polynomial for transitional
+    flow, as in EPANET.
+
+    Args:
+        q: absolute flows
+        e: relative roughness
+        s: kinematic viscosity multiplied with the diameter
+
+    Returns:
+        friction factors and their derivatives
+
+    """
+    w = q / s
+    f = np.empty_like(q)
+    dfdq = np.empty_like(q)
+    turbulent = w >= A1
+    if turbulent.any():
+        wt, et, qt = w[turbulent], e[turbulent], q[turbulent]
+        y1 = A8 / wt**0.9
+        y2 = et / 3.7 + y1
+        y3 = A9 * np.log(y2)
+        ft = 1.0 / (y3 * y3)
+        f[turbulent] = ft
+        dfdq[turbulent] = 1.8 * ft * y1 * A9 / y2 / y3 / qt
+    transitional = ~turbulent
+    if transitional.any():
+        y2 = e[transitional] / 3.7 + AB
+        y3 = A9 * np.log(y2)
+        fa = 1.0 / (y3 * y3)
+        fb = (2.0 + AC / (y2 * y3)) * fa
+        r = w[transitional] / A2
+        x1 = 7.0 * fa - fb
+        x2 = 0.128 - 17.0 * fa + 2.5 * fb
+        x3 = -0.128 + 13.0 * fa - (fb + fb)
+        x4 = 0.032 - 3.0 * fa + 0.5 * fb
+        f[transitional] = x1 + r * (x2 + r * (x3 + r * x4))
+        dfdq[transitional] = (x2 + r * (2.0 * x3 + r * 3.0 * x4)) / s[transitional] / A2
+    return f, dfdq
+
+
+def _power_law(hloss0: float, r: float, n: float, q: float, flow: float) -> tuple[float, float]:
+    """Head loss and gradient of a head loss function hloss0 + r * q^n with a linear approximation for small
+    gradients.
+
+    Args:
+        hloss0: head loss at zero flow
+        r: resistance coefficient
+        n: flow exponent
+        q: absolute flow
+        flow: flow with sign, the function is extended linearly for negative flows
+
+    """
+    hgrad = n * r * q ** (n - 1.0)
+    if hgrad < RQTOL:
+        return hloss0 + RQTOL * flow, RQTOL
+    return hloss0 + hgrad * flow / n, hgrad
+
+
+class _PumpCurve:
+    """Head curve of a Pump in internal units.
+
+    Single point curves and three point curves starting at zero flow are converted to a power function
+    h = h0 - r * q^n, all other curves are interpolated linearly.
+
+    """
+
+    def __init__(self, curve: Curve, f_flow: float, f_length: float):
+        x = np.asarray(curve.xvalues, dtype=float) / f_flow
+        y = np.asarray(curve.yvalues, dtype=float) / f_length
+        self.x, self.y = x, y
+        self.power_function = True
+        if len(x) == 1:
+            self.h0 = 4.0 / 3.0 * y[0]
+            self.n = 2.0
+            self.r = (self.h0 - y[0]) / x[0] ** 2
+            self.q0 = x[0]
+        elif len(x) == 3 and x[0] == 0.0:
+            h4 = y[0] - y[1]
+            h5 = y[0] - y[2]
+            if h4 <= 0.0 or h5 <= h4 or x[1] <= 0.0 or x[2] <= x[1]:
+                raise ValueError(f"Curve {curve.id} is not a valid pump curve.")
+            self.h0 = y[0]
+            self.n = log(h5 / h4) / log(x[2] / x[1])
+            self.r = h4 / x[1] ** self.n
+            self.q0 = x[1]
+        else:
+            if len(x) < 2 or np.any(np.diff(x) <= 0.0) or np.any(np.diff(y) > 0.0):
+                raise ValueError(f"Curve {curve.id} is not a valid pump curve.")
+            self.power_function = False
+            self.h0 = y[0]
+            self.q0 = (x[0] + x[-1]) / 2.0
+
+    def coefficients(self, flow: float, speed: float) -> tuple[float, float]:
+        """Returns head loss (negative head gain) and head loss gradient for a flow and relative speed."""
+        if self.power_function:
+            n = self.n
+            return _power_law(-speed**2 * self.h0, self.r * speed ** (2.0 - n), n, abs(flow), flow)
+        intercept, slope = _curve_segment(self.x, self.y, abs(flow) / speed)
+        hgrad = max(-slope * speed, RQTOL)
+        return -intercept * speed**2 + hgrad * flow, hgrad
+
+
+class GGASolver:
+    """Steady state hydraulic solver based on the Global Gradient Algorithm (Todini and Pilati, 1988).
+
+    The solver runs in-process with NumPy and scipy.sparse and doesn't need any files, which makes it suitable for
+    optimisations with many thousand hydraulic evaluations. It follows EPANET 2.2's formulation: Hazen-Williams,
+    Darcy-Weisbach and Chezy-Manning head loss, minor losses, check valves, pumps with head curves or constant power,
+    all valve types including their status changes, emitters and pressure driven demands are supported. Tanks are
+    treated as fixed head nodes at their initial level.
+
+    Only the first time step of a simulation is solved, i.e. demands, reservoir heads and pump speeds are determined
+    with the pattern multipliers at the start of the simulation. Controls and rules are ignored.
+
+    Attributes:
+        network: OOPNET network object
+        trials: maximum number of iterations. If None, the Network's trials Option is used.
+        accuracy: convergence criterion, i.e. the ratio of the sum of the flow changes and the sum of the flows. If
+            None, the Network's accuracy Option is used.
+
+    Examples:
+        >>> rpt = GGASolver(network).run()
+        >>> rpt.pressure
+
+    """
+
+    def __init__(
+        self,
+        network: Network,
+        trials: Optional[int] = None,
+        accuracy: Optional[float] = None,
+    ):
+        """GGASolver init method.
+
+        Args:
+            network: OOPNET network object
+            trials: maximum number of iterations. If None, the Network's trials Option is used.
+            accuracy: convergence criterion. If None, the Network's accuracy Option is used.
+
+        """
+        self.network = network
+        self.trials = trials
+        self.accuracy = accuracy
+
+    def run(self) -> SimulationReport:
+        """Solves the hydraulic equations.
+
+        Raises:
+            HydraulicEquationError if the equations can't be solved (e.g., because Nodes aren't connected to a Tank or
+            Reservoir). UnbalancedSystemError if the equations haven't converged and the Network's unbalanced Option
+            is STOP.
+
+        Returns:
+            OOPNET report object with the Nodes' elevation, demand, head and pressure and the Links' length, diameter,
+            flow, velocity and headloss
+
+        """
+        self._compile()
+        self._initialise()
+        self._solve()
+        return self._report()
+
+    # model compilation
+    def _set_units(self):
+        """Determines factors for converting the Network's units to the internal units."""
+        options = self.network.options
+        units = options.units.upper()
+        if units not in FLOW_UNITS:
+            raise ValueError(f"Illegal unit {options.units} defined.")
+        specificgravity = options.specificgravity or 1.0
+        self._f_flow = FLOW_UNITS[units]
+        if units in US_UNITS:
+            self._f_length = 1.0
+            self._f_diameter = 12.0
+            self._f_pressure = PSIPERFT * specificgravity
+            self._f_power = 1.0
+            self._f_roughness = 1000.0
+        else:
+            self._f_length = MPERFT
+            self._f_diameter = 1000.0 * MPERFT
+            self._f_pressure = MPERFT * specificgravity
+            self._f_power = KWPERHP
+            self._f_roughness = 1000.0 * MPERFT
+
+    def _pattern_period(self) -> int:
+        """Returns the pattern period at the start of the simulation."""
+        times = self.network.times
+        step = times.patterntimestep.total_seconds() if times.patterntimestep else 3600.0
+        return int(times.patternstart.total_seconds() // step) if step > 0 else 0
+
+    def _default_pattern(self) -> Optional[Pattern]:
+        """Returns the Pattern used for Junctions without demand pattern."""
+        pattern = self.network.options.pattern
+        if isinstance(pattern, Pattern) or pattern is None:
+            return pattern
+        if isinstance(pattern, float) and pattern.is_integer():
+            pattern = int(pattern)
+        return dict.get(self.network._patterns, str(pattern))
+
+    def _junction_demand(self, junction: Junction, default: Optional[Pattern], period: int) -> float:
+        """Returns a Junction's total demand at the start of the simulation in the Network's flow units."""
+        demands = junction.demand
+        patterns = junction.demandpattern
+        if not isinstance(demands, list):
+            demands = [demands]
+        if not isinstance(patterns, list):
+            patterns = [patterns]
+        total = 0.0
+        for i, demand in enumerate(demands):
+            pattern = patterns[i] if i < len(patterns) and patterns[i] is not None else default
+            total += (demand or 0.0) * _multiplier(pattern, period)
+        return total
+
+    def _compile(self):
+        """Converts the Network to arrays in internal units."""
+        network = self.network
+        options = network.options
+        self._set_units()
+        f_flow, f_length, f_diameter, f_pressure = self._f_flow, self._f_length, self._f_diameter, self._f_pressure
+        period = self._pattern_period()
+        default = self._default_pattern()
+
+        junctions = list(network._nodes["junctions"].values())
+        reservoirs = list(network._nodes["reservoirs"].values())
+        tanks = list(network._nodes["tanks"].values())
+        nodes = junctions + reservoirs + tanks
+        self._node_ids = [node.id for node in nodes]
+        index = {node.id: i for i, node in enumerate(nodes)}
+        nj = self._n_junctions = len(junctions)
+        nn = self._n_nodes = len(nodes)
+        self._elevation = np.fromiter((node.elevation for node in nodes), dtype=float, count=nn) / f_length
+
+        # fixed heads of Reservoirs and Tanks; Tanks also store their head limits
+        fixed_head = np.zeros(nn)
+        for i, reservoir in enumerate(reservoirs, nj):
+            # like EPANET, a Reservoir's elevation is its base head
+            self._elevation[i] = reservoir.head / f_length
+            fixed_head[i] = self._elevation[i] * _multiplier(reservoir.headpattern, period)
+        self._tanks = {}
+        for i, tank in enumerate(tanks, nj + len(reservoirs)):
+            fixed_head[i] = self._elevation[i] + tank.initlevel / f_length
+            self._tanks[i] = (
+                self._elevation[i] + tank.minlevel / f_length,
+                self._elevation[i] + tank.maxlevel / f_length,
+                tank.overflow is not None and tank.overflow.upper() == "YES",
+            )
+        self._fixed_head = fixed_head
+
+        # demands, emitters and pressure driven demands
+        multiplier = options.demandmultiplier
+        self._demand = np.fromiter(
+            (self._junction_demand(j, default, period) * multiplier for j in junctions),
+            dtype=float,
+            count=nj,
+        ) / f_flow
+        emitters = [(i, j.emittercoefficient) for i, j in enumerate(junctions) if j.emittercoefficient]
+        self._emitter_nodes = np.array([i for i, _ in emitters], dtype=np.intp)
+        self._emitter_n = 1.0 / options.emitterexponent
+        # q = C * p^exponent in the Network's units is converted to a head loss function h = k * q^n
+        coefficients = np.array([c for _, c in emitters], dtype=float) * f_pressure**options.emitterexponent / f_flow
+        self._emitter_k = np.maximum(coefficients, CSMALL) ** -self._emitter_n
+        self._pda = options.demandmodel.upper() == "PDA"
+        if self._pda:
+            self._pda_nodes = np.flatnonzero(self._demand > 0.0)
+            self._pmin = options.minimumpressure / f_pressure
+            self._dp = max(options.requiredpressure / f_pressure - self._pmin, TINY)
+            self._pda_n = 1.0 / options.pressureexponent
+        else:
+            self._pda_nodes = np.zeros(0, dtype=np.intp)
+
+        self._compile_links(index)
+        self._build_matrix_structure()
+
+    def _compile_links(self, index: dict[str, int]):
+        """Converts the Network's Links to arrays in internal units."""
+        network = self.network
+        options = self.network.options
+        f_flow, f_length, f_diameter, f_pressure = self._f_flow, self._f_length, self._f_diameter, self._f_pressure
+        period = self._pattern_period()
+        pipes = list(network._links["pipes"].values())
+        pumps = list(network._links["pumps"].values())
+        valves = list(network._links["valves"].values())
+        links = pipes + pumps + valves
+        nl = len(links)
+        self._link_ids = [link.id for link in links]
+        self._start = np.fromiter((index[link.startnode.id] for link in links), dtype=np.intp, count=nl)
+        self._end = np.fromiter((index[link.endnode.id] for link in links), dtype=np.intp, count=nl)
+        self._kind = np.array(
+            [CVPIPE if p.status == "CV" else PIPE for p in pipes]
+            + [PUMP] * len(pumps)
+            + [VALVE_TYPES[component_type(v)] for v in valves],
+            dtype=np.intp,
+        )
+        self._fixed_closed = np.array([link.status == "CLOSED" for link in links], dtype=bool)
+        diameter = np.zeros(nl)
+        length = np.zeros(nl)
+        km = np.zeros(nl)
+        setting = np.zeros(nl)
+
+        # Pipes
+        npipes = len(pipes)
+        self._pipes = np.arange(npipes)
+        diameter[:npipes] = [p.diameter for p in pipes]
+        length[:npipes] = [p.length for p in pipes]
+        km[:npipes] = [p.minorloss for p in pipes]
+        roughness = np.array([p.roughness for p in pipes], dtype=float)
+        self._length = length
+        d = diameter[:npipes] / f_diameter
+        l = length[:npipes] / f_length
+        self._headloss = options.headloss.upper()
+        if self._headloss == "H-W":
+            self._pipe_r = 4.727 * l / roughness**1.852 / d**4.871
+            self._pipe_n = 1.852
+        elif self._headloss == "D-W":
+            self._pipe_r = l / 2.0 / GRAVITY / d / (pi * d**2 / 4.0) ** 2
+            self._pipe_e = roughness / self._f_roughness / d
+            self._pipe_s = VISCOSITY * options.viscosity * d
+        elif self._headloss == "C-M":
+            self._pipe_r = (4.0 * roughness / (1.49 * pi * d**2)) ** 2 * (d / 4.0) ** -1.333 * l
+            self._pipe_n = 2.0
+        else:
+            raise ValueError(f"Unknown headloss formula {options.headloss}.")
+
+        # Pumps
+        self._pumps = []
+        for k, pump in enumerate(pumps, npipes):
+            speed = (pump.speed if pump.speed is not None else 1.0) * _multiplier(pump.pattern, period)
+            if pump.head is not None:
+                curve = _PumpCurve(pump.head, f_flow, f_length)
+                power = None
+            elif pump.power is not None:
+                curve = None
+                power = pump.power / self._f_power
+            else:
+                raise ValueError(f"Pump {pump.id} has neither a head curve nor a power value.")
+            self._pumps.append((k, curve, power, speed))
+            setting[k] = speed
+
+        # Valves
+        self._gpv_curves = {}
+        for k, valve in enumerate(valves, npipes + len(pumps)):
+            diameter[k] = valve.diameter
+            km[k] = valve.minorloss
+            if isinstance(valve, (PRV, PSV, PBV)):
+                value = {PRV: "maximum_pressure", PSV: "pressure_limit", PBV: "pressure_drop"}[component_type(valve)]
+                setting[k] = getattr(valve, value) / f_pressure
+            elif isinstance(valve, FCV):
+                setting[k] = valve.maximum_flow / f_flow
+            elif isinstance(valve, TCV):
+                setting[k] = valve.headloss_coefficient
+            else:
+                curve = valve.headloss_curve
+                self._gpv_curves[k] = (
+                    np.asarray(curve.xvalues, dtype=float) / f_flow,
+                    np.asarray(curve.yvalues, dtype=float) / f_length,
+                )
+        diameter /= f_diameter
+        self._diameter = diameter
+        # minor loss coefficients are converted to r in h = r * q²
+        self._km = np.zeros(nl)
+        np.divide(0.02517 * km, diameter**4, out=self._km, where=diameter > 0.0)
+        self._valves = np.arange(npipes + len(pumps), nl)
+        tcv = self._valves[self._kind[self._valves] == TCV_]
+        self._tcv_km = 0.02517 * setting[tcv] / diameter[tcv] ** 4
+        self._setting = setting
+
+    def _build_matrix_structure(self):
+        """Determines the sparsity pattern of the matrix and where the Links' coefficients are added."""
+        nj = self._n_junctions
+        start, end = self._start, self._end
+        inner = np.flatnonzero((start < nj) & (end < nj) & (start != end))
+        self._inner = inner
+        rows = np.concatenate([np.arange(nj), start[inner], end[inner]])
+        cols = np.concatenate([np.arange(nj), end[inner], start[inner]])
+        keys = cols * max(nj, 1) + rows
+        unique = np.unique(keys)
+        self._positions = np.searchsorted(unique, keys)
+        self._nnz = len(unique)
+        indices = (unique % max(nj, 1)).astype(np.int32)
+        indptr = np.searchsorted(unique // max(nj, 1), np.arange(nj + 1)).astype(np.int32)
+        # only the matrix' values change between iterations
+        self._matrix = sp.csc_matrix((np.zeros(len(unique)), indices, indptr), shape=(nj, nj))
+
+    # Newton iterations
+    def _initialise(self):
+        """Sets the initial flows and link status."""
+        nl = len(self._kind)
+        status = np.full(nl, OPEN, dtype=np.intp)
+        valves = self._valves
+        status[valves] = ACTIVE
+        status[self._fixed_closed] = CLOSED
+        q = pi * self._diameter**2 / 4.0
+        for k, curve, power, speed in self._pumps:
+            if speed <= 0.0:
+                status[k] = CLOSED
+            q[k] = (curve.q0 if curve is not None else 1.0) * max(speed, 0.0)
+        q[status <= CLOSED] = QZERO
+        self._status = status
+        self._flow = q
+        self._head = self._fixed_head.copy()
+        self._head[: self._n_junctions] = self._elevation[: self._n_junctions]
+        self._emitter_flow = np.ones(len(self._emitter_nodes))
+        self._demand_flow = self._demand.copy()
+
+    def _pipe_coefficients(self, q: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Head losses and head loss gradients of all Pipes."""
+        pipes = self._pipes
+        aq = np.abs(q[pipes])
+        km = self._km[pipes]
+        r = self._pipe_r
+        if self._headloss == "D-W":
+            s = self._pipe_s
+            laminar = aq <= A2 * s
+            hloss = np.empty_like(aq)
+            hgrad = np.empty_like(aq)
+            rl = 16.0 * pi * s[laminar] * r[laminar]
+            hloss[laminar] = aq[laminar] * (rl + km[laminar] * aq[laminar])
+            hgrad[laminar] = rl + 2.0 * km[laminar] * aq[laminar]
+            turbulent = ~laminar
+            if turbulent.any():
+                at, rt = aq[turbulent], r[turbulent]
+                f, dfdq = _friction_factor(at, self._pipe_e[turbulent], s[turbulent])
+                r1 = f * rt + km[turbulent]
+                hloss[turbulent] = r1 * at * at
+                hgrad[turbulent] = 2.0 * r1 * at + dfdq * rt * at * at
+        else:
+            n = self._pipe_n
+            hgrad = n * r * aq ** (n - 1.0)
+            small = hgrad < RQTOL
+            hgrad[small] = RQTOL
+            hloss = np.where(small, RQTOL * aq, hgrad * aq / n)
+            hloss += km * aq * aq
+            hgrad += 2.0 * km * aq
+        return hloss * np.sign(q[pipes]), hgrad
+
+    @staticmethod
+    def _open_valve_coefficients(q: np.ndarray, km: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Inverse head loss gradients and flow corrections of open valves with minor loss coefficients km."""
+        aq = np.abs(q)
+        hgrad = 2.0 * km * aq
+        small = hgrad < RQTOL
+        hgrad[small] = RQTOL
+        p = 1.0 / hgrad
+        y = np.where(small, q, q / 2.0)
+        no_loss = km <= 0.0
+        p[no_loss] = 1.0 / CSMALL
+        y[no_loss] = q[no_loss]
+        return p, y
+
+    def _coefficients(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Computes the Links' inverse head loss gradients p and flow corrections y.
+
+        Returns:
+            p, y, nodes with heads fixed by active pressure valves and the fixed heads
+
+        """
+        q = self._flow
+        status = self._status
+        kind = self._kind
+        p = np.empty(len(q))
+        y = np.empty(len(q))
+
+        pipes = self._pipes
+        if len(pipes):
+            hloss, hgrad = self._pipe_coefficients(q)
+            p[pipes] = 1.0 / hgrad
+            y[pipes] = hloss / hgrad
+
+        for k, curve, power, speed in self._pumps:
+            if status[k] <= CLOSED:
+                continue
+            if curve is not None:
+                hloss, hgrad = curve.coefficients(q[k], speed)
+            else:
+                aq = max(abs(q[k]), TINY)
+                hgrad = max(8.814 * power / aq**2, RQTOL)
+                hloss = -8.814 * power / aq
+            p[k] = 1.0 / hgrad
+            y[k] = hloss / hgrad
+
+        fixed_nodes = []
+        fixed_heads = []
+        valves = self._valves
+        if len(valves):
+            p[valves], y[valves] = self._open_valve_coefficients(q[valves], self._km[valves])
+            vkind = kind[valves]
+            tcv = valves[vkind == TCV_]
+            p[tcv], y[tcv] = self._open_valve_coefficients(q[tcv], self._tcv_km)
+            for k, (x, h) in self._gpv_curves.items():
+                aq = max(abs(q[k]), TINY)
+                intercept, slope = _curve_segment(x, h, aq)
+                p[k] = 1.0 / max(slope, RQTOL)
+                y[k] = p[k] * (intercept + slope * aq) * np.sign(q[k])
+            pbv = valves[vkind == PBV_]
+            pbv = pbv[(self._setting[pbv] != 0.0) & (self._km[pbv] * q[pbv] ** 2 <= self._setting[pbv])]
+            p[pbv] = CBIG
+            y[pbv] = self._setting[pbv] * CBIG
+            fcv = valves[(vkind == FCV_) & (status[valves] == ACTIVE)]
+            p[fcv] = 1.0 / CBIG
+            y[fcv] = q[fcv] - self._setting[fcv]
+            active = valves[((vkind == PRV_) | (vkind == PSV_)) & (status[valves] == ACTIVE)]
+            if len(active):
+                excess = self._flow_excess()
+                for k in active:
+                    node = self._end[k] if kind[k] == PRV_ else self._start[k]
+                    p[k] = 0.0
+                    y[k] = excess[node] if kind[k] == PRV_ else -excess[node]
+                    if node < self._n_junctions:
+                        fixed_nodes.append(node)
+                        fixed_heads.append(self._elevation[node] + self._setting[k])
+
+        closed = status <= CLOSED
+        p[closed] = 1.0 / CBIG
+        y[closed] = q[closed]
+        return p, y, np.array(fixed_nodes, dtype=np.intp), np.array(fixed_heads, dtype=float)
+
+    def _flow_excess(self) -> np.ndarray:
+        """Returns the Nodes' inflow minus outflow and demand for the current flows."""
+        nn = self._n_nodes
+        q = self._flow
+        excess = np.bincount(self._end, q, nn) - np.bincount(self._start, q, nn)
+        excess[: self._n_junctions] -= self._node_outflow()
+        return excess
+
+    def _node_outflow(self) -> np.ndarray:
+        """Returns the Junctions' demand and emitter outflows."""
+        nj = self._n_junctions
+        outflow = self._demand.copy()
+        if len(self._pda_nodes):
+            outflow[self._pda_nodes] = self._demand_flow[self._pda_nodes]
+        if len(self._emitter_nodes):
+            outflow += np.bincount(self._emitter_nodes, self._emitter_flow, nj)
+        return outflow
+
+    def _emitter_coefficients(self) -> tuple[np.ndarray, np.ndarray]:
+        """Inverse head loss gradients and flow corrections of the emitters."""
+        q = self._emitter_flow
+        n = self._emitter_n
+        hgrad = n * self._emitter_k * np.abs(q) ** (n - 1.0)
+        small = hgrad < RQTOL
+        hgrad[small] = RQTOL
+        hloss = np.where(small, RQTOL * q, hgrad * q / n)
+        return 1.0 / hgrad, hloss / hgrad
+
+    def _demand_coefficients(self) -> tuple[np.ndarray, np.ndarray]:
+        """Inverse head loss gradients and flow corrections of pressure driven demands."""
+        nodes = self._pda_nodes
+        d = self._demand_flow[nodes]
+        dfull = self._demand[nodes]
+        n = self._pda_n
+        dp = self._dp
+        r = d / dfull
+        hgrad = np.empty_like(d)
+        hloss = np.empty_like(d)
+        lower = r <= 0.0
+        hgrad[lower] = CBIG
+        hloss[lower] = CBIG * d[lower]
+        upper = r >= 1.0
+        hgrad[upper] = CBIG
+        hloss[upper] = dp + CBIG * (d[upper] - dfull[upper])
+        partial = ~(lower | upper)
+        grad = n * dp * r[partial] ** (n - 1.0) / dfull[partial]
+        small = grad < RQTOL
+        grad[small] = RQTOL
+        hgrad[partial] = grad
+        hloss[partial] = np.where(small, RQTOL * d[partial], grad * d[partial] / n)
+        return 1.0 / hgrad, hloss / hgrad
+
+    def _solve_heads(self, p: np.ndarray, y: np.ndarray, fixed_nodes: np.ndarray, fixed_heads: np.ndarray,
+                     pe: np.ndarray, ye: np.ndarray, pd: np.ndarray, yd: np.ndarray):
+        """Assembles and solves the linear system for the Junctions' heads."""
+        nj, nn = self._n_junctions, self._n_nodes
+        start, end = self._start, self._end
+        q = self._flow
+        qy = q - y
+        known = self._fixed_head
+        rhs = np.bincount(end, qy, nn) - np.bincount(start, qy, nn)
+        rhs += np.bincount(start, p * known[end], nn) + np.bincount(end, p * known[start], nn)
+        diagonal = np.bincount(start, p, nn) + np.bincount(end, p, nn)
+        rhs = rhs[:nj]
+        diagonal = diagonal[:nj]
+        rhs -= self._demand
+        emitters = self._emitter_nodes
+        if len(emitters):
+            diagonal += np.bincount(emitters, pe, nj)
+            rhs += np.bincount(emitters, pe * self._elevation[emitters] - (self._emitter_flow - ye), nj)
+        nodes = self._pda_nodes
+        if len(nodes):
+            diagonal[nodes] += pd
+            rhs[nodes] += self._demand[nodes] + pd * (self._elevation[nodes] + self._pmin) - (
+                self._demand_flow[nodes] - yd
+            )
+        if len(fixed_nodes):
+            diagonal += np.bincount(fixed_nodes, np.full(len(fixed_nodes), CBIG), nj)
+            rhs += np.bincount(fixed_nodes, CBIG * fixed_heads, nj)
+
+        inner = self._inner
+        weights = np.concatenate([diagonal, -p[inner], -p[inner]])
+        self._matrix.data = np.bincount(self._positions, weights, self._nnz)
+        try:
+            return splu(self._matrix, permc_spec="MMD_AT_PLUS_A").solve(rhs)
+        except RuntimeError as e:
+            raise HydraulicEquationError("cannot solve network hydraulic equations", str(e)) from e
+
+    def _update_flows(self, p, y, pe, ye, pd, yd) -> float:
+        """Updates the flows with the new heads and returns the relative flow change."""
+        head = self._head
+        dq = y - p * (head[self._start] - head[self._end])
+        self._flow = self._flow - dq
+        qsum = np.abs(self._flow).sum()
+        dqsum = np.abs(dq).sum()
+        for k, curve, power, speed in self._pumps:
+            if curve is None and self._flow[k] < TINY:
+                self._flow[k] = TINY
+        emitters = self._emitter_nodes
+        if len(emitters):
+            dqe = ye - pe * (head[emitters] - self._elevation[emitters])
+            self._emitter_flow = self._emitter_flow - dqe
+            qsum += np.abs(self._emitter_flow).sum()
+            dqsum += np.abs(dqe).sum()
+        nodes = self._pda_nodes
+        if len(nodes):
+            dqd = yd - pd * (head[nodes] - self._elevation[nodes] - self._pmin)
+            self._demand_flow[nodes] -= dqd
+            qsum += np.abs(self._demand_flow[nodes]).sum()
+            dqsum += np.abs(dqd).sum()
+        return dqsum / qsum if qsum > self._accuracy else dqsum
+
+    def _valve_status(self) -> bool:
+        """Updates the status of PRVs and PSVs and returns True if any status changed."""
+        changed = False
+        head, q, status = self._head, self._flow, self._status
+        for k in self._valves:
+            kind = self._kind[k]
+            if kind not in (PRV_, PSV_) or self._fixed_closed[k]:
+                continue
+            n1, n2 = self._start[k], self._end[k]
+            h1, h2 = head[n1], head[n2]
+            hml = self._km[k] * q[k] ** 2
+            s = status[k]
+            new = s
+            if kind == PRV_:
+                hset = self._elevation[n2] + self._setting[k]
+                if s == ACTIVE:
+                    new = CLOSED if q[k] < -QTOL else OPEN if h1 - hml < hset - HTOL else ACTIVE
+                elif s == OPEN:
+                    new = CLOSED if q[k] < -QTOL else ACTIVE if h2 >= hset + HTOL else OPEN
+                elif s == CLOSED:
+                    if h1 >= hset + HTOL and h2 < hset - HTOL:
+                        new = ACTIVE
+                    elif h1 < hset - HTOL and h1 > h2 + HTOL:
+                        new = OPEN
+            else:
+                hset = self._elevation[n1] + self._setting[k]
+                if s == ACTIVE:
+                    new = CLOSED if q[k] < -QTOL else OPEN if h2 + hml > hset + HTOL else ACTIVE
+                elif s == OPEN:
+                    new = CLOSED if q[k] < -QTOL else ACTIVE if h1 < hset - HTOL else OPEN
+                elif s == CLOSED:
+                    if h2 > hset + HTOL and h1 > h2 + HTOL:
+                        new = OPEN
+                    elif h1 >= hset + HTOL and h1 > h2 + HTOL:
+                        new = ACTIVE
+            if new != s:
+                status[k] = new
+                changed = True
+        return changed
+
+    @staticmethod
+    def _cv_status(s: int, dh: float, q: float) -> int:
+        """Returns the status of a check valve for a head difference and flow."""
+        if abs(dh) > HTOL:
+            return CLOSED if dh < -HTOL or q < -QTOL else OPEN
+        return CLOSED if q < -QTOL else s
+
+    def _link_status(self) -> bool:
+        """Updates the status of check valves, Pumps, FCVs and Links connected to full or empty Tanks.
+
+        Returns:
+            True if any status changed
+
+        """
+        head, q, status, kind = self._head, self._flow, self._status, self._kind
+        old = status.copy()
+        dh = head[self._start] - head[self._end]
+        status[(status == XHEAD) | (status == TEMPCLOSED)] = OPEN
+        for k in np.flatnonzero(kind == CVPIPE):
+            if not self._fixed_closed[k]:
+                status[k] = self._cv_status(status[k], dh[k], q[k])
+        for k, curve, power, speed in self._pumps:
+            if status[k] >= OPEN and speed > 0.0:
+                hmax = np.inf if curve is None else speed**2 * curve.h0
+                if -dh[k] > hmax + HTOL:
+                    status[k] = XHEAD
+        for k in self._valves[kind[self._valves] == FCV_]:
+            if self._fixed_closed[k]:
+                continue
+            if dh[k] < -HTOL or q[k] < -QTOL:
+                status[k] = XFCV
+            elif old[k] == XFCV and q[k] >= self._setting[k]:
+                status[k] = ACTIVE
+            else:
+                status[k] = old[k]
+        for k in self._tank_links:
+            self._tank_status(k)
+        return bool((old != status).any())
+
+    def _tank_status(self, k: int):
+        """Temporarily closes a Link that would fill a full or drain an empty Tank."""
+        n1, n2 = self._start[k], self._end[k]
+        q = self._flow[k]
+        if n1 not in self._tanks:
+            n1, n2 = n2, n1
+            q = -q
+        hmin, hmax, overflow = self._tanks[n1]
+        head = self._head
+        h = head[n1] - head[n2]
+        pump = self._kind[k] == PUMP
+        if head[n1] >= hmax - HTOL and not overflow:
+            if pump:
+                if self._end[k] == n1:
+                    self._status[k] = TEMPCLOSED
+            elif self._cv_status(OPEN, h, q) == CLOSED:
+                self._status[k] = TEMPCLOSED
+        if head[n1] <= hmin + HTOL:
+            if pump:
+                if self._start[k] == n1:
+                    self._status[k] = TEMPCLOSED
+            elif self._cv_status(CLOSED, h, q) == OPEN:
+                self._status[k] = TEMPCLOSED
+
+    def _solve(self):
+        """Runs the Newton iterations of the Global Gradient Algorithm."""
+        options = self.network.options
+        trials = self.trials or options.trials
+        self._accuracy = self.accuracy or options.accuracy
+        nj = self._n_junctions
+        self._tank_links = [
+            k
+            for k in range(len(self._kind))
+            if (self._start[k] in self._tanks or self._end[k] in self._tanks) and not self._fixed_closed[k]
+        ]
+        empty = np.zeros(0)
+        next_check = CHECKFREQ
+        self.iterations = 0
+        self.converged = False
+        for iteration in range(1, trials + 1):
+            self.iterations = iteration
+            p, y, fixed_nodes, fixed_heads = self._coefficients()
+            pe, ye = self._emitter_coefficients() if len(self._emitter_nodes) else (empty, empty)
+            pd, yd = self._demand_coefficients() if len(self._pda_nodes) else (empty, empty)
+            if nj:
+                self._head[:nj] = self._solve_heads(p, y, fixed_nodes, fixed_heads, pe, ye, pd, yd)
+            error = self._update_flows(p, y, pe, ye, pd, yd)
+            valve_change = self._valve_status()
+            if error <= self._accuracy:
+                link_change = self._link_status()
+                if not (valve_change or link_change):
+                    self.converged = True
+                    break
+                next_check = iteration + CHECKFREQ
+            elif iteration <= MAXCHECK and iteration == next_check:
+                self._link_status()
+                next_check += CHECKFREQ
+        self.error = error if trials else 0.0
+        if not self.converged:
+            unbalanced = options.unbalanced
+            if isinstance(unbalanced, tuple):
+                unbalanced = unbalanced[0]
+            message = f"System unbalanced after {trials} trials (relative flow change {self.error:.3g})."
+            if str(unbalanced).upper() == "STOP":
+                raise UnbalancedSystemError(message)
+            logger.warning(message)
+
+    # results
+    def _report(self) -> SimulationReport:
+        """Creates a SimulationReport from the solution in the Network's units."""
+        f_flow, f_length = self._f_flow, self._f_length
+        nj, nn = self._n_junctions, self._n_nodes
+        head = self._head
+        closed = self._status <= CLOSED
+        q = self._flow.copy()
+        q[closed] = 0.0
+
+        demand = np.empty(nn)
+        demand[:nj] = self._node_outflow()
+        demand[nj:] = (np.bincount(self._end, q, nn) - np.bincount(self._start, q, nn))[nj:]
+        pressure = (head - self._elevation) * self._f_pressure
+        node_values = np.column_stack(
+            [self._elevation * f_length, demand * f_flow, head * f_length, pressure]
+        )
+        nodes = xr.DataArray(
+            node_values,
+            dims=("id", "vars"),
+            coords={"id": pd.Index(self._node_ids, dtype=object, name="id"), "vars": _NODE_VARS},
+        )
+
+        kind = self._kind
+        pipes = (kind == PIPE) | (kind == CVPIPE)
+        length = self._length
+        diameter = np.where(kind == PUMP, 0.0, self._diameter * self._f_diameter)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            area = pi * self._diameter**2 / 4.0
+            velocity = np.where(area > 0.0, np.abs(q) / area, 0.0) * f_length
+            velocity[kind == PUMP] = 0.0
+            dh = (head[self._start] - head[self._end]) * f_length
+            headloss = np.abs(dh)
+            headloss[pipes] = np.where(length[pipes] > 0.0, 1000.0 * headloss[pipes] / length[pipes], 0.0)
+            headloss[kind == PUMP] = -np.abs(dh[kind == PUMP])
+            headloss[closed] = 0.0
+        link_values = np.column_stack([length, diameter, q * f_flow, velocity, headloss])
+        links = xr.DataArray(
+            link_values,
+            dims=("id", "vars"),
+            coords={"id": pd.Index(self._link_ids, dtype=object, name="id"), "vars": _LINK_VARS},
+        )
+        return SimulationReport.from_arrays(nodes, links)
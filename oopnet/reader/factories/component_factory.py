@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from typing import TYPE_CHECKING
+from typing import Any, Type, TYPE_CHECKING
 
 from oopnet.elements.base import NetworkComponent
+from oopnet.elements.component_registry import ComponentNotExistingError
 from oopnet.elements.network_components import Node
 from oopnet.elements.system_operation import Pattern, Curve
 from oopnet.utils.getters.get_by_id import get_pattern, get_curve, get_node
@@ -70,3 +71,96 @@ class ComponentFactory(ReadFactory):
             else:
                 attr_dict[attr] = attr_cls(value)
         return attr_dict
+
+    @staticmethod
+    def _parse_column(
+        attr: str, values: tuple, attr_cls, network: Network, nodes: dict
+    ) -> list:
+        """Casts all values of a column to a specified type at once.
+
+        References to Patterns, Curves and Nodes are resolved with plain dictionary lookups. Missing values stay None.
+
+        Args:
+            attr: attribute name of the column
+            values: column values as read from the EPANET input file
+            attr_cls: attribute type
+            network: Network the references are resolved in
+            nodes: dictionary with the IDs of all Nodes in the Network as keys and the Nodes as values
+
+        Raises:
+            ComponentNotExistingError if a referenced Pattern, Curve or Node does not exist
+
+        Returns:
+            list of cast values
+        """
+        if attr_cls is None:
+            return [None] * len(values)
+        if attr_cls == str:
+            if attr == "id":
+                return list(values)
+            return [None if value is None else value.upper() for value in values]
+        if attr_cls == Pattern:
+            lookup = network._patterns
+        elif attr_cls == Curve:
+            lookup = dict(network._curves)
+            lookup["*"] = None  # Hack so it takes the positional argument when overflowing tank is given
+        elif attr_cls == Node:
+            lookup = nodes
+        elif None in values:
+            return [None if value is None else attr_cls(value) for value in values]
+        else:
+            return list(map(attr_cls, values))
+
+        column = []
+        for value in values:
+            if value is None:
+                column.append(None)
+            elif value in lookup:
+                column.append(lookup[value])
+            else:
+                raise ComponentNotExistingError(value)
+        return column
+
+    @classmethod
+    def _parse_block(
+        cls,
+        block: list,
+        network: Network,
+        attrs: list[str],
+        cls_list: list,
+        component_cls: Type[NetworkComponent],
+    ) -> list[Any]:
+        """Parses a whole block column by column and creates a NetworkComponent for every row.
+
+        Instead of casting and resolving the values row by row like _create_attr_dict, every attribute is handled for
+        the whole block at once. Missing values are skipped so that the NetworkComponent's default values are used.
+
+        Args:
+            block: EPANET input file block
+            network: Network the references are resolved in
+            attrs: list of attribute names of a NetworkComponent object
+            cls_list: list of attribute types
+            component_cls: NetworkComponent subclass to be created
+
+        Returns:
+            list of NetworkComponents
+        """
+        if not block:
+            return []
+        rows = [cls._pad_list(values["values"], len(attrs)) for values in block]
+        comments = [cls._read_comment(values) for values in block]
+        nodes = {}
+        if Node in cls_list:
+            for registry in network._nodes.values():
+                nodes.update(registry)
+        columns = [
+            cls._parse_column(attr, values, attr_cls, network, nodes)
+            for attr, values, attr_cls in zip(attrs, zip(*rows), cls_list)
+        ]
+        return [
+            component_cls(
+                **{attr: value for attr, value in zip(attrs, row) if value is not None},
+                comment=comment,
+            )
+            for row, comment in zip(zip(*columns), comments)
+        ]
@@ -1,8 +1,9 @@
 from __future__ import annotations
-import re
 import logging
-from typing import Optional, TYPE_CHECKING
+from collections import Counter
+from typing import Iterable, Iterator, Optional, TYPE_CHECKING
 
+from oopnet.reader.decorators import ReaderDecorator
 from oopnet.reader.unit_converter.convert import convert
 from oopnet.reader.module_reader import list_section_reader_callables
 from oopnet.reader.reading_modules import (
@@ -20,6 +21,73 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _normalise(line: str) -> str:
+    """Strips a line and replaces all whitespace sequences with single spaces."""
+    return " ".join(line.split())
+
+
+def _tokenise(line: str) -> dict:
+    """Splits a normalised line into its values and comment.
+
+    Args:
+      line: normalised EPANET input file line
+
+    Returns:
+        dictionary with the line's values and comment (None if the line has no comment)
+
+    """
+    parts = line.split(";")
+    return {
+        "values": parts[0].strip().split(" "),
+        "comments": parts[1].strip() if len(parts) == 2 else None,
+    }
+
+
+def iter_sections(lines: Iterable[str]) -> Iterator[tuple[str, list[str]]]:
+    """Splits the lines of an EPANET input file into sections one section at a time.
+
+    Lines before the first section header belong to the TITLE section. Empty lines and comment lines are skipped, all
+    other lines are normalised but not tokenised.
+
+    Args:
+      lines: EPANET input file lines, e.g. an open file
+
+    Returns:
+        generator yielding section names and the section's normalised lines
+
+    """
+    name = "TITLE"
+    section = []
+    for line in lines:
+        line = _normalise(line)
+        if not line or line.startswith(";"):
+            continue
+        if line.startswith("["):
+            yield name, section
+            name = line[1:-1]
+            section = []
+        else:
+            section.append(line)
+    yield name, section
+
+
+def _section_names(lines: Iterable[str]) -> Counter:
+    """Counts the occurrences of all section names in an EPANET input file.
+
+    Args:
+      lines: EPANET input file lines
+
+    Returns:
+        Counter with section names as keys
+
+    """
+    names = Counter(["TITLE"])
+    for line in lines:
+        if line.lstrip().startswith("["):
+            names[_normalise(line)[1:-1]] += 1
+    return names
+
+
 def filesplitter(content: list[str]) -> dict[str, list]:
     """Reads an EPANET input file and splits the content into blocks.
 
@@ -30,24 +98,51 @@ def filesplitter(content: list[str]) -> dict[str, list]:
         blocks
 
     """
+    return {
+        name: [_tokenise(line) for line in section]
+        for name, section in iter_sections(content)
+    }
+
 
-    blocks = {}
-    blockname = "TITLE"
-    blocks[blockname] = []
-    for line in content:
-        line = re.sub(r"\s+", " ", line.replace("\n", "").strip())
-        if line and not line.startswith(";"):
-            if line.startswith("["):
-                blockname = line[1:-1]
-                blocks[blockname] = []
-            else:
-                vals = {"values": line.split(";")[0].strip().split(" ")}
-                if len(line.split(";")) == 2:
-                    vals["comments"] = line.split(";")[1].strip()
-                else:
-                    vals["comments"] = None
-                blocks[blockname].append(vals)
-    return blocks
+def _read_sections(
+    network: Network,
+    sections: Iterator[tuple[str, list[str]]],
+    names: Counter,
+    readers: list[ReaderDecorator],
+):
+    """Dispatches sections to their readers as soon as all sections that have to be read before them have been read.
+
+    Sections are read in the order of their readers' priorities. Sections that are encountered too early are buffered
+    as normalised lines and only tokenised when they are read. If a section occurs more than once, only its last
+    occurrence is read.
+
+    Args:
+      network: OOPNET network object the sections are read into
+      sections: generator yielding section names and their normalised lines
+      names: occurrences of all section names in the file
+      readers: section readers
+
+    """
+    order = [
+        f
+        for f in sorted(readers, key=lambda x: x.priority)
+        if f.sectionname in names
+    ]
+    readers = {f.sectionname: f for f in order}
+    buffered: dict[str, list[str]] = {}
+    position = 0
+
+    for name, section in sections:
+        names[name] -= 1
+        if name not in readers or names[name]:
+            continue
+        buffered[name] = section
+        while position < len(order) and order[position].sectionname in buffered:
+            f = order[position]
+            f.readerfunction(
+                network, [_tokenise(line) for line in buffered.pop(f.sectionname)]
+            )
+            position += 1
 
 
 @logging_decorator(logger)
@@ -56,6 +151,10 @@ def read(
 ) -> Network:
     """Function reads an EPANET input file and returns a network object.
 
+    The file is streamed line by line and every section is read as soon as all sections it depends on have been read.
+    Sections that have to wait are kept in a compact form until then, so that the whole file is never held in memory
+    as tokenised lines.
+
     Args:
       filename: filename of the EPANET input file
       content: EPANET input file content as string
@@ -77,21 +176,19 @@ def read(
     if filename is not None:
         logger.info(f"Reading model from {filename!r}")
         with open(filename, "r") as fid:
-            content = fid.readlines()
+            names = _section_names(fid)
+            fid.seek(0)
+            _read_sections(network, iter_sections(fid), names, all_functions)
     elif content is not None:
         logger.info("Reading model from passed string")
         content = content.splitlines()
+        names = _section_names(content)
+        _read_sections(network, iter_sections(content), names, all_functions)
     else:
         raise ValueError(
             'Either one of the arguments "filename" or "content" have to be provided.'
         )
 
-    blocks = filesplitter(content)
-    newlist = sorted(all_functions, key=lambda x: x.priority)
-    for f in newlist:
-        if f.sectionname in list(blocks.keys()):
-            f.readerfunction(network, blocks[f.sectionname])
-
     # Convert network to SI units
     convert(network)
 
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 
 from oopnet.reader.decorators import section_reader
 from oopnet.reader.factories.component_factory import ComponentFactory
-from oopnet.reader.factories.base import InvalidValveTypeError
+from oopnet.reader.factories.base import InvalidValveTypeError, LengthExceededError
 from oopnet.elements.system_operation import Pattern, Curve
 from oopnet.elements.network_components import (
     Tank,
@@ -32,12 +32,10 @@ from oopnet.utils.getters.element_lists import (
     get_pumps,
 )
 from oopnet.utils.adders.add_element import (
-    add_junction,
-    add_tank,
-    add_reservoir,
-    add_pipe,
     add_pump,
     add_valve,
+    add_nodes,
+    add_links,
 )
 
 if TYPE_CHECKING:
@@ -87,17 +85,18 @@ class JunctionFactory(ComponentFactory):
 
     def __new__(cls, network: Network, block: dict):
         logger.debug("Reading Junctions section")
-        for values in block:
-            j = cls._parse_single(values, network)
-            add_junction(network, j)
+        add_nodes(network, cls._parse_block(block, network, *cls._attributes(), Junction))
         logger.debug(f"Added {len(get_junctions(network))} Junctions")
 
+    @staticmethod
+    def _attributes() -> tuple[list[str], list]:
+        return ["id", "elevation", "demand", "demandpattern"], [str, float, float, Pattern]
+
     @classmethod
     def _parse_single(cls, values, network) -> Junction:
         comment = cls._read_comment(values)
         attr_values = cls._pad_list(values["values"], 4)
-        attr_names = ["id", "elevation", "demand", "demandpattern"]
-        attr_cls = [str, float, float, Pattern]
+        attr_names, attr_cls = cls._attributes()
         attr_dict = cls._create_attr_dict(attr_names, attr_values, attr_cls, network)
         return Junction(**attr_dict, comment=comment)
 
@@ -108,17 +107,18 @@ class ReservoirFactory(ComponentFactory):
 
     def __new__(cls, network: Network, block: dict):
         logger.debug("Reading Reservoirs section")
-        for values in block:
-            r = cls._parse_single(values, network)
-            add_reservoir(network, r)
+        add_nodes(network, cls._parse_block(block, network, *cls._attributes(), Reservoir))
         logger.debug(f"Added {len(get_reservoirs(network))} Reservoirs")
 
+    @staticmethod
+    def _attributes() -> tuple[list[str], list]:
+        return ["id", "head", "headpattern"], [str, float, Pattern]
+
     @classmethod
     def _parse_single(cls, values, network) -> Reservoir:
         comment = cls._read_comment(values)
         attr_values = cls._pad_list(values["values"], 3)
-        attr_names = ["id", "head", "headpattern"]
-        attr_cls = [str, float, Pattern]
+        attr_names, attr_cls = cls._attributes()
         attr_dict = cls._create_attr_dict(attr_names, attr_values, attr_cls, network)
         return Reservoir(**attr_dict, comment=comment)
 
@@ -129,22 +129,11 @@ class TankFactory(ComponentFactory):
 
     def __new__(cls, network: Network, block: dict):
         logger.debug("Reading Tanks section")
-        for values in block:
-            t = cls._parse_single(values, network)
-            add_tank(network, t)
+        add_nodes(network, cls._parse_block(block, network, *cls._attributes(), Tank))
         logger.debug(f"Added {len(get_tanks(network))} Tanks")
 
-    @classmethod
-    def _parse_single(cls, values: dict, network: Network) -> Tank:
-        comment = cls._read_comment(values)
-        try:  # Hack to make it receive overflowing tanks
-            attr_values = cls._pad_list(values["values"], 8)
-            attr_values.append(None)
-            
-        except:
-            print('Reading tank with overflow')
-            attr_values = cls._pad_list(values["values"], 9)
-            
+    @staticmethod
+    def _attributes() -> tuple[list[str], list]:
         attr_names = [
             "id",
             "elevation",
@@ -157,7 +146,19 @@ class TankFactory(ComponentFactory):
             "overflow",
         ]
         attr_cls = [str, float, float, float, float, float, float, Curve, str]
-        
+        return attr_names, attr_cls
+
+    @classmethod
+    def _parse_single(cls, values: dict, network: Network) -> Tank:
+        comment = cls._read_comment(values)
+        try:  # Hack to make it receive overflowing tanks
+            attr_values = cls._pad_list(values["values"], 8)
+            attr_values.append(None)
+        except LengthExceededError:
+            logger.debug("Reading Tank with overflow")
+            attr_values = cls._pad_list(values["values"], 9)
+
+        attr_names, attr_cls = cls._attributes()
         attr_dict = cls._create_attr_dict(attr_names, attr_values, attr_cls, network)
         return Tank(**attr_dict, comment=comment)
 
@@ -168,15 +169,11 @@ class PipeFactory(ComponentFactory):
 
     def __new__(cls, network: Network, block: dict):
         logger.debug("Reading Pipes section")
-        for values in block:
-            p = cls._parse_single(values, network)
-            add_pipe(network, p)
+        add_links(network, cls._parse_block(block, network, *cls._attributes(), Pipe))
         logger.debug(f"Added {len(get_pipes(network))} Pipes")
 
-    @classmethod
-    def _parse_single(cls, values: dict, network: Network) -> Pipe:
-        comment = cls._read_comment(values)
-        attr_values = cls._pad_list(values["values"], 8)
+    @staticmethod
+    def _attributes() -> tuple[list[str], list]:
         attr_names = [
             "id",
             "startnode",
@@ -188,6 +185,13 @@ class PipeFactory(ComponentFactory):
             "status",
         ]
         attr_cls = [str, Node, Node, float, float, float, float, str]
+        return attr_names, attr_cls
+
+    @classmethod
+    def _parse_single(cls, values: dict, network: Network) -> Pipe:
+        comment = cls._read_comment(values)
+        attr_values = cls._pad_list(values["values"], 8)
+        attr_names, attr_cls = cls._attributes()
         attr_dict = cls._create_attr_dict(attr_names, attr_values, attr_cls, network)
         return Pipe(**attr_dict, comment=comment)
 
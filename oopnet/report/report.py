@@ -1,3 +1,4 @@
+from __future__ import annotations
 import datetime
 from typing import Optional, Union, Type, Callable
 import logging
@@ -5,7 +6,7 @@ import logging
 import pandas as pd
 from xarray import DataArray
 
-from oopnet.simulator.binaryfile_reader import BinaryFileReader
+from oopnet.simulator.binaryfile_reader import BinaryFileReader, LazyBinaryFileReader
 from oopnet.simulator.reportfile_reader import ReportFileReader
 
 logger = logging.getLogger(__name__)
@@ -28,7 +29,7 @@ class SimulationReport:
         filename: str,
         startdatetime: Optional[datetime.datetime] = None,
         reader: Union[
-            Type[BinaryFileReader], Type[ReportFileReader]
+            Type[BinaryFileReader], Type[LazyBinaryFileReader], Type[ReportFileReader]
         ] = ReportFileReader,
     ):
         """SimulationReport init method.
@@ -36,12 +37,29 @@ class SimulationReport:
         Args:
             filename: name of EPANET input file be simulated
             startdatetime:
-            reader: specifies whether the report or the binary file created by EPANET are read
+            reader: specifies whether the report or the binary file created by EPANET are read. With
+                LazyBinaryFileReader, results are only loaded from the binary file when they are accessed.
 
         """
         logger.debug("Creating report.")
         self.nodes, self.links = reader(filename, startdatetime)
 
+    @classmethod
+    def from_arrays(cls, nodes: DataArray, links: DataArray) -> SimulationReport:
+        """Creates a SimulationReport from Node and Link results that have already been read.
+
+        Args:
+            nodes: Node results
+            links: Link results
+
+        Returns:
+            SimulationReport containing the results
+
+        """
+        report = cls.__new__(cls)
+        report.nodes, report.links = nodes, links
+        return report
+
     @staticmethod
     def _get(
         array: DataArray,
@@ -36,3 +36,9 @@ from .simulation_errors import (
     ResultFileSavingError,
     ReportFileSavingError,
 )
+from .binaryfile_reader import (
+    BinaryFileReader,
+    LazyBinaryFileReader,
+    InvalidBinaryFileError,
+)
+from .reportfile_reader import ReportFileReader
@@ -0,0 +1,201 @@
+from __future__ import annotations
+import datetime
+import logging
+import os
+import shutil
+import tempfile
+from multiprocessing import Pool
+from typing import Any, Iterable, Iterator, Optional, Type, Union, TYPE_CHECKING
+
+import numpy as np
+import xarray as xr
+
+from oopnet.elements.component_registry import ComponentNotExistingError
+from oopnet.report.report import SimulationReport
+from oopnet.simulator.binaryfile_reader import BinaryFileReader, LazyBinaryFileReader
+from oopnet.simulator.epanet2 import ModelSimulator
+from oopnet.simulator.reportfile_reader import ReportFileReader
+from oopnet.simulator.scratch import ram_directory
+
+if TYPE_CHECKING:
+    from oopnet.elements.network import Network
+    from oopnet.elements.base import NetworkComponent
+
+logger = logging.getLogger(__name__)
+
+Modification = dict[str, dict[str, Any]]
+Coordinates = tuple[tuple[str, ...], dict[str, np.ndarray]]
+
+
+def _get_component(network: Network, id: str, attribute: str) -> NetworkComponent:
+    """Gets the Node or Link with a specific ID that has the attribute to be modified.
+
+    Args:
+      network: OOPNET network object
+      id: ID of the Node or Link
+      attribute: name of the attribute
+
+    Raises:
+        ComponentNotExistingError if neither a Node nor a Link with the ID and attribute exist
+
+    Returns:
+      Node or Link with the ID
+
+    """
+    for registry in (network._nodes, network._links):
+        try:
+            component = registry.get_by_id(id)
+        except ComponentNotExistingError:
+            continue
+        if hasattr(component, attribute):
+            return component
+    raise ComponentNotExistingError(id)
+
+
+def _apply_modification(network: Network, modification: Modification, previous: Modification):
+    """Applies a modification to a network and stores the previous values.
+
+    Applying the previous values afterwards restores the network's original state.
+
+    Args:
+      network: OOPNET network object to be modified
+      modification: dictionary with attribute names as keys and dictionaries mapping Node and Link IDs to new values
+      previous: dictionary the replaced values are written to
+
+    """
+    for attribute, values in modification.items():
+        for id, value in values.items():
+            component = _get_component(network, id, attribute)
+            previous.setdefault(attribute, {})[id] = getattr(component, attribute)
+            setattr(component, attribute, value)
+
+
+class _BatchWorker:
+    """State of a batch simulation worker process.
+
+    Attributes:
+      network: base network that modifications are applied to
+      path: scratch directory of the worker process
+      reader: reader used for parsing the simulation results
+      startdatetime: start of the simulation
+      coordinates_sent: True if the result coordinates were already sent to the main process
+
+    """
+
+    def __init__(
+        self,
+        network: Network,
+        path: str,
+        reader: Union[
+            Type[BinaryFileReader], Type[LazyBinaryFileReader], Type[ReportFileReader]
+        ],
+        startdatetime: Optional[datetime.datetime],
+    ):
+        self.network = network
+        self.path = os.path.join(path, str(os.getpid()))
+        self.reader = reader
+        self.startdatetime = startdatetime
+        self.coordinates_sent = False
+
+
+_worker: Optional[_BatchWorker] = None
+
+
+def _init_worker(*args):
+    global _worker
+    _worker = _BatchWorker(*args)
+
+
+def _coordinates(array: xr.DataArray) -> Coordinates:
+    return array.dims, {name: coord.values for name, coord in array.coords.items()}
+
+
+def _run_scenario(
+    modification: Modification,
+) -> tuple[Optional[tuple[Coordinates, Coordinates]], np.ndarray, np.ndarray]:
+    """Simulates the worker's base network with a modification applied.
+
+    Args:
+      modification: modification to be applied before simulating the network
+
+    Returns:
+        the Node and Link result coordinates, if they haven't been sent to the main process yet, and the Node and Link
+        result values
+
+    """
+    network = _worker.network
+    previous = {}
+    try:
+        _apply_modification(network, modification, previous)
+        rpt = ModelSimulator(
+            thing=network,
+            path=_worker.path,
+            startdatetime=_worker.startdatetime,
+            reader=_worker.reader,
+        ).run()
+    finally:
+        _apply_modification(network, previous, {})
+
+    coordinates = None
+    if not _worker.coordinates_sent:
+        coordinates = (_coordinates(rpt.nodes), _coordinates(rpt.links))
+        _worker.coordinates_sent = True
+    return coordinates, rpt.nodes.values, rpt.links.values
+
+
+def run_batch(
+    network: Network,
+    modifications: Iterable[Modification],
+    workers: Optional[int] = None,
+    startdatetime: Optional[datetime.datetime] = None,
+    reader: Union[
+        Type[BinaryFileReader], Type[LazyBinaryFileReader], Type[ReportFileReader]
+    ] = BinaryFileReader,
+    chunksize: int = 1,
+) -> Iterator[SimulationReport]:
+    """Simulates modified versions of a network in parallel.
+
+    The network is sent to every worker process only once. For every simulation, only the modification is sent to a
+    worker, which applies it to its copy of the network, runs EPANET in its own scratch directory on a RAM-backed file
+    system and restores the network's original state afterwards. The results are sent back as plain arrays.
+
+    Modifications are dictionaries with attribute names as keys and dictionaries mapping Node and Link IDs to the new
+    attribute values as values, e.g. ``{'demand': {'J-01': 1.2, 'J-02': 0.8}, 'diameter': {'P-01': 300.0}}``.
+
+    Args:
+      network: OOPNET network object to be simulated
+      modifications: modifications to be simulated
+      workers: number of worker processes. If None, the number of CPUs is used.
+      startdatetime: start of the simulations
+      reader: reader used for parsing the simulation results
+      chunksize: number of modifications sent to a worker at once
+
+    Raises:
+        ComponentNotExistingError if a modification references a Node or Link that does not exist or lacks the
+        attribute to be modified. EPANETSimulationError if a simulation fails.
+
+    Returns:
+        generator yielding a SimulationReport for every modification in the order of the modifications
+
+    """
+    path = tempfile.mkdtemp(prefix="oopnet_batch_", dir=ram_directory())
+    coordinates = None
+    try:
+        with Pool(
+            processes=workers,
+            initializer=_init_worker,
+            initargs=(network, path, reader, startdatetime),
+        ) as pool:
+            for new_coordinates, nodes, links in pool.imap(
+                _run_scenario, modifications, chunksize=chunksize
+            ):
+                # every worker sends the coordinates with its first result, which are identical for all modifications
+                if new_coordinates is not None:
+                    coordinates = new_coordinates
+                (node_dims, node_coords), (link_dims, link_coords) = coordinates
+                yield SimulationReport.from_arrays(
+                    nodes=xr.DataArray(nodes, dims=node_dims, coords=node_coords),
+                    links=xr.DataArray(links, dims=link_dims, coords=link_coords),
+                )
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
@@ -1,30 +1,380 @@
+from typing import Optional, Union
+import datetime
 import logging
+import os
+import weakref
+
 import numpy as np
+import pandas as pd
+import xarray as xr
+from xarray import DataArray, Dataset
+from xarray.backends import BackendArray
+from xarray.core import indexing
+
+from oopnet.utils.oopnet_logging import logging_decorator
 
 logger = logging.getLogger(__name__)
 
+MAGIC_NUMBER = 516114521
+ID_DTYPE = "S32"
+NODE_VARS = ["Demand", "Head", "Pressure", "Quality"]
+LINK_VARS = [
+    "Flow",
+    "Velocity",
+    "Headloss",
+    "Quality",
+    "Status",
+    "Setting",
+    "Reaction",
+    "F-Factor",
+]
 
-class BinaryFileReader:
-    def __new__(cls, filename: str, *args, **kwargs):
+
+class InvalidBinaryFileError(Exception):
+    """Raised when a file is not a complete EPANET binary output file."""
+
+    def __init__(self, filename: str, reason: str):
+        super().__init__(
+            f"{filename!r} is not a valid EPANET binary output file: {reason}"
+        )
+
+
+def _decode_ids(raw: np.ndarray) -> list[str]:
+    """Converts fixed length, null terminated EPANET ID labels to strings.
+
+    Args:
+      raw: array of bytes objects
+
+    Returns:
+      list of IDs
+
+    """
+    return [x.split(b"\x00", 1)[0].decode() for x in raw]
+
+
+class BinaryLayout:
+    """Describes the sections of an EPANET binary output file.
+
+    The binary output file consists of a prolog, an energy use section, the dynamic results for every reporting period
+    and an epilog. The layout is derived from the prolog and the epilog and is used to locate the different sections
+    in the file without reading the file completely.
+
+    Attributes:
+      filename: name of the binary output file
+      version: EPANET version that created the file
+      nnodes: number of Nodes
+      ntanks: number of Tanks and Reservoirs
+      nlinks: number of Links
+      npumps: number of Pumps
+      nvalves: number of Valves
+      reportstart: reporting start time in seconds
+      reportstep: reporting time step in seconds
+      duration: simulation duration in seconds
+      nperiods: number of reporting periods
+      warning: warning flag (0 if no warnings were issued)
+      node_ids: list of Node IDs
+      link_ids: list of Link IDs
+      elevation: Node elevations
+      length: Link lengths
+      diameter: Link diameters
+      results_offset: offset of the dynamic results section in bytes
+
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        size = os.path.getsize(filename)
         with open(filename, "rb") as file:
             prolog = np.fromfile(file, dtype=np.int32, count=15)
-            cls._read_prolog(prolog)
-
-    @classmethod
-    def _read_prolog(cls, prolog):
-        print(prolog)
-        magic = prolog[0]
-        version = prolog[1]
-        nnodes = prolog[2]
-        ntanks = prolog[3]
-        nlinks = prolog[4]
-        npumps = prolog[5]
-        nvalve = prolog[6]
-        # wqopt = QualType(prolog[7])
-        # srctrace = prolog[8]
-        # flowunits = FlowUnits(prolog[9])
-        # presunits = PressureUnits(prolog[10])
-        # statsflag = StatisticsType(prolog[11])
-        # reportstart = prolog[12]
-        # reportstep = prolog[13]
-        # duration = prolog[14]
+            if len(prolog) < 15 or prolog[0] != MAGIC_NUMBER:
+                raise InvalidBinaryFileError(filename, "missing prolog")
+            self._read_prolog(prolog)
+            self._read_static(file)
+            self.results_offset = file.tell() + self.npumps * 28 + 4
+            file.seek(size - 12)
+            epilog = np.fromfile(file, dtype=np.int32, count=3)
+        if len(epilog) < 3 or epilog[2] != MAGIC_NUMBER:
+            raise InvalidBinaryFileError(filename, "missing epilog")
+        self.nperiods, self.warning = int(epilog[0]), int(epilog[1])
+        expected = self.results_offset + self.nperiods * self.period_size * 4 + 28
+        if expected != size:
+            raise InvalidBinaryFileError(
+                filename, f"expected {expected} bytes but found {size}"
+            )
+
+    def _read_prolog(self, prolog: np.ndarray):
+        logger.debug(f"Read binary file prolog {prolog}")
+        (
+            _,
+            self.version,
+            self.nnodes,
+            self.ntanks,
+            self.nlinks,
+            self.npumps,
+            self.nvalves,
+        ) = (int(x) for x in prolog[:7])
+        self.reportstart, self.reportstep, self.duration = (
+            int(x) for x in prolog[12:15]
+        )
+
+    def _read_static(self, file):
+        # title lines, input and report file names and chemical name and units
+        file.seek(3 * 80 + 2 * 260 + 2 * 32, os.SEEK_CUR)
+        self.node_ids = _decode_ids(
+            np.fromfile(file, dtype=ID_DTYPE, count=self.nnodes)
+        )
+        self.link_ids = _decode_ids(
+            np.fromfile(file, dtype=ID_DTYPE, count=self.nlinks)
+        )
+        # start nodes, end nodes and types of Links, Tank indices and cross-sectional areas
+        file.seek((3 * self.nlinks + 2 * self.ntanks) * 4, os.SEEK_CUR)
+        self.elevation = np.fromfile(file, dtype=np.float32, count=self.nnodes)
+        self.length = np.fromfile(file, dtype=np.float32, count=self.nlinks)
+        self.diameter = np.fromfile(file, dtype=np.float32, count=self.nlinks)
+
+    @property
+    def period_size(self) -> int:
+        """Number of values stored per reporting period."""
+        return len(NODE_VARS) * self.nnodes + len(LINK_VARS) * self.nlinks
+
+    def times(
+        self, startdatetime: Optional[datetime.datetime] = None
+    ) -> Optional[pd.DatetimeIndex]:
+        """Returns the reporting times or None for steady state simulations.
+
+        Args:
+          startdatetime: start of the simulation (Default value = None)
+
+        """
+        if self.duration == 0:
+            return None
+        if startdatetime is None:
+            startdatetime = datetime.datetime(year=2016, month=1, day=1)
+        start = startdatetime + datetime.timedelta(seconds=self.reportstart)
+        return pd.date_range(
+            start=start,
+            periods=self.nperiods,
+            freq=pd.Timedelta(seconds=self.reportstep),
+        )
+
+    def results(self, mode: str = "r") -> np.memmap:
+        """Maps the dynamic results section into memory.
+
+        Args:
+          mode: memory map mode (Default value = "r")
+
+        Returns:
+          array with one row per reporting period
+
+        """
+        return np.memmap(
+            self.filename,
+            dtype=np.float32,
+            mode=mode,
+            offset=self.results_offset,
+            shape=(self.nperiods, self.period_size),
+        )
+
+    def split_results(self, results: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Splits the dynamic results into Node and Link results without copying them.
+
+        Args:
+          results: dynamic results as returned by results()
+
+        Returns:
+          Node and Link results with shape (time, vars, id)
+
+        """
+        nnodes = len(NODE_VARS) * self.nnodes
+        node_values = results[:, :nnodes].reshape(
+            self.nperiods, len(NODE_VARS), self.nnodes
+        )
+        link_values = results[:, nnodes:].reshape(
+            self.nperiods, len(LINK_VARS), self.nlinks
+        )
+        return node_values, link_values
+
+    @property
+    def node_static(self) -> list[tuple[str, np.ndarray]]:
+        """Node properties that do not change over time."""
+        return [("Elevation", self.elevation)]
+
+    @property
+    def link_static(self) -> list[tuple[str, np.ndarray]]:
+        """Link properties that do not change over time."""
+        return [("Length", self.length), ("Diameter", self.diameter)]
+
+
+def _to_xarray(
+    values: np.ndarray,
+    static: list[tuple[str, np.ndarray]],
+    ids: list[str],
+    variables: list[str],
+    times: Optional[pd.DatetimeIndex],
+) -> xr.DataArray:
+    """Combines static properties and dynamic results into a DataArray.
+
+    Args:
+      values: dynamic results with shape (time, vars, id)
+      static: list of tuples with the variable name and the values for every element
+      ids: element IDs
+      variables: names of the dynamic variables
+      times: reporting times
+
+    """
+    nperiods = values.shape[0]
+    data = np.empty(
+        (nperiods, len(ids), len(static) + len(variables)), dtype=np.float64
+    )
+    for index, (_, array) in enumerate(static):
+        data[:, :, index] = array
+    data[:, :, len(static) :] = values.transpose(0, 2, 1)
+    coords = {"id": ids, "vars": [name for name, _ in static] + variables}
+    if times is None:
+        return xr.DataArray(data[0], coords=coords, dims=("id", "vars"))
+    coords["time"] = times
+    return xr.DataArray(data, coords=coords, dims=("time", "id", "vars"))
+
+
+@logging_decorator(logger)
+class BinaryFileReader:
+    """Reads the node and link results from an EPANET binary output file.
+
+    In contrast to the report file, the binary file contains the results of all Nodes and Links at full single
+    precision, independent of the Network's report settings.
+
+    """
+
+    def __new__(
+        cls, filename: str, startdatetime: Optional[datetime.datetime] = None
+    ) -> tuple[Union[DataArray, Dataset, None], Union[DataArray, Dataset, None]]:
+        logger.debug("Reading Binary File")
+        layout = BinaryLayout(filename)
+        results = layout.results()
+        node_values, link_values = layout.split_results(results)
+        times = layout.times(startdatetime)
+        nodes = _to_xarray(
+            node_values, layout.node_static, layout.node_ids, NODE_VARS, times
+        )
+        links = _to_xarray(
+            link_values, layout.link_static, layout.link_ids, LINK_VARS, times
+        )
+        del results, node_values, link_values
+        return nodes, links
+
+
+class BinaryResultsArray(BackendArray):
+    """Lazily indexed Node or Link results stored in an EPANET binary output file.
+
+    The binary output file is memory-mapped only while a selection is loaded, so that only the requested variables,
+    elements and reporting periods are read from disk.
+
+    Attributes:
+      layout: layout of the binary output file
+      kind: either "nodes" or "links"
+      shape: shape of the array, either (time, id, vars) or (id, vars) for steady state simulations
+      dtype: data type of the array
+
+    """
+
+    def __init__(self, layout: BinaryLayout, kind: str):
+        self.layout = layout
+        self.kind = kind
+        nelements = layout.nnodes if kind == "nodes" else layout.nlinks
+        nvars = len(self._static) + len(self._variables)
+        self._full_shape = (layout.nperiods, nelements, nvars)
+        self.shape = self._full_shape if layout.duration else self._full_shape[1:]
+        self.dtype = np.dtype(np.float64)
+
+    @property
+    def _static(self) -> list[tuple[str, np.ndarray]]:
+        return self.layout.node_static if self.kind == "nodes" else self.layout.link_static
+
+    @property
+    def _variables(self) -> list[str]:
+        return NODE_VARS if self.kind == "nodes" else LINK_VARS
+
+    def __getitem__(self, key: indexing.ExplicitIndexer) -> np.ndarray:
+        return indexing.explicit_indexing_adapter(
+            key, self.shape, indexing.IndexingSupport.OUTER, self._raw_indexing_method
+        )
+
+    def _raw_indexing_method(self, key: tuple) -> np.ndarray:
+        if len(key) < len(self._full_shape):
+            key = (0,) + tuple(key)
+        times, ids, variables = (
+            np.atleast_1d(np.arange(n)[k]) for n, k in zip(self._full_shape, key)
+        )
+        nstatic = len(self._static)
+        data = np.empty((len(times), len(ids), len(variables)), dtype=self.dtype)
+        results = self.layout.results()
+        node_values, link_values = self.layout.split_results(results)
+        values = node_values if self.kind == "nodes" else link_values
+        for index, var in enumerate(variables):
+            if var < nstatic:
+                data[:, :, index] = self._static[var][1][ids]
+            else:
+                data[:, :, index] = values[:, var - nstatic, :][np.ix_(times, ids)]
+        del results, node_values, link_values, values
+        return data[tuple(0 if isinstance(k, (int, np.integer)) else slice(None) for k in key)]
+
+
+def _lazy_xarray(
+    layout: BinaryLayout,
+    kind: str,
+    ids: list[str],
+    static: list[tuple[str, np.ndarray]],
+    variables: list[str],
+    times: Optional[pd.DatetimeIndex],
+) -> xr.DataArray:
+    """Creates a DataArray that loads its values from the binary output file on access."""
+    data = indexing.LazilyIndexedArray(BinaryResultsArray(layout, kind))
+    dims = ("id", "vars") if times is None else ("time", "id", "vars")
+    coords = {"id": ids, "vars": [name for name, _ in static] + variables}
+    if times is not None:
+        coords["time"] = times
+    # DataArrays created from a Variable load its data, hence the detour via a Dataset
+    dataset = xr.Dataset({kind: xr.Variable(dims, data)}, coords=coords)
+    return dataset[kind].rename(None)
+
+
+def _remove_file(filename: str):
+    """Removes a file if it still exists."""
+    if os.path.isfile(filename):
+        os.remove(filename)
+
+
+@logging_decorator(logger)
+class LazyBinaryFileReader:
+    """Maps the node and link results of an EPANET binary output file without loading them into memory.
+
+    The returned DataArrays only read the selected part of the binary output file when their values are accessed,
+    e.g. a single variable like pressure or the time series of a single element. This allows for working with
+    extended period simulations of large models whose results would not fit into memory. The binary output file
+    has to exist as long as the returned DataArrays are used.
+
+    Args:
+      filename: name of the binary output file
+      startdatetime: start of the simulation
+      delete: if True, the binary output file is deleted as soon as the returned DataArrays are no longer used
+
+    """
+
+    def __new__(
+        cls,
+        filename: str,
+        startdatetime: Optional[datetime.datetime] = None,
+        delete: bool = False,
+    ) -> tuple[DataArray, DataArray]:
+        logger.debug("Mapping Binary File")
+        layout = BinaryLayout(filename)
+        if delete:
+            weakref.finalize(layout, _remove_file, filename)
+        times = layout.times(startdatetime)
+        nodes = _lazy_xarray(
+            layout, "nodes", layout.node_ids, layout.node_static, NODE_VARS, times
+        )
+        links = _lazy_xarray(
+            layout, "links", layout.link_ids, layout.link_static, LINK_VARS, times
+        )
+        return nodes, links
@@ -0,0 +1,273 @@
+from __future__ import annotations
+import datetime
+import hashlib
+import logging
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Type, Union
+
+import numpy as np
+import xarray as xr
+
+from oopnet.report.report import SimulationReport
+from oopnet.simulator.binaryfile_reader import BinaryFileReader, LazyBinaryFileReader
+from oopnet.simulator.reportfile_reader import ReportFileReader
+
+logger = logging.getLogger(__name__)
+
+# changing the layout of the cache files requires a new version, old files are then ignored
+CACHE_VERSION = 1
+
+
+@dataclass
+class CacheStatistics:
+    """Hit and miss statistics of a ResultCache.
+
+    Attributes:
+        memory_hits: number of results found in memory
+        disk_hits: number of results found on disk
+        misses: number of results that had to be simulated
+        evictions: number of results removed from memory or disk to keep the cache within its size limits
+
+    """
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hits(self) -> int:
+        """Number of results found in memory or on disk."""
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups that were answered by the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def _array_to_dict(prefix: str, array: xr.DataArray) -> dict[str, np.ndarray]:
+    """Converts a result DataArray to plain NumPy arrays that can be stored without pickling."""
+    arrays = {f"{prefix}_values": array.values, f"{prefix}_dims": np.array(array.dims, dtype=str)}
+    objects = []
+    for dim in array.dims:
+        values = array.coords[dim].values
+        if values.dtype == object:
+            objects.append(dim)
+            values = values.astype(str)
+        arrays[f"{prefix}_{dim}"] = values
+    arrays[f"{prefix}_objects"] = np.array(objects, dtype=str)
+    return arrays
+
+
+def _array_from_dict(prefix: str, arrays) -> xr.DataArray:
+    """Restores a result DataArray from the arrays created by _array_to_dict."""
+    dims = tuple(str(dim) for dim in arrays[f"{prefix}_dims"])
+    objects = set(arrays[f"{prefix}_objects"])
+    coords = {}
+    for dim in dims:
+        values = arrays[f"{prefix}_{dim}"]
+        coords[dim] = values.astype(object) if dim in objects else values
+    return xr.DataArray(arrays[f"{prefix}_values"], dims=dims, coords=coords)
+
+
+class ResultCache:
+    """Content-addressed cache for simulation results.
+
+    Results are stored under a hash of the exact EPANET input file content, the reader used for parsing the results
+    and the start of the simulation. Identical models therefore return their cached results without running EPANET,
+    no matter if they are the same network object, a copy or a network read from another file.
+
+    Results are kept in memory in least recently used order. If a directory is passed, results are additionally stored
+    there as compressed .npz files, which survive the Python process and can be shared by several processes. Both
+    tiers evict the least recently used results once their size limit is reached.
+
+    Note:
+        Results read with :class:`~oopnet.simulator.binaryfile_reader.LazyBinaryFileReader` are not cached, since this
+        would require loading them.
+
+    Attributes:
+        maxsize: maximum number of results kept in memory
+        directory: directory for the on-disk tier or None, if results are only kept in memory
+        max_disk_bytes: maximum total size of the files in directory in bytes
+        statistics: hit and miss statistics
+
+    Examples:
+        >>> cache = ResultCache(maxsize=256, directory='result_cache')
+        >>> rpt = network.run(cache=cache)
+        >>> rpt = network.run(cache=cache)
+        >>> cache.statistics.hits
+        1
+
+    """
+
+    def __init__(self, maxsize: int = 128, directory: Optional[str] = None, max_disk_bytes: int = 2**30):
+        """ResultCache init method.
+
+        Args:
+            maxsize: maximum number of results kept in memory. If 0, results are only stored on disk.
+            directory: directory for the on-disk tier. It is created, if it doesn't exist. If None, results are only
+                kept in memory.
+            max_disk_bytes: maximum total size of the files in directory in bytes
+
+        """
+        self.maxsize = maxsize
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.statistics = CacheStatistics()
+        self._memory: OrderedDict[str, tuple[xr.DataArray, xr.DataArray]] = OrderedDict()
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._memory or (self.directory is not None and os.path.isfile(self._path(key)))
+
+    @staticmethod
+    def key(
+        content: str,
+        reader: Union[Type[BinaryFileReader], Type[LazyBinaryFileReader], Type[ReportFileReader]] = ReportFileReader,
+        startdatetime: Optional[datetime.datetime] = None,
+    ) -> str:
+        """Computes the key of a simulation.
+
+        Args:
+            content: content of the EPANET input file, including the report settings used for the simulation
+            reader: reader used for parsing the simulation results
+            startdatetime: start of the simulation
+
+        Returns:
+            hexadecimal SHA-256 hash
+
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{CACHE_VERSION}|{reader.__name__}|{startdatetime}|".encode())
+        digest.update(content.encode())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        """Returns the name of the file a result is stored in."""
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def get(self, key: str) -> Optional[SimulationReport]:
+        """Looks up a result.
+
+        Args:
+            key: key of the simulation
+
+        Returns:
+            a copy of the cached SimulationReport or None, if the result isn't cached
+
+        """
+        with self._lock:
+            arrays = self._memory.get(key)
+            if arrays is not None:
+                self._memory.move_to_end(key)
+                self.statistics.memory_hits += 1
+        if arrays is None:
+            arrays = self._load(key)
+            with self._lock:
+                if arrays is None:
+                    self.statistics.misses += 1
+                    return None
+                self.statistics.disk_hits += 1
+                self._remember(key, arrays)
+        nodes, links = arrays
+        return SimulationReport.from_arrays(nodes=nodes.copy(), links=links.copy())
+
+    def put(self, key: str, report: SimulationReport):
+        """Stores a result.
+
+        Args:
+            key: key of the simulation
+            report: simulation result
+
+        """
+        arrays = (report.nodes.copy(), report.links.copy())
+        with self._lock:
+            self._remember(key, arrays)
+        if self.directory is not None:
+            self._store(key, arrays)
+
+    def clear(self):
+        """Removes all results from memory and disk and resets the statistics."""
+        with self._lock:
+            self._memory.clear()
+            self.statistics = CacheStatistics()
+        if self.directory is not None:
+            for filename in os.listdir(self.directory):
+                if filename.endswith(".npz"):
+                    os.remove(os.path.join(self.directory, filename))
+
+    def _remember(self, key: str, arrays: tuple[xr.DataArray, xr.DataArray]):
+        """Stores a result in memory and evicts the least recently used results. The lock has to be held."""
+        if self.maxsize <= 0:
+            return
+        self._memory[key] = arrays
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+            self.statistics.evictions += 1
+
+    def _load(self, key: str) -> Optional[tuple[xr.DataArray, xr.DataArray]]:
+        """Loads a result from disk."""
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as arrays:
+                result = _array_from_dict("nodes", arrays), _array_from_dict("links", arrays)
+            # the modification time is used for evicting the least recently used files
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring invalid cache file {path!r}: {e}")
+            return None
+        return result
+
+    def _store(self, key: str, arrays: tuple[xr.DataArray, xr.DataArray]):
+        """Writes a result to disk and evicts the least recently used files."""
+        nodes, links = arrays
+        content = {**_array_to_dict("nodes", nodes), **_array_to_dict("links", links)}
+        # write to a temporary file first, so that other processes never read incomplete files
+        temporary = os.path.join(self.directory, f".{uuid.uuid4()}.tmp")
+        with open(temporary, "wb") as fid:
+            np.savez_compressed(fid, **content)
+        os.replace(temporary, self._path(key))
+        self._evict_files(keep=self._path(key))
+
+    def _evict_files(self, keep: str):
+        """Removes the least recently used files until the files fit into max_disk_bytes.
+
+        Args:
+            keep: file that is removed last, since it has just been written
+
+        """
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".npz"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((entry.path == keep, stat.st_mtime, stat.st_size, entry.path))
+        total = sum(file[2] for file in files)
+        for _, _, size, path in sorted(files):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            with self._lock:
+                self.statistics.evictions += 1
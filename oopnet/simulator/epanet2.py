@@ -1,4 +1,5 @@
 from __future__ import annotations
+import asyncio
 import datetime
 import os
 from sys import platform as _platform
@@ -6,12 +7,20 @@ import subprocess
 import uuid
 import shutil
 import re
-from typing import Union, Optional, TYPE_CHECKING
+from functools import partial
+from typing import Union, Optional, Type, TYPE_CHECKING
 import logging
+import weakref
+from contextlib import contextmanager
 
 from oopnet.simulator.reportfile_reader import ReportFileReader
-from oopnet.simulator.binaryfile_reader import BinaryFileReader
+from oopnet.simulator.binaryfile_reader import BinaryFileReader, LazyBinaryFileReader
+from oopnet.simulator.cache import ResultCache
+from oopnet.simulator.error_manager import ErrorManager
+from oopnet.simulator.scratch import scratch_directory
+from oopnet.writer.write import write_string
 from oopnet.utils import utils
+from oopnet.utils.getters.get_by_id import get_link, get_node
 from oopnet.report.report import SimulationReport
 from oopnet.utils.oopnet_logging import logging_decorator
 
@@ -20,6 +29,37 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+MAX_CONCURRENT_SIMULATIONS = os.cpu_count() or 1
+
+# result variables of Nodes and Links by the name of the corresponding Reportparameter attribute
+NODE_VARIABLES = {
+    "elevation": "Elevation",
+    "demand": "Demand",
+    "head": "Head",
+    "pressure": "Pressure",
+    "quality": "Quality",
+}
+LINK_VARIABLES = {
+    "length": "Length",
+    "diameter": "Diameter",
+    "flow": "Flow",
+    "velocity": "Velocity",
+    "headloss": "Headloss",
+    "quality": "Quality",
+    "setting": "Setting",
+    "reaction": "Reaction",
+    "ffactor": "F-Factor",
+}
+_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _default_semaphore() -> asyncio.Semaphore:
+    """Returns the semaphore shared by all asynchronous simulations in the running event loop."""
+    loop = asyncio.get_running_loop()
+    if loop not in _semaphores:
+        _semaphores[loop] = asyncio.Semaphore(MAX_CONCURRENT_SIMULATIONS)
+    return _semaphores[loop]
+
 
 # todo: add proper documentation
 # todo: enable running EPANET input files directly again
@@ -32,6 +72,12 @@ class ModelSimulator:
       filename: if thing is an OOPNET network, filename is an option to perform command line EPANET simulations with a specific filename. If filename is a Python None object then a file with a random UUID (universally unique identifier) is generated
       delete: if delete is True the EPANET Input and Report file is deleted, if False then the simulation results won't be deleted and are stored in a folder named path
       path: Path were to perform the simulations. If path is a Python None object then a tmp-folder is generated
+      scratch: if True, the simulation files are placed in a persistent per-process scratch directory on a RAM-backed file system (e.g., /dev/shm) instead of path and the EPANET input file is generated in memory and written at once. The file names are reused by subsequent simulations instead of creating and deleting files for every simulation.
+      reader: reader used for parsing the simulation results. ReportFileReader parses the EPANET report file, while BinaryFileReader reads the binary output file with full precision and is considerably faster for large models. LazyBinaryFileReader maps the binary output file and only loads results when they are accessed. In this case, the binary output file is deleted once the report is no longer used.
+      cache: optional ResultCache. If the cache contains the results of an identical input file simulated with the same reader and startdatetime, they are returned without running EPANET and no files are written. Results read with LazyBinaryFileReader are never cached.
+      nodes: IDs of the Nodes whose results are required. If None, the network's report settings are used.
+      links: IDs of the Links whose results are required. If None, the network's report settings are used.
+      variables: names of the required result variables (e.g., "pressure" or "flow"). If None, the network's report parameters are used. When reading the report file, EPANET only writes the requested results and only those are parsed. Results read from the binary output file are restricted afterwards.
 
     Returns:
       OOPNET report object
@@ -46,6 +92,14 @@ class ModelSimulator:
         path: Optional[str] = None,
         startdatetime: Optional[datetime.datetime] = None,
         output: bool = False,
+        reader: Union[
+            Type[BinaryFileReader], Type[LazyBinaryFileReader], Type[ReportFileReader]
+        ] = ReportFileReader,
+        scratch: bool = False,
+        cache: Optional[ResultCache] = None,
+        nodes: Optional[list[str]] = None,
+        links: Optional[list[str]] = None,
+        variables: Optional[list[str]] = None,
     ):
         self.thing = thing
         self.filename = filename
@@ -53,10 +107,25 @@ class ModelSimulator:
         self.path = path
         self.startdatetime = startdatetime
         self.output = output
+        self.reader = reader
+        self.scratch = scratch
+        self.cache = cache
+        self.nodes = nodes
+        self.links = links
+        self.variables = None if variables is None else [self._variable(name) for name in variables]
         self.command = None
+        self._content: Optional[str] = None
+        self._key: Optional[str] = None
+
+    @property
+    def _reads_binary(self) -> bool:
+        """True if the results are read from the binary output file."""
+        return self.reader in (BinaryFileReader, LazyBinaryFileReader)
 
     def _set_path(self):
         """Sets path for temporary file placement."""
+        if self.scratch:
+            return
         # Set Path and generate it, if it does not exist
         if self.path is None:
             self.path = "tmp"
@@ -72,7 +141,13 @@ class ModelSimulator:
 
     def _set_filename(self):
         """Sets filename for temporary file placement."""
-        if isinstance(self.thing, str):
+        if self.scratch:
+            # lazy reports need their binary output file after the simulation, so it must not be reused
+            if self.reader is LazyBinaryFileReader:
+                self.filename = scratch_directory.unique_filename()
+            else:
+                self.filename = scratch_directory.acquire()
+        elif isinstance(self.thing, str):
             self.filename = os.path.join(self.path, os.path.split(self.thing)[-1])
             shutil.copy(self.thing, self.filename)
         else:
@@ -81,7 +156,17 @@ class ModelSimulator:
             )  # generate filename with unique filename
 
     def _setup_report(self):
-        """Sets up report."""
+        """Sets up report.
+
+        Raises:
+          ComponentNotExistingError if a required Node or Link doesn't exist
+
+        """
+        for ids, getter in ((self.nodes, get_node), (self.links, get_link)):
+            for id in ids or []:
+                getter(self.thing, id)
+        if self._reads_binary:
+            return
         if self.thing.report.nodes == "NONE" or not self.thing.report.nodes:
             self.thing.report.nodes = "ALL"
         if self.thing.report.links == "NONE" or not self.thing.report.links:
@@ -106,57 +191,272 @@ class ModelSimulator:
         self.command = cmd
         logger.debug(f"Running command {cmd}")
 
-    def _execute(self):
-        """Executes simulation and parses output."""
+    @staticmethod
+    def _variable(name: str) -> str:
+        """Converts a result variable name to the name of the corresponding Reportparameter attribute.
 
-        def decorate_string(stdout_bytes: bytes) -> str:
-            """
+        Raises:
+          ValueError if the variable is unknown
 
-            Args:
-              stdout_bytes: bytes:
+        """
+        variable = name.lower().replace("-", "")
+        if variable not in NODE_VARIABLES and variable not in LINK_VARIABLES:
+            raise ValueError(f"Unknown result variable {name!r}.")
+        return variable
 
-            Returns:
+    @property
+    def _projected(self) -> bool:
+        """True if the results are restricted to certain Nodes, Links or variables."""
+        return self.nodes is not None or self.links is not None or self.variables is not None
 
-            """
-            out = stdout_bytes.decode("utf-8")
-            for char in ["\n", "\r", "..."]:
-                out = out.replace(char, "")
-            pattern = re.compile(r"(\s){2,}")
-            out = re.sub(pattern, ". ", out).strip()
-            return out
+    def _reported_components(self, ids: Optional[list[str]], getter, variables: dict[str, str]):
+        """Returns the report setting for the Nodes or Links, if the results are restricted.
 
-        self.thing.write(filename=self.filename)
+        Args:
+          ids: IDs of the required Nodes or Links
+          getter: get_node or get_link
+          variables: NODE_VARIABLES or LINK_VARIABLES
 
-        cmd = subprocess.run(self.command, capture_output=True, shell=False)
-        out, err = cmd.stdout, cmd.stderr
+        Returns:
+          list of Nodes or Links, "NONE" if none of them are required or None, if the network's setting is kept
+
+        """
+        if self.variables is not None and not any(variable in variables for variable in self.variables):
+            return "NONE"
+        if ids is None:
+            return None
+        return [getter(self.thing, id) for id in ids] or "NONE"
+
+    @contextmanager
+    def _report_settings(self):
+        """Temporarily changes the report settings while writing the input file, if required.
+
+        If the results are read from the binary output file, Node and Link results are excluded from the report file
+        since EPANET would otherwise spend time on writing results that are never read. Otherwise, the report is
+        restricted to the required Nodes, Links and variables.
+
+        """
+        if not self._reads_binary and not self._projected:
+            yield
+            return
+        report, parameters = self.thing.report, self.thing.reportparameter
+        nodes, links = report.nodes, report.links
+        previous_parameters = dict(vars(parameters))
+        if self._reads_binary:
+            report.nodes, report.links = "NONE", "NONE"
+        else:
+            report.nodes = self._reported_components(self.nodes, get_node, NODE_VARIABLES) or nodes
+            report.links = self._reported_components(self.links, get_link, LINK_VARIABLES) or links
+            if self.variables is not None:
+                for attribute in previous_parameters:
+                    setattr(parameters, attribute, "YES" if attribute in self.variables else "NO")
+        try:
+            yield
+        finally:
+            report.nodes, report.links = nodes, links
+            for attribute, value in previous_parameters.items():
+                setattr(parameters, attribute, value)
+
+    @staticmethod
+    def _select(array, ids: Optional[list[str]], variables: Optional[list[str]], names: dict[str, str]):
+        """Restricts Node or Link results to the required IDs and variables."""
+        if array is None:
+            return None
+        if ids is not None:
+            if not ids:
+                return None
+            array = array.sel(id=ids)
+        if variables is not None:
+            available = set(array.vars.values)
+            selected = [names[variable] for variable in variables if names.get(variable) in available]
+            if not selected:
+                return None
+            array = array.sel(vars=selected)
+        return array
+
+    def _project(self, rpt: SimulationReport) -> SimulationReport:
+        """Restricts the results to the required Nodes, Links and variables.
+
+        The report file only contains the required results already, but results from the binary output file or the
+        cache contain all results. The results are returned in the order of the requested IDs and variables.
+
+        """
+        if not self._projected:
+            return rpt
+        return SimulationReport.from_arrays(
+            nodes=self._select(rpt.nodes, self.nodes, self.variables, NODE_VARIABLES),
+            links=self._select(rpt.links, self.links, self.variables, LINK_VARIABLES),
+        )
+
+    def _render_input(self) -> str:
+        """Generates the content of the EPANET input file in memory."""
+        with self._report_settings():
+            return write_string(self.thing)
+
+    def _write_input(self):
+        """Writes the EPANET input file, at once from memory when using the scratch directory or a cache."""
+        if self._content is None and not self.scratch:
+            with self._report_settings():
+                self.thing.write(filename=self.filename)
+            return
+        content = self._content if self._content is not None else self._render_input()
+        with open(self.filename, "w") as fid:
+            fid.write(content)
+
+    def _cached_results(self) -> Optional[SimulationReport]:
+        """Looks up the simulation in the cache.
+
+        The input file's content is kept for writing the input file, if the results aren't cached, and the key for
+        storing the results afterwards.
+
+        Returns:
+          the cached results or None, if no cache is used or the results aren't cached
+
+        """
+        if self.cache is None or self.reader is LazyBinaryFileReader:
+            return None
+        if isinstance(self.thing, str):
+            with open(self.thing) as fid:
+                content = fid.read()
+        else:
+            content = self._content = self._render_input()
+        self._key = self.cache.key(content, self.reader, self.startdatetime)
+        return self.cache.get(self._key)
+
+    def _read_results(self) -> SimulationReport:
+        """Reads the simulation results with the selected reader."""
+        rpt_file = self.filename.replace(".inp", ".rpt")
+        reader = self.reader
+        if self._reads_binary:
+            error_manager = ErrorManager()
+            error_manager.check_file(rpt_file)
+            error_manager.raise_errors()
+            filename = self.filename.replace(".inp", ".out")
+        else:
+            filename = rpt_file
+        if self.reader is LazyBinaryFileReader:
+            reader = partial(LazyBinaryFileReader, delete=self.delete)
+        return SimulationReport(
+            filename, startdatetime=self.startdatetime, reader=reader
+        )
+
+    @staticmethod
+    def _decorate_string(stdout_bytes: bytes) -> str:
+        """Converts EPANET's console output to a single line of text.
+
+        Args:
+          stdout_bytes: console output
+
+        Returns:
+          console output as a single line
+
+        """
+        out = stdout_bytes.decode("utf-8")
+        for char in ["\n", "\r", "..."]:
+            out = out.replace(char, "")
+        pattern = re.compile(r"(\s){2,}")
+        out = re.sub(pattern, ". ", out).strip()
+        return out
+
+    def _log_output(self, out: bytes, err: bytes):
+        """Logs EPANET's stdout and stderr if output is enabled."""
         if out and self.output:
-            logger.info(decorate_string(out))
+            logger.info(self._decorate_string(out))
         if err and self.output:
-            logger.info(decorate_string(err))
+            logger.info(self._decorate_string(err))
+
+    def _execute(self):
+        """Executes simulation and parses output."""
+        self._write_input()
+
+        cmd = subprocess.run(self.command, capture_output=True, shell=False)
+        self._log_output(cmd.stdout, cmd.stderr)
+
+    def _remove_files(self, rpt: Optional[SimulationReport] = None):
+        """Removes the simulation files or releases their name in the scratch directory.
+
+        Args:
+          rpt: the simulation's report, if it has been read
+
+        """
+        if self.scratch and self.reader is not LazyBinaryFileReader:
+            scratch_directory.release(self.filename)
+        elif self.delete:
+            for extension in [".inp", ".rpt", ".out"]:
+                filename = self.filename.replace(".inp", extension)
+                # lazy reports remove the binary output file themselves when they are no longer used
+                if extension == ".out" and rpt is not None and self.reader is LazyBinaryFileReader:
+                    continue
+                if os.path.isfile(filename):
+                    os.remove(filename)
+
+    def _collect_results(self) -> SimulationReport:
+        """Reads the simulation results and removes the simulation files afterwards, if required."""
+        rpt = None
+        try:
+            rpt = self._read_results()
+        finally:
+            self._remove_files(rpt)
+        if self._key is not None:
+            self.cache.put(self._key, rpt)
+        return rpt
 
     def run(self):
         """Simulates a hydraulic model using EPANET."""
         logging.info("Simulating model")
+        self._setup_report()
+        rpt = self._cached_results()
+        if rpt is not None:
+            return self._project(rpt)
         self._set_path()
         self._set_filename()
-        self._setup_report()
         self._create_command()
         self._execute()
+        return self._project(self._collect_results())
+
+    async def run_async(
+        self, semaphore: Optional[asyncio.Semaphore] = None
+    ) -> SimulationReport:
+        """Simulates a hydraulic model using EPANET without blocking the event loop.
+
+        The input file is written before waiting for the semaphore, so that later changes to the model do not affect the
+        simulation. EPANET is then started as an asyncio subprocess as soon as the semaphore permits and the results are parsed in the
+        event loop's default executor.
+
+        Args:
+          semaphore: semaphore limiting the number of concurrently running EPANET processes. If None, a semaphore
+            shared by all simulations in the running event loop is used, that allows for MAX_CONCURRENT_SIMULATIONS
+            processes.
+
+        Returns:
+          OOPNET report object
+
+        """
+        logging.info("Simulating model")
+        self._setup_report()
+        rpt = self._cached_results()
+        if rpt is not None:
+            return self._project(rpt)
+        self._set_path()
+        self._set_filename()
+        self._create_command()
+        self._write_input()
 
+        process = None
         try:
-            rpt = SimulationReport(
-                self.filename.replace(".inp", ".rpt"),
-                startdatetime=self.startdatetime,
-                reader=ReportFileReader,
-            )
-        finally:
-            if self.delete:
-                os.remove(self.filename)
-                rpt_file = self.filename.replace(".inp", ".rpt")
-                out_file = self.filename.replace(".inp", ".out")
-                if os.path.isfile(rpt_file):
-                    os.remove(rpt_file)
-                if os.path.isfile(out_file):
-                    os.remove(out_file)
-        if rpt:
-            return rpt
+            async with semaphore or _default_semaphore():
+                process = await asyncio.create_subprocess_exec(
+                    *self.command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                out, err = await process.communicate()
+        except BaseException:
+            # e.g., if the task was cancelled
+            if process is not None and process.returncode is None:
+                process.kill()
+            self._remove_files()
+            raise
+        self._log_output(out, err)
+        loop = asyncio.get_running_loop()
+        return self._project(await loop.run_in_executor(None, self._collect_results))
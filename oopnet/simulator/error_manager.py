@@ -58,6 +58,20 @@ class ErrorManager:
         err = self.found_errors[-1]
         err[2] = text_line
 
+    def check_file(self, filename: str):
+        """Checks all lines of an EPANET report file for errors and their details.
+
+        Args:
+            filename: name of the report file
+
+        """
+        error_found = False
+        with open(filename, "r") as fid:
+            for line in fid:
+                if error_found and len(line.strip()) != 0:
+                    self.append_error_details(line)
+                error_found = self.check_line(line)
+
     def raise_errors(self):
         """Raises an EPANETSimulationError if any errors were encountered while simulating the model."""
         if self.found_errors:
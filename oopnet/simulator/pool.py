@@ -0,0 +1,446 @@
+from __future__ import annotations
+import datetime
+import logging
+import multiprocessing
+import os
+from collections import deque
+from itertools import count
+from multiprocessing.connection import Connection, wait
+from typing import Any, Iterable, Iterator, Optional, Type, Union, TYPE_CHECKING
+
+import numpy as np
+import xarray as xr
+
+from oopnet.report.report import SimulationReport
+from oopnet.simulator.batch import Modification, Coordinates, _apply_modification, _coordinates
+from oopnet.simulator.binaryfile_reader import BinaryFileReader, LazyBinaryFileReader
+from oopnet.simulator.epanet2 import ModelSimulator
+from oopnet.simulator.reportfile_reader import ReportFileReader
+
+if TYPE_CHECKING:
+    from oopnet.elements.network import Network
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("toolkit", "epanet")
+
+
+class WorkerCrashedError(Exception):
+    """Raised when a worker process died while simulating a modification more often than allowed."""
+
+
+def _serve(
+    connection: Connection,
+    network: Network,
+    backend: str,
+    reader: Union[Type[BinaryFileReader], Type[LazyBinaryFileReader], Type[ReportFileReader]],
+    startdatetime: Optional[datetime.datetime],
+    library: Optional[str],
+):
+    """Main loop of a worker process.
+
+    The worker prepares its model once and then simulates the modifications it receives until it receives None. The
+    Node and Link result coordinates are only sent with the first result, afterwards only the result values are sent.
+
+    Args:
+        connection: worker's end of the pipe to the main process
+        network: base network
+        backend: "toolkit" or "epanet"
+        reader: reader used for parsing the simulation results of command line EPANET
+        startdatetime: start of the simulations
+        library: file name or path of the EPANET shared library
+
+    """
+    simulator = None
+    try:
+        if backend == "toolkit":
+            from oopnet.simulator.toolkit import ToolkitSimulator
+
+            simulator = ToolkitSimulator(network, library=library, startdatetime=startdatetime)
+    except BaseException as e:
+        connection.send(("error", e))
+        return
+    connection.send(("ready", os.getpid()))
+
+    coordinates_sent = False
+    while True:
+        try:
+            message = connection.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+        task, modification = message
+        try:
+            if simulator is not None:
+                rpt = simulator.run(modification)
+            else:
+                previous = {}
+                try:
+                    _apply_modification(network, modification, previous)
+                    rpt = ModelSimulator(
+                        thing=network, startdatetime=startdatetime, reader=reader, scratch=True
+                    ).run()
+                finally:
+                    _apply_modification(network, previous, {})
+            coordinates = None
+            if not coordinates_sent:
+                coordinates = (_coordinates(rpt.nodes), _coordinates(rpt.links))
+                coordinates_sent = True
+            connection.send((task, (coordinates, rpt.nodes.values, rpt.links.values)))
+        except Exception as e:
+            connection.send((task, e))
+    if simulator is not None:
+        simulator.close()
+    connection.close()
+
+
+class _Worker:
+    """Worker process and the main process' end of its pipe.
+
+    Attributes:
+        process: worker process
+        connection: main process' end of the pipe
+        task: ID of the task the worker is busy with or None, if the worker is idle
+        retire: if True, the worker is stopped as soon as it has finished its task
+
+    """
+
+    def __init__(self, process: multiprocessing.Process, connection: Connection):
+        self.process = process
+        self.connection = connection
+        self.task: Optional[int] = None
+        self.retire = False
+
+    def stop(self, timeout: float = 5.0):
+        """Stops the worker process, if necessary forcefully."""
+        try:
+            self.connection.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.connection.close()
+
+
+class SimulationPool:
+    """Pool of persistent worker processes that simulate modified versions of a network.
+
+    Every worker process receives the base network once when it is started and prepares its model: with the "toolkit"
+    backend, the network is loaded into the EPANET shared library (see
+    :class:`~oopnet.simulator.toolkit.ToolkitSimulator`), with the "epanet" backend, the worker keeps the network and
+    runs command line EPANET in its scratch directory. Afterwards, only modifications are sent to the workers and only
+    the result arrays are sent back. Unlike :func:`~oopnet.simulator.batch.run_batch`, the workers stay alive between
+    batches, so the costs for starting the processes and preparing the models are paid only once.
+
+    The pool can be resized while it is used. Worker processes that die (e.g., due to a crash of the EPANET library)
+    are replaced automatically and their modifications are simulated again.
+
+    Modifications are dictionaries with attribute names as keys and dictionaries mapping Node and Link IDs to the new
+    attribute values as values, e.g. ``{'demand': {'J-01': 1.2, 'J-02': 0.8}, 'diameter': {'P-01': 300.0}}``. The
+    modifications are reverted after every simulation.
+
+    Warning:
+        A SimulationPool must not be used by several threads at the same time.
+
+    Attributes:
+        network: base network
+        backend: "toolkit" for in-process simulations with the EPANET shared library or "epanet" for command line EPANET
+        reader: reader used for parsing the simulation results with the "epanet" backend
+        startdatetime: start of the simulations
+        library: file name or path of the EPANET shared library used by the "toolkit" backend
+        retries: number of times a modification is simulated again after its worker process died
+
+    Examples:
+        >>> with SimulationPool(network, workers=4) as pool:
+        ...     reports = list(pool.map(modifications))
+        ...     pool.resize(8)
+        ...     rpt = pool.run({'diameter': {'P-01': 300.0}})
+
+    """
+
+    def __init__(
+        self,
+        network: Network,
+        workers: Optional[int] = None,
+        backend: str = "toolkit",
+        reader: Union[
+            Type[BinaryFileReader], Type[LazyBinaryFileReader], Type[ReportFileReader]
+        ] = BinaryFileReader,
+        startdatetime: Optional[datetime.datetime] = None,
+        library: Optional[str] = None,
+        retries: int = 1,
+    ):
+        """SimulationPool init method.
+
+        Args:
+            network: OOPNET network object to be simulated
+            workers: number of worker processes. If None, the number of CPUs is used.
+            backend: "toolkit" for in-process simulations with the EPANET shared library or "epanet" for command line
+                EPANET
+            reader: reader used for parsing the simulation results with the "epanet" backend
+            startdatetime: start of the simulations
+            library: file name or path of the EPANET shared library used by the "toolkit" backend. If None, the library
+                is looked up on the system's library search path.
+            retries: number of times a modification is simulated again after its worker process died
+
+        Raises:
+            ValueError if the backend is unknown. EPANETSimulationError if EPANET can't load the network.
+
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}, use one of {BACKENDS}.")
+        self.network = network
+        self.backend = backend
+        self.reader = reader
+        self.startdatetime = startdatetime
+        self.library = library
+        self.retries = retries
+        self._context = multiprocessing.get_context()
+        self._workers: list[_Worker] = []
+        self._coordinates: Optional[tuple[Coordinates, Coordinates]] = None
+        self._task_ids = count()
+        self._closed = False
+        try:
+            self.resize(workers or os.cpu_count() or 1)
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self) -> SimulationPool:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        if hasattr(self, "_workers"):
+            self.close()
+
+    @property
+    def workers(self) -> int:
+        """Number of worker processes, not counting workers that are stopped after finishing their current task."""
+        return sum(not worker.retire for worker in self._workers)
+
+    def _start_worker(self) -> _Worker:
+        """Starts a worker process and waits until its model is prepared.
+
+        Raises:
+            the exception raised by the worker while preparing its model
+
+        """
+        connection, child_connection = self._context.Pipe()
+        process = self._context.Process(
+            target=_serve,
+            args=(child_connection, self.network, self.backend, self.reader, self.startdatetime, self.library),
+            daemon=True,
+        )
+        process.start()
+        child_connection.close()
+        worker = _Worker(process, connection)
+        try:
+            status, value = connection.recv()
+        except EOFError:
+            worker.stop()
+            raise WorkerCrashedError(f"Worker process exited with code {process.exitcode} during startup.")
+        if status == "error":
+            worker.stop()
+            raise value
+        logger.debug(f"Started worker process {value}")
+        return worker
+
+    def resize(self, workers: int):
+        """Changes the number of worker processes.
+
+        New worker processes are started immediately. When reducing the number of workers, idle workers are stopped
+        immediately, while busy workers are stopped as soon as they have finished their current simulation.
+
+        Args:
+            workers: new number of worker processes
+
+        Raises:
+            ValueError if the number of workers is smaller than 1 or the pool has been closed.
+
+        """
+        if self._closed:
+            raise ValueError("The SimulationPool has been closed.")
+        if workers < 1:
+            raise ValueError("A SimulationPool needs at least one worker process.")
+        # workers that are about to retire are kept instead of starting new ones
+        for worker in self._workers:
+            if worker.retire and self.workers < workers:
+                worker.retire = False
+        while self.workers < workers:
+            self._workers.append(self._start_worker())
+        for worker in sorted(self._workers, key=lambda worker: worker.task is not None):
+            if self.workers <= workers:
+                break
+            worker.retire = True
+            if worker.task is None:
+                self._remove(worker)
+
+    def _remove(self, worker: _Worker):
+        """Stops a worker and removes it from the pool."""
+        self._workers.remove(worker)
+        worker.stop()
+
+    def _replace(self, worker: _Worker):
+        """Replaces a worker whose process died with a new worker, unless the worker was about to retire."""
+        worker.connection.close()
+        worker.process.join()
+        logger.warning(f"Worker process {worker.process.pid} died with exit code {worker.process.exitcode}.")
+        if worker.retire:
+            self._workers.remove(worker)
+        else:
+            self._workers[self._workers.index(worker)] = self._start_worker()
+
+    def _receive(self, worker: _Worker) -> tuple[int, Any]:
+        """Receives a message from a worker.
+
+        Every worker sends the result coordinates only with its first result, so they are stored as soon as they are
+        received, even if the result itself is discarded.
+
+        Returns:
+            task ID and either the result values or the exception raised by the worker
+
+        """
+        task, result = worker.connection.recv()
+        if not isinstance(result, BaseException) and result[0] is not None:
+            self._coordinates = result[0]
+        return task, result
+
+    def _report(self, value: tuple[Optional[tuple[Coordinates, Coordinates]], np.ndarray, np.ndarray]) -> SimulationReport:
+        """Creates a SimulationReport from the result values sent by a worker."""
+        _, nodes, links = value
+        (node_dims, node_coords), (link_dims, link_coords) = self._coordinates
+        return SimulationReport.from_arrays(
+            nodes=xr.DataArray(nodes, dims=node_dims, coords=node_coords),
+            links=xr.DataArray(links, dims=link_dims, coords=link_coords),
+        )
+
+    def map(self, modifications: Iterable[Modification]) -> Iterator[SimulationReport]:
+        """Simulates modified versions of the base network.
+
+        Args:
+            modifications: modifications to be simulated
+
+        Raises:
+            ComponentNotExistingError if a modification references a Node or Link that does not exist or lacks the
+            attribute to be modified. EPANETSimulationError if a simulation fails. WorkerCrashedError if a worker
+            process died more than retries times while simulating a modification.
+
+        Returns:
+            generator yielding a SimulationReport for every modification in the order of the modifications
+
+        """
+        if self._closed:
+            raise ValueError("The SimulationPool has been closed.")
+        modifications = iter(modifications)
+        queue: deque[tuple[int, Modification]] = deque()
+        pending: dict[int, Modification] = {}
+        attempts: dict[int, int] = {}
+        results: dict[int, Any] = {}
+        order: deque[int] = deque()
+        exhausted = False
+        try:
+            while True:
+                # limit the number of results waiting for an earlier result
+                backlog = 4 * max(self.workers, 1)
+                for worker in self._workers:
+                    if worker.task is not None or worker.retire:
+                        continue
+                    if not queue and not exhausted and len(order) < backlog:
+                        try:
+                            modification = next(modifications)
+                        except StopIteration:
+                            exhausted = True
+                        else:
+                            task = next(self._task_ids)
+                            queue.append((task, modification))
+                            order.append(task)
+                    if not queue:
+                        break
+                    task, modification = queue.popleft()
+                    pending[task] = modification
+                    worker.task = task
+                    try:
+                        worker.connection.send((task, modification))
+                    except OSError:
+                        # the worker process died, which is handled like a crash during the simulation
+                        pass
+
+                while order and order[0] in results:
+                    result = results.pop(order.popleft())
+                    if isinstance(result, BaseException):
+                        raise result
+                    yield self._report(result)
+                if not pending and not queue:
+                    if exhausted:
+                        return
+                    continue
+
+                busy = [worker for worker in self._workers if worker.task is not None]
+                ready = wait([worker.connection for worker in busy] + [worker.process.sentinel for worker in busy])
+                for worker in busy:
+                    if worker.connection in ready:
+                        try:
+                            task, result = self._receive(worker)
+                        except (EOFError, OSError):
+                            # the pipe is broken, make sure that the process is gone as well
+                            worker.process.terminate()
+                            worker.process.join()
+                        else:
+                            results[task] = result
+                            del pending[task]
+                            worker.task = None
+                            if worker.retire:
+                                self._remove(worker)
+                            continue
+                    if worker.process.sentinel in ready or not worker.process.is_alive():
+                        task = worker.task
+                        modification = pending.pop(task)
+                        attempts[task] = attempts.get(task, 0) + 1
+                        self._replace(worker)
+                        if attempts[task] > self.retries:
+                            results[task] = WorkerCrashedError(
+                                f"Worker process died {attempts[task]} times while simulating a modification."
+                            )
+                        else:
+                            queue.appendleft((task, modification))
+        finally:
+            self._drain()
+
+    def _drain(self):
+        """Waits for the simulations that are still running and discards their results."""
+        for worker in list(self._workers):
+            if worker.task is None:
+                continue
+            wait([worker.connection, worker.process.sentinel])
+            try:
+                self._receive(worker)
+            except (EOFError, OSError):
+                self._replace(worker)
+            else:
+                worker.task = None
+                if worker.retire:
+                    self._remove(worker)
+
+    def run(self, modification: Optional[Modification] = None) -> SimulationReport:
+        """Simulates a modified version of the base network.
+
+        Args:
+            modification: modification to be simulated. If None, the base network is simulated.
+
+        Returns:
+            SimulationReport
+
+        """
+        return next(self.map([modification or {}]))
+
+    def close(self):
+        """Stops all worker processes."""
+        self._closed = True
+        while self._workers:
+            self._workers.pop().stop()
@@ -4,6 +4,7 @@ import re
 import logging
 from collections import Counter
 
+import numpy as np
 import pandas as pd
 import xarray as xr
 from xarray import DataArray, Dataset
@@ -115,7 +116,78 @@ def lst2xray(lst: list) -> xr.DataArray:
     return xr.DataArray(frame)
 
 
-# todo: refactor
+def _split_blocks(content: str, error_manager: ErrorManager) -> dict[str, list[str]]:
+    """Splits the content of a report file into blank line separated blocks.
+
+    Lines that do not belong to a Node or Link results table are checked for errors.
+
+    Args:
+      content: content of the report file
+      error_manager: ErrorManager used for checking lines for errors
+
+    Returns:
+        dictionary with the normalised first line of a block as key and the remaining lines of the block as value
+
+    """
+    blocks = {}
+    error_found = False
+    for text in re.split(r"\n(?:[ \t]*\n)+", content):
+        lines = text.split("\n")
+        key = " ".join(lines[0].split())
+        if key.startswith(("Node", "Link")):
+            blocks[key] = [line for line in lines[1:] if line.strip() and not line.lstrip().startswith("---------")]
+            error_found = False
+            continue
+        for line in lines:
+            if error_found and line.strip():
+                error_manager.append_error_details(line)
+            error_found = error_manager.check_line(line)
+    return blocks
+
+
+_ROW_ID = re.compile(r"^[ \t]*(\S+)", re.MULTILINE)
+_ELEMENT_TYPE = re.compile(r"[A-Z][A-Za-z]*")
+_GLUED_NUMBER = re.compile(r"([\d.])([+-])")
+
+
+def _parse_blocks(blocks: list[list[str]]) -> Optional[tuple[list[str], list[str], np.ndarray]]:
+    """Parses Node or Link results tables with identical headers and IDs at once.
+
+    The tables' rows are joined and parsed in a single pass: element types appended to tanks, reservoirs, pumps and
+    valves are removed and all values are converted to floats together. Numbers glued together because they exceed
+    their column width are only separated if the conversion fails.
+
+    Args:
+      blocks: lines of the results tables starting with the header and units lines
+
+    Returns:
+        IDs, variable names and an array of shape (tables, ids, variables) or None, if the tables could not be parsed
+        this way
+
+    """
+    variables = blocks[0][0].split()
+    rows = "\n".join("\n".join(lines[2:]) for lines in blocks)
+    ids = _ROW_ID.findall(rows)
+    nblocks = len(blocks)
+    if any(lines[0].split() != variables for lines in blocks) or len(ids) % nblocks:
+        return None
+    nids = len(ids) // nblocks
+    if ids[:nids] * nblocks != ids:
+        return None
+
+    values = _ELEMENT_TYPE.sub("", _ROW_ID.sub("", rows))
+    try:
+        values = np.array(values.split(), dtype=float)
+    except ValueError:
+        try:
+            values = np.array(_GLUED_NUMBER.sub(r"\1 \2", values).split(), dtype=float)
+        except ValueError:
+            return None
+    if values.size != len(ids) * len(variables):
+        return None
+    return ids[:nids], variables, values.reshape(nblocks, nids, len(variables))
+
+
 @logging_decorator(logger)
 class ReportFileReader:
     def __new__(
@@ -123,61 +195,40 @@ class ReportFileReader:
     ) -> tuple[Union[DataArray, Dataset, None], Union[DataArray, Dataset, None]]:
         logger.debug("Reading Report File")
         with open(filename, "r") as fid:
-            content = fid.readlines()
-            # print(content)
-            block = {}
-            key = "start"
-            block[key] = []
-            error_manager = ErrorManager()
-            error_found = False
-
-            for linenumber, line in enumerate(content):
-                if error_found and len(line.strip()) != 0:
-                    error_manager.append_error_details(line)
-
-                error_found = error_manager.check_line(line)
-                if len(line.strip()) == 0:
-                    key = content[linenumber + 1]
-                    key = re.sub(r"\s+", " ", key.replace("\n", "").strip())
-                    block[key] = []
-                else:
-                    line = re.sub(r"\s+", " ", line.replace("\n", "").strip())
-                    if line not in key and (
-                        line in key or not line.startswith("---------")
-                    ):
-                        block[key].append(line.split(" "))
+            content = fid.read()
+        error_manager = ErrorManager()
+        block = _split_blocks(content, error_manager)
         error_manager.raise_errors()
         links = None
         nodes = None
         data = None
 
-        format = "%y.%m.%d %H:%M:%S"
-        for k in list(block.keys()):
-            if "Node" not in k and "Link" not in k:
-                block.pop(k)
-
         for kind in ["Node", "Link"]:
+            keys = [key for key in sorted(block.keys()) if key.startswith(kind)]
             times = []
-            # for key in sorted(block.iterkeys(), key=lambda x: x.split(' ')[3].zfill(8)):
-            for key in sorted(block.keys()):
-                if key.startswith(kind):
-                    kind, time = blockkey2typetime(key, startdatetime=startdatetime)
-                    if time is not None:
-                        times.append(time)
-
-            frames = []
-            for key in sorted(block.keys()):
-                if key.startswith(kind):
-                    lst = block[key]
-                    x = lst2xray(lst)
-                    frames.append(x)
-            if frames:
-                if times:
-                    data = xr.concat(frames, times)
-                    data = data.rename({"concat_dim": "time", "dim_1": "vars"})
+            for key in keys:
+                _, time = blockkey2typetime(key, startdatetime=startdatetime)
+                if time is not None:
+                    times.append(time)
+
+            if keys:
+                parsed = _parse_blocks([block[key] for key in keys])
+                if parsed is not None:
+                    ids, variables, values = parsed
+                    coords = {"id": np.array(ids, dtype=object), "vars": np.array(variables, dtype=object)}
+                    if times:
+                        data = xr.DataArray(values, dims=("time", "id", "vars"), coords=coords)
+                        data = data.assign_coords(time=times)
+                    else:
+                        data = xr.DataArray(values[0], dims=("id", "vars"), coords=coords)
                 else:
-                    data = frames[0]
-                    data = data.rename({"dim_1": "vars"})
+                    frames = [lst2xray([line.split() for line in block[key]]) for key in keys]
+                    if times:
+                        data = xr.concat(frames, times)
+                        data = data.rename({"concat_dim": "time", "dim_1": "vars"})
+                    else:
+                        data = frames[0]
+                        data = data.rename({"dim_1": "vars"})
             if kind == "Node":
                 nodes = data
             else:
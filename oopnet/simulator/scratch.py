@@ -0,0 +1,96 @@
+import atexit
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+def ram_directory() -> str:
+    """Returns a directory on a RAM-backed file system if available.
+
+    On Linux, /dev/shm is a tmpfs that is available on virtually every system. On other platforms, the system's
+    temporary directory is used instead.
+
+    Returns:
+        path to the directory
+
+    """
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return tempfile.gettempdir()
+
+
+class ScratchDirectory:
+    """Persistent per-process working directory for simulation files.
+
+    The directory is created on a RAM-backed file system on first use and removed when the process exits. Instead of
+    creating and deleting files for every simulation, simulations acquire a file name, which is released after the
+    results have been read and reused by the next simulation. Every process (e.g., a forked worker process) gets its
+    own directory.
+
+    Attributes:
+        path: path of the directory or None, if it hasn't been created yet
+
+    """
+
+    def __init__(self):
+        self.path: Optional[str] = None
+        self._pid: Optional[int] = None
+        self._free: list[str] = []
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def _create(self):
+        """Creates the directory of the current process."""
+        self.path = tempfile.mkdtemp(prefix="oopnet_", dir=ram_directory())
+        self._pid = os.getpid()
+        self._free = []
+        self._count = 0
+        atexit.register(shutil.rmtree, self.path, ignore_errors=True)
+        logger.debug(f"Created scratch directory {self.path!r}")
+
+    def unique_filename(self) -> str:
+        """Returns a unique name for an EPANET input file that is never reused.
+
+        Returns:
+            input file name
+
+        """
+        with self._lock:
+            if self._pid != os.getpid():
+                self._create()
+            return os.path.join(self.path, f"{uuid.uuid4()}.inp")
+
+    def acquire(self) -> str:
+        """Acquires a name for an EPANET input file that is not in use by another simulation.
+
+        Returns:
+            input file name. The report and binary output file use the same name with different extensions.
+
+        """
+        with self._lock:
+            if self._pid != os.getpid():
+                self._create()
+            if self._free:
+                return self._free.pop()
+            self._count += 1
+            return os.path.join(self.path, f"{self._count}.inp")
+
+    def release(self, filename: str):
+        """Releases a file name so that it can be reused.
+
+        Args:
+            filename: input file name acquired before
+
+        """
+        with self._lock:
+            if os.path.dirname(filename) == self.path:
+                self._free.append(filename)
+
+
+scratch_directory = ScratchDirectory()
@@ -25,11 +25,17 @@ class EPANETError(Exception):
             details: error details (if available)
 
         """
+        self.description = description
+        self.details = details
         msg = f"Error {self.code} - {description}"
         if details:
             msg += f" {details}"
         super().__init__(msg)
 
+    def __reduce__(self):
+        # required for sending errors from worker processes
+        return type(self), (self.description, self.details)
+
     @property
     @abstractmethod
     def code(self):
@@ -0,0 +1,623 @@
+from __future__ import annotations
+import ctypes
+import ctypes.util
+import datetime
+import logging
+import os
+from functools import lru_cache
+from sys import platform as _platform
+from typing import Any, Optional, Union, TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from oopnet.elements.component_registry import ComponentNotExistingError
+from oopnet.report.report import SimulationReport
+from oopnet.simulator.binaryfile_reader import LINK_VARS, NODE_VARS, _to_xarray
+from oopnet.simulator.error_manager import ErrorManager
+from oopnet.simulator.scratch import scratch_directory
+from oopnet.simulator.simulation_errors import EPANETError, EPANETSimulationError, get_error_list
+from oopnet.writer.write import write_string
+
+if TYPE_CHECKING:
+    from oopnet.elements.network import Network
+
+logger = logging.getLogger(__name__)
+
+Modification = dict[str, dict[str, Any]]
+
+# node parameter codes of the EPANET toolkit
+EN_ELEVATION = 0
+EN_BASEDEMAND = 1
+EN_EMITTER = 3
+EN_INITQUAL = 4
+EN_TANKLEVEL = 8
+EN_DEMAND = 9
+EN_HEAD = 10
+EN_PRESSURE = 11
+EN_QUALITY = 12
+
+# link parameter codes of the EPANET toolkit
+EN_DIAMETER = 0
+EN_LENGTH = 1
+EN_ROUGHNESS = 2
+EN_MINORLOSS = 3
+EN_INITSTATUS = 4
+EN_INITSETTING = 5
+EN_KBULK = 6
+EN_KWALL = 7
+EN_FLOW = 8
+EN_VELOCITY = 9
+EN_HEADLOSS = 10
+EN_SETTING = 12
+EN_LINKQUAL = 14
+EN_PUMP_STATE = 16
+
+# other toolkit codes
+EN_DURATION = 0
+EN_REPORTSTEP = 3
+EN_REPORTSTART = 4
+EN_NODECOUNT = 0
+EN_LINKCOUNT = 2
+EN_PIPE = 1
+EN_PUMP = 2
+EN_NOSAVE = 0
+EN_INITFLOW = 10
+EN_MAXID = 31
+
+# OOPNET attribute names and the corresponding toolkit parameter codes
+NODE_PARAMETERS = {
+    "elevation": EN_ELEVATION,
+    "head": EN_ELEVATION,
+    "demand": EN_BASEDEMAND,
+    "emittercoefficient": EN_EMITTER,
+    "initialquality": EN_INITQUAL,
+    "initlevel": EN_TANKLEVEL,
+}
+LINK_PARAMETERS = {
+    "diameter": EN_DIAMETER,
+    "length": EN_LENGTH,
+    "roughness": EN_ROUGHNESS,
+    "minorloss": EN_MINORLOSS,
+    "reactionbulk": EN_KBULK,
+    "reactionwall": EN_KWALL,
+    "speed": EN_INITSETTING,
+    "maximum_pressure": EN_INITSETTING,
+    "pressure_limit": EN_INITSETTING,
+    "pressure_drop": EN_INITSETTING,
+    "maximum_flow": EN_INITSETTING,
+    "headloss_coefficient": EN_INITSETTING,
+}
+
+_LIBRARY_NAMES = {"win32": "epanet2.dll", "darwin": "libepanet2.dylib"}
+
+
+class EPANETToolkitError(EPANETError):
+    """Error returned by an EPANET toolkit function that doesn't correspond to one of the dedicated errors in
+    :mod:`~oopnet.simulator.simulation_errors`.
+
+    Attributes:
+        code: error code returned by the toolkit function
+
+    """
+
+    code = None
+
+    def __init__(self, code: int, description: str):
+        self.code = code
+        super().__init__(description, None)
+
+    def __reduce__(self):
+        return type(self), (self.code, self.description)
+
+
+@lru_cache(maxsize=None)
+def load_library(library: Optional[str] = None) -> ctypes.CDLL:
+    """Loads the EPANET 2.2 shared library and declares the signatures of the toolkit functions used by OOPNET.
+
+    The library is loaded only once per process and name.
+
+    Args:
+        library: file name or path of the library. If None, the library is looked up on the system's library search
+            path.
+
+    Raises:
+        OSError if the library can't be found or loaded.
+
+    Returns:
+        the loaded library
+
+    """
+    if library is None:
+        library = ctypes.util.find_library("epanet2") or _LIBRARY_NAMES.get(
+            _platform, "libepanet2.so"
+        )
+    lib = ctypes.CDLL(library)
+
+    project = ctypes.c_void_p
+    integer, long, double = ctypes.c_int, ctypes.c_long, ctypes.c_double
+    pointer = ctypes.POINTER
+    signatures = {
+        "EN_createproject": [pointer(project)],
+        "EN_deleteproject": [project],
+        "EN_open": [project, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p],
+        "EN_close": [project],
+        "EN_geterror": [integer, ctypes.c_char_p, integer],
+        "EN_getcount": [project, integer, pointer(integer)],
+        "EN_getnodeid": [project, integer, ctypes.c_char_p],
+        "EN_getlinkid": [project, integer, ctypes.c_char_p],
+        "EN_getlinktype": [project, integer, pointer(integer)],
+        "EN_getqualtype": [project, pointer(integer), pointer(integer)],
+        "EN_gettimeparam": [project, integer, pointer(long)],
+        "EN_getnodevalue": [project, integer, integer, pointer(double)],
+        "EN_setnodevalue": [project, integer, integer, double],
+        "EN_getlinkvalue": [project, integer, integer, pointer(double)],
+        "EN_setlinkvalue": [project, integer, integer, double],
+        "EN_openH": [project],
+        "EN_initH": [project, integer],
+        "EN_runH": [project, pointer(long)],
+        "EN_nextH": [project, pointer(long)],
+        "EN_closeH": [project],
+        "EN_openQ": [project],
+        "EN_initQ": [project, integer],
+        "EN_runQ": [project, pointer(long)],
+        "EN_nextQ": [project, pointer(long)],
+        "EN_closeQ": [project],
+    }
+    # vectorised getters are only available since EPANET 2.3
+    optional = {
+        "EN_getnodevalues": [project, integer, pointer(double)],
+        "EN_getlinkvalues": [project, integer, pointer(double)],
+    }
+    for name, argtypes in list(signatures.items()) + list(optional.items()):
+        try:
+            function = getattr(lib, name)
+        except AttributeError:
+            if name in optional:
+                continue
+            raise
+        function.argtypes = argtypes
+        function.restype = integer
+    return lib
+
+
+class ToolkitSimulator:
+    """Runs EPANET simulations in-process with the EPANET toolkit (shared library).
+
+    Unlike :meth:`~oopnet.elements.network.Network.run`, which starts EPANET as a new process, writes an input file and
+    parses the simulation results for every simulation, the ToolkitSimulator loads the model into the EPANET library
+    once. Parameter changes are passed to EPANET with the toolkit's setter functions and the hydraulic and water
+    quality analyses run in-process without writing any files. The results are read from EPANET's memory into NumPy
+    arrays, which makes the ToolkitSimulator suitable for thousands of evaluations of the same model.
+
+    The model is loaded from a snapshot of the Network when the ToolkitSimulator is created. Later changes to the
+    Network don't affect the ToolkitSimulator and vice versa. The units of the toolkit's parameters and results are the
+    units of the Network (e.g., LPS and mm for Networks read with OOPNET).
+
+    The simulation results have the same structure as those read by
+    :class:`~oopnet.simulator.binaryfile_reader.BinaryFileReader`, but the Links' settings are in the Network's units.
+    Since the toolkit doesn't provide reaction rates and friction factors, the "Reaction" and "F-Factor" results are
+    NaN.
+
+    Attributes:
+        network: OOPNET network object the model was loaded from
+        startdatetime: start of the simulation used for the reporting times
+        node_ids: Node IDs in the order of EPANET's Node indices
+        link_ids: Link IDs in the order of EPANET's Link indices
+
+    Examples:
+        >>> with ToolkitSimulator(network) as simulator:
+        ...     for diameter in (100.0, 150.0, 200.0):
+        ...         simulator.set_link_value('P-01', 'diameter', diameter)
+        ...         rpt = simulator.run()
+
+    """
+
+    def __init__(
+        self,
+        network: Network,
+        library: Optional[str] = None,
+        startdatetime: Optional[datetime.datetime] = None,
+    ):
+        """ToolkitSimulator init method.
+
+        Args:
+            network: OOPNET network object
+            library: file name or path of the EPANET shared library. If None, the library is looked up on the system's
+                library search path.
+            startdatetime: start of the simulation used for the reporting times
+
+        Raises:
+            EPANETSimulationError if EPANET can't load the model.
+
+        """
+        self.network = network
+        self.startdatetime = startdatetime
+        self._project = None
+        self._filename = None
+        self._quality = False
+        self._warnings: set[str] = set()
+        self._lib = load_library(library)
+        self._open()
+
+    def __enter__(self) -> ToolkitSimulator:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def _check(self, code: int):
+        """Raises an exception for toolkit error codes and stores warnings.
+
+        Args:
+            code: code returned by a toolkit function
+
+        Raises:
+            EPANETSimulationError containing the error
+
+        """
+        if code == 0:
+            return
+        buffer = ctypes.create_string_buffer(256)
+        self._lib.EN_geterror(code, buffer, 255)
+        message = buffer.value.decode()
+        if code < 100:
+            self._warnings.add(message)
+            return
+        # the toolkit's messages start with "Error <code>: "
+        description = message.split(": ", 1)[-1]
+        for error in get_error_list():
+            if error.code == code:
+                raise EPANETSimulationError([error(description, None)])
+        raise EPANETSimulationError([EPANETToolkitError(code, description)])
+
+    def _open(self):
+        """Loads the Network into the EPANET library.
+
+        The input file is written once to the RAM-backed scratch directory and removed as soon as EPANET has read it.
+        The report file stays open while the model is loaded and only receives warnings.
+
+        """
+        self._filename = scratch_directory.acquire()
+        with open(self._filename, "w") as fid:
+            fid.write(write_string(self.network))
+
+        project = ctypes.c_void_p()
+        self._check(self._lib.EN_createproject(ctypes.byref(project)))
+        self._project = project
+        try:
+            self._check_loading(
+                self._lib.EN_open(
+                    project, self._filename.encode(), self._report_filename.encode(), b""
+                )
+            )
+        finally:
+            os.remove(self._filename)
+
+        self.node_ids = [
+            self._get_id(self._lib.EN_getnodeid, index) for index in range(1, self._count(EN_NODECOUNT) + 1)
+        ]
+        self.link_ids = [
+            self._get_id(self._lib.EN_getlinkid, index) for index in range(1, self._count(EN_LINKCOUNT) + 1)
+        ]
+        self._node_index = {id: index for index, id in enumerate(self.node_ids, 1)}
+        self._link_index = {id: index for index, id in enumerate(self.link_ids, 1)}
+        link_type = ctypes.c_int()
+        types = []
+        for index in range(1, len(self.link_ids) + 1):
+            self._check(self._lib.EN_getlinktype(project, index, ctypes.byref(link_type)))
+            types.append(link_type.value)
+        types = np.array(types)
+        self._pipes = types <= EN_PIPE
+        self._pumps = types == EN_PUMP
+
+        quality_type, trace_node = ctypes.c_int(), ctypes.c_int()
+        self._check(self._lib.EN_getqualtype(project, ctypes.byref(quality_type), ctypes.byref(trace_node)))
+        # the network's topology is checked when the hydraulic solver is opened
+        self._check_loading(self._lib.EN_openH(project))
+        if quality_type.value != 0:
+            self._check_loading(self._lib.EN_openQ(project))
+            self._quality = True
+        self._node_buffer = (ctypes.c_double * len(self.node_ids))()
+        self._link_buffer = (ctypes.c_double * len(self.link_ids))()
+
+    @property
+    def _report_filename(self) -> str:
+        return self._filename.replace(".inp", ".rpt")
+
+    def _check_loading(self, code: int):
+        """Checks the code returned by a toolkit function while loading the model.
+
+        Details about input errors are only written to the report file, which is complete once the model has been
+        closed. In case of an error, the model is therefore closed and the errors are read from the report file like
+        for command line EPANET simulations.
+
+        Args:
+            code: code returned by a toolkit function
+
+        Raises:
+            EPANETSimulationError containing the errors
+
+        """
+        if code <= 100:
+            self._check(code)
+            return
+        project, self._project = self._project, None
+        self._lib.EN_close(project)
+        self._lib.EN_deleteproject(project)
+        error_manager = ErrorManager()
+        error_manager.check_file(self._report_filename)
+        self._remove_files()
+        error_manager.raise_errors()
+        self._check(code)
+
+    def close(self):
+        """Closes the model and releases the memory used by the EPANET library."""
+        if self._project is None:
+            return
+        project, self._project = self._project, None
+        self._lib.EN_closeH(project)
+        if self._quality:
+            self._lib.EN_closeQ(project)
+        self._lib.EN_close(project)
+        self._lib.EN_deleteproject(project)
+        self._remove_files()
+
+    def _remove_files(self):
+        """Removes the report file and releases the file name."""
+        if os.path.isfile(self._report_filename):
+            os.remove(self._report_filename)
+        scratch_directory.release(self._filename)
+
+    def _count(self, code: int) -> int:
+        """Returns the number of components of a type."""
+        count = ctypes.c_int()
+        self._check(self._lib.EN_getcount(self._project, code, ctypes.byref(count)))
+        return count.value
+
+    def _get_id(self, function, index: int) -> str:
+        """Returns the ID of a Node or Link by its index."""
+        buffer = ctypes.create_string_buffer(EN_MAXID + 1)
+        self._check(function(self._project, index, buffer))
+        return buffer.value.decode()
+
+    def _time_parameter(self, code: int) -> int:
+        """Returns a time parameter in seconds."""
+        value = ctypes.c_long()
+        self._check(self._lib.EN_gettimeparam(self._project, code, ctypes.byref(value)))
+        return value.value
+
+    @staticmethod
+    def _parameter(parameter: Union[str, int], parameters: dict[str, int]) -> int:
+        """Converts an OOPNET attribute name to a toolkit parameter code."""
+        if isinstance(parameter, int):
+            return parameter
+        try:
+            return parameters[parameter]
+        except KeyError:
+            raise ValueError(f"Parameter {parameter!r} isn't supported by the EPANET toolkit.") from None
+
+    def get_node_value(self, id: str, parameter: Union[str, int]) -> float:
+        """Returns a Node parameter.
+
+        Args:
+            id: Node ID
+            parameter: OOPNET attribute name (e.g. "elevation" or "demand") or toolkit parameter code
+
+        Returns:
+            parameter value
+
+        """
+        value = ctypes.c_double()
+        code = self._parameter(parameter, NODE_PARAMETERS)
+        self._check(self._lib.EN_getnodevalue(self._project, self._node_index[id], code, ctypes.byref(value)))
+        return value.value
+
+    def set_node_value(self, id: str, parameter: Union[str, int], value: float):
+        """Changes a Node parameter for all following simulations.
+
+        Args:
+            id: Node ID
+            parameter: OOPNET attribute name (e.g. "elevation" or "demand") or toolkit parameter code. The demand of
+                Junctions with several demands is the demand of the first demand category.
+            value: new value in the Network's units
+
+        """
+        code = self._parameter(parameter, NODE_PARAMETERS)
+        self._check(self._lib.EN_setnodevalue(self._project, self._node_index[id], code, float(value)))
+
+    def get_link_value(self, id: str, parameter: Union[str, int]) -> Union[float, str]:
+        """Returns a Link parameter.
+
+        Args:
+            id: Link ID
+            parameter: OOPNET attribute name (e.g. "diameter" or "roughness"), "status" or toolkit parameter code
+
+        Returns:
+            parameter value. For "status", either "OPEN" or "CLOSED".
+
+        """
+        value = ctypes.c_double()
+        if parameter == "status":
+            self._check(
+                self._lib.EN_getlinkvalue(self._project, self._link_index[id], EN_INITSTATUS, ctypes.byref(value))
+            )
+            return "CLOSED" if value.value == 0.0 else "OPEN"
+        code = self._parameter(parameter, LINK_PARAMETERS)
+        self._check(self._lib.EN_getlinkvalue(self._project, self._link_index[id], code, ctypes.byref(value)))
+        return value.value
+
+    def set_link_value(self, id: str, parameter: Union[str, int], value: Union[float, str]):
+        """Changes a Link parameter for all following simulations.
+
+        Args:
+            id: Link ID
+            parameter: OOPNET attribute name (e.g. "diameter", "roughness", "speed" or "maximum_pressure"), "status" or
+                toolkit parameter code
+            value: new value in the Network's units. The status is either "OPEN" or "CLOSED". Like in EPANET input
+                files, opening a Valve makes it active again.
+
+        """
+        index = self._link_index[id]
+        if parameter != "status":
+            code = self._parameter(parameter, LINK_PARAMETERS)
+            self._check(self._lib.EN_setlinkvalue(self._project, index, code, float(value)))
+        elif value == "CLOSED" or self._pipes[index - 1] or self._pumps[index - 1]:
+            status = 0.0 if value == "CLOSED" else 1.0
+            self._check(self._lib.EN_setlinkvalue(self._project, index, EN_INITSTATUS, status))
+        else:
+            # assigning a Valve's setting removes a fixed status
+            setting = ctypes.c_double()
+            self._check(self._lib.EN_getlinkvalue(self._project, index, EN_INITSETTING, ctypes.byref(setting)))
+            self._check(self._lib.EN_setlinkvalue(self._project, index, EN_INITSETTING, setting.value))
+
+    def apply(self, modification: Modification) -> Modification:
+        """Changes several Node and Link parameters for all following simulations.
+
+        Args:
+            modification: dictionary with OOPNET attribute names as keys and dictionaries mapping Node and Link IDs to
+                new values as values, like the modifications passed to :func:`~oopnet.simulator.batch.run_batch`
+
+        Raises:
+            ComponentNotExistingError if a Node or Link does not exist. ValueError if a parameter isn't supported. The
+            parameters changed before the error occurred are restored.
+
+        Returns:
+            modification restoring the previous values
+
+        """
+        previous = {}
+        try:
+            for attribute, values in modification.items():
+                for id, value in values.items():
+                    if id in self._node_index and (attribute in NODE_PARAMETERS or id not in self._link_index):
+                        previous.setdefault(attribute, {})[id] = self.get_node_value(id, attribute)
+                        self.set_node_value(id, attribute, value)
+                    elif id in self._link_index:
+                        previous.setdefault(attribute, {})[id] = self.get_link_value(id, attribute)
+                        self.set_link_value(id, attribute, value)
+                    else:
+                        raise ComponentNotExistingError(id)
+        except Exception:
+            self.apply(previous)
+            raise
+        return previous
+
+    def _node_values(self, code: int) -> np.ndarray:
+        """Returns a Node result or parameter of all Nodes."""
+        return self._values(self._lib.EN_getnodevalue, "EN_getnodevalues", self._node_buffer, code)
+
+    def _link_values(self, code: int) -> np.ndarray:
+        """Returns a Link result or parameter of all Links."""
+        return self._values(self._lib.EN_getlinkvalue, "EN_getlinkvalues", self._link_buffer, code)
+
+    def _values(self, getter, vectorised: str, buffer: ctypes.Array, code: int) -> np.ndarray:
+        """Reads the values of all Nodes or Links with a single call if the library supports it."""
+        if hasattr(self._lib, vectorised):
+            self._check(getattr(self._lib, vectorised)(self._project, code, buffer))
+        else:
+            value = ctypes.c_double()
+            for index in range(len(buffer)):
+                self._check(getter(self._project, index + 1, code, ctypes.byref(value)))
+                buffer[index] = value.value
+        return np.array(buffer)
+
+    def _collect(self, node_results: list[np.ndarray], link_results: list[np.ndarray], length: np.ndarray):
+        """Appends the results of the current time step in the layout of EPANET's binary output file."""
+        nodes = np.empty((len(NODE_VARS), len(self.node_ids)))
+        for row, code in enumerate((EN_DEMAND, EN_HEAD, EN_PRESSURE)):
+            nodes[row] = self._node_values(code)
+        nodes[3] = self._node_values(EN_QUALITY) if self._quality else 0.0
+
+        links = np.full((len(LINK_VARS), len(self.link_ids)), np.nan)
+        links[0] = self._link_values(EN_FLOW)
+        links[1] = self._link_values(EN_VELOCITY)
+        # the binary output file contains the head loss per 1000 length units for Pipes
+        headloss = self._link_values(EN_HEADLOSS)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            headloss[self._pipes] = np.where(
+                length[self._pipes] > 0.0, 1000.0 * headloss[self._pipes] / length[self._pipes], 0.0
+            )
+        links[2] = headloss
+        links[3] = self._link_values(EN_LINKQUAL) if self._quality else 0.0
+        links[4] = self._link_values(EN_PUMP_STATE)
+        links[5] = self._link_values(EN_SETTING)
+        node_results.append(nodes)
+        link_results.append(links)
+
+    def run(self, modification: Optional[Modification] = None) -> SimulationReport:
+        """Runs a simulation in-process.
+
+        Args:
+            modification: optional dictionary with OOPNET attribute names as keys and dictionaries mapping Node and
+                Link IDs to new values as values. The modification is only used for this simulation and the previous
+                values are restored afterwards.
+
+        Raises:
+            EPANETSimulationError if EPANET can't solve the model.
+
+        Returns:
+            OOPNET report object
+
+        """
+        if self._project is None:
+            raise ValueError("The ToolkitSimulator has been closed.")
+        previous = self.apply(modification) if modification else None
+        self._warnings.clear()
+        try:
+            return self._simulate()
+        finally:
+            if previous:
+                self.apply(previous)
+            # EPANET issues warnings for every time step, but they are logged only once per simulation
+            for message in sorted(self._warnings):
+                logger.warning(message)
+
+    def _simulate(self) -> SimulationReport:
+        """Solves the hydraulics and water quality step by step and collects the results at the reporting times."""
+        lib, project = self._lib, self._project
+        duration = self._time_parameter(EN_DURATION)
+        report_start = self._time_parameter(EN_REPORTSTART)
+        report_step = self._time_parameter(EN_REPORTSTEP)
+        elevation = self._node_values(EN_ELEVATION)
+        length = self._link_values(EN_LENGTH)
+        diameter = self._link_values(EN_DIAMETER)
+
+        node_results, link_results = [], []
+        time, step, quality_step = ctypes.c_long(), ctypes.c_long(), ctypes.c_long()
+        # flows are reinitialised, otherwise the previous simulation's flows would be used as initial values
+        self._check(lib.EN_initH(project, EN_INITFLOW))
+        if self._quality:
+            self._check(lib.EN_initQ(project, EN_NOSAVE))
+        report_time = report_start
+        while True:
+            self._check(lib.EN_runH(project, ctypes.byref(time)))
+            if self._quality:
+                self._check(lib.EN_runQ(project, ctypes.byref(time)))
+            if time.value >= report_time:
+                self._collect(node_results, link_results, length)
+                report_time += report_step
+            self._check(lib.EN_nextH(project, ctypes.byref(step)))
+            if self._quality:
+                self._check(lib.EN_nextQ(project, ctypes.byref(quality_step)))
+            if step.value <= 0:
+                break
+
+        times = None
+        if duration > 0:
+            startdatetime = self.startdatetime or datetime.datetime(year=2016, month=1, day=1)
+            times = pd.date_range(
+                start=startdatetime + datetime.timedelta(seconds=report_start),
+                periods=len(node_results),
+                freq=pd.Timedelta(seconds=report_step),
+            )
+        nodes = _to_xarray(
+            np.stack(node_results), [("Elevation", elevation)], self.node_ids, NODE_VARS, times
+        )
+        links = _to_xarray(
+            np.stack(link_results), [("Length", length), ("Diameter", diameter)], self.link_ids, LINK_VARS, times
+        )
+        return SimulationReport.from_arrays(nodes, links)
@@ -9,5 +9,7 @@ from .add_element import (
     add_valve,
     add_node,
     add_link,
+    add_nodes,
+    add_links,
     add_rule,
 )
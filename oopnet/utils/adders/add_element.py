@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Union, TYPE_CHECKING
+from typing import Iterable, Union, TYPE_CHECKING
 import logging
 
 from oopnet.utils.oopnet_logging import logging_decorator
@@ -16,6 +16,7 @@ from oopnet.elements.system_operation import Curve, Pattern
 if TYPE_CHECKING:
     from oopnet.elements.system_operation import Rule
     from oopnet.elements.base import NetworkComponent
+    from oopnet.elements.component_registry import SuperComponentRegistry
     from oopnet.elements.network import Network
 
 logger = logging.getLogger(__name__)
@@ -37,6 +38,43 @@ def _add_component(
     component_hash[obj.id] = obj
 
 
+@logging_decorator(logger)
+def _add_components(
+    objs: Iterable[NetworkComponent],
+    network: Network,
+    super_registry: SuperComponentRegistry,
+    registries: dict[type, str],
+    kind: str,
+):
+    """Adds several NetworkComponents to the ComponentRegistries of a SuperComponentRegistry.
+
+    The components are grouped by their type and all groups are added at once.
+
+    Args:
+        objs: NetworkComponents that shall be added
+        network: Network to which the NetworkComponents are added
+        super_registry: SuperComponentRegistry to which the NetworkComponents are added
+        registries: component types and the keys of the registries they are added to
+        kind: name of the component kind used in error messages
+
+    """
+    groups = {key: [] for key in registries.values()}
+    for obj in objs:
+        for cls, key in registries.items():
+            if isinstance(obj, cls):
+                groups[key].append(obj)
+                break
+        else:
+            raise TypeError(
+                f"Only {kind} types ({', '.join(cls.__name__ for cls in registries)}) can be passed to this "
+                f"function but an object of type {type(obj)} was passed."
+            )
+    for group in groups.values():
+        for obj in group:
+            obj._network = network
+    super_registry.add_many(groups)
+
+
 def add_pattern(network: Network, pattern: Pattern):
     """Adds a Pattern to an OOPNET network object.
 
@@ -176,3 +214,43 @@ def add_link(network: Network, link: Union[Pipe, Pump, Valve]):
             f"Only Link types (Pipe, Pump, Valve) can be passed to this function but an object of "
             f"type {type(link)} was passed."
         )
+
+
+def add_nodes(network: Network, nodes: Iterable[Union[Junction, Reservoir, Tank]]):
+    """Adds several Nodes to an OOPNET network object at once.
+
+    This is considerably faster than adding the Nodes one by one with add_node, because the IDs of all Nodes are
+    checked for uniqueness at once.
+
+    Args:
+      network: OOPNET network object
+      nodes: Node objects to add to the network
+
+    """
+    _add_components(
+        nodes,
+        network,
+        network._nodes,
+        {Junction: "junctions", Reservoir: "reservoirs", Tank: "tanks"},
+        "Node",
+    )
+
+
+def add_links(network: Network, links: Iterable[Union[Pipe, Pump, Valve]]):
+    """Adds several Links to an OOPNET network object at once.
+
+    This is considerably faster than adding the Links one by one with add_link, because the IDs of all Links are
+    checked for uniqueness at once.
+
+    Args:
+      network: OOPNET network object
+      links: Link objects to add to the network
+
+    """
+    _add_components(
+        links,
+        network,
+        network._links,
+        {Pipe: "pipes", Pump: "pumps", Valve: "valves"},
+        "Link",
+    )
@@ -1,13 +1,14 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Callable, TypeVar, TYPE_CHECKING
+import functools
 
 import numpy as np
 import pandas as pd
 
+from oopnet.elements.column_store import attribute_values, stored_values
 from oopnet.utils.getters.element_lists import (
     get_links,
     get_link_ids,
-    get_pipes,
     get_pipe_ids,
     get_nodes,
     get_node_ids,
@@ -22,8 +23,69 @@ from oopnet.utils.getters.element_lists import (
 if TYPE_CHECKING:
     from oopnet.elements.network import Network
 
+GetterResult = TypeVar("GetterResult", pd.Series, pd.DataFrame)
+
+
+def _read_only(result: GetterResult) -> GetterResult:
+    """Creates a version of a getter result whose values can't be changed.
+
+    Args:
+        result: pandas Series or DataFrame
+
+    Returns:
+        pandas Series or DataFrame sharing a read-only array with the result
+
+    """
+    values = result.to_numpy()
+    values.flags.writeable = False
+    if isinstance(result, pd.Series):
+        read_only = pd.Series(values, index=result.index, name=result.name, copy=False)
+    else:
+        read_only = pd.DataFrame(values, index=result.index, columns=result.columns, copy=False)
+    if "units" in result.__dict__:
+        read_only.units = result.units
+    return read_only
+
+
+def _memoised(
+    getter: Callable[[Network], GetterResult]
+) -> Callable[[Network], GetterResult]:
+    """Caches the results of a getter function per Network.
+
+    The result is stored in the Network together with its version and the versions of its Node and Link registries.
+    As long as no Node or Link is added, removed or renamed and none of their attributes change, the cached result is
+    returned instead of collecting the values from the components again. Changes made in place, like appending to a
+    list of demands, aren't noticed.
+
+    The cached values are read-only and every call returns a shallow copy sharing them, so a cache hit doesn't depend on
+    the size of the Network. Changing the values of a result in place raises a ValueError, use a copy instead.
+
+    Args:
+        getter: getter function taking a Network as only argument
+
+    Returns:
+        memoised getter function
+
+    """
+
+    @functools.wraps(getter)
+    def wrapper(network: Network) -> GetterResult:
+        version = (network._version_, network._nodes.version, network._links.version)
+        cached = network._getters_.get(getter.__name__)
+        if cached is None or cached[0] != version:
+            cached = (version, _read_only(getter(network)))
+            network._getters_[getter.__name__] = cached
+        result = cached[1]
+        copy = result.copy(deep=False)
+        if "units" in result.__dict__:
+            copy.units = result.units
+        return copy
+
+    return wrapper
+
 
 # Links:
+@_memoised
 def get_startnodes(network: Network) -> pd.Series:
     """Gets all start nodes of all Links in the Network as a pandas Series.
 
@@ -41,6 +103,7 @@ def get_startnodes(network: Network) -> pd.Series:
     return series
 
 
+@_memoised
 def get_endnodes(network: Network) -> pd.Series:
     """Gets all end nodes of all Links in the Network as a pandas Series..
 
@@ -58,6 +121,7 @@ def get_endnodes(network: Network) -> pd.Series:
     return series
 
 
+@_memoised
 def get_startendnodes(network: Network) -> pd.DataFrame:
     """Gets all start and endnodes of all Links in the Network as a pandas DataFrame.
 
@@ -73,6 +137,7 @@ def get_startendnodes(network: Network) -> pd.DataFrame:
     return pd.concat([s1, s2], axis=1)
 
 
+@_memoised
 def get_startendcoordinates(network: Network) -> pd.DataFrame:
     """Gets all start and end coordinates of all Links in the Network as a pandas DataFrame.
 
@@ -151,6 +216,7 @@ def get_setting(network: Network) -> pd.Series:
     return series
 
 
+@_memoised
 def get_linkcenter_coordinates(network: Network) -> pd.DataFrame:
     """Get the center coordinates of all Links in the Network as a pandas Dataframe.
 
@@ -193,6 +259,7 @@ def get_link_comment(network: Network) -> pd.Series:
 
 
 # Pipes
+@_memoised
 def get_length(network: Network) -> pd.Series:
     """Gets all length values of all Pipes in the Network as a pandas Series.
 
@@ -203,14 +270,15 @@ def get_length(network: Network) -> pd.Series:
       Pandas Series with Pink IDs as index and lengths as values.
 
     """
-    values = [x.length for x in get_pipes(network)]
+    values = attribute_values([network._links["pipes"]], "length")
     names = get_pipe_ids(network)
-    series = pd.Series(data=values, index=names, dtype=np.float64)
+    series = pd.Series(data=values, index=names, dtype=np.float64, copy=False)
     series.name = "pipe lengths"
     series.units = "m"
     return series
 
 
+@_memoised
 def get_diameter(network: Network) -> pd.Series:
     """Gets all diameter values of all Pipes and Valves in the Network as a pandas Series.
 
@@ -222,10 +290,10 @@ def get_diameter(network: Network) -> pd.Series:
 
     """
     ids = get_pipe_ids(network) + get_valve_ids(network)
-    diameters = [x.diameter for x in get_pipes(network)] + [
-        x.diameter for x in get_valves(network)
-    ]
-    series = pd.Series(data=diameters, index=ids, dtype=np.float64)
+    diameters = attribute_values(
+        [network._links["pipes"], network._links["valves"]], "diameter"
+    )
+    series = pd.Series(data=diameters, index=ids, dtype=np.float64, copy=False)
     series.name = "pipe diameters"
     series.units = "mm"
     return series
@@ -241,14 +309,15 @@ def get_roughness(network: Network) -> pd.Series:
       Pandas Series with Pipe IDs as index and roughness values as values.
 
     """
-    values = [x.roughness for x in get_pipes(network)]
+    values = attribute_values([network._links["pipes"]], "roughness")
     names = get_pipe_ids(network)
-    series = pd.Series(data=values, index=names, dtype=np.float64)
+    series = pd.Series(data=values, index=names, dtype=np.float64, copy=False)
     series.name = "pipe roughness"
     series.units = "mm" if network.options.headloss == "D-W" else "1"
     return series
 
 
+@_memoised
 def get_minorloss(network: Network) -> pd.Series:
     """Gets all minor loss coefficient values of all Pipes in the Network as a pandas Series.
 
@@ -259,9 +328,9 @@ def get_minorloss(network: Network) -> pd.Series:
       Pandas Series with Pipe IDs as index and minor loss coefficients as values.
 
     """
-    values = [x.minorloss for x in get_pipes(network)]
+    values = attribute_values([network._links["pipes"]], "minorloss")
     names = get_pipe_ids(network)
-    series = pd.Series(data=values, index=names, dtype=np.float64)
+    series = pd.Series(data=values, index=names, dtype=np.float64, copy=False)
     series.name = "pipe minor-losses"
     series.units = "1"
     return series
@@ -270,6 +339,7 @@ def get_minorloss(network: Network) -> pd.Series:
 # ToDo: Add quality parameters for Links
 
 # Nodes:
+@_memoised
 def get_xcoordinate(network: Network) -> pd.Series:
     """Gets all x coordinate values of all Nodes in the Network as a pandas Series.
 
@@ -280,14 +350,15 @@ def get_xcoordinate(network: Network) -> pd.Series:
       Pandas Series with Node IDs as index and x coordinates as values.
 
     """
-    values = [x.xcoordinate for x in get_nodes(network)]
+    values = attribute_values(network._nodes.values(), "xcoordinate")
     names = get_node_ids(network)
-    series = pd.Series(data=values, index=names, dtype=np.float64)
+    series = pd.Series(data=values, index=names, dtype=np.float64, copy=False)
     series.name = "node x-coordinate"
     series.units = "1"
     return series
 
 
+@_memoised
 def get_ycoordinate(network: Network) -> pd.Series:
     """Gets all y coordinate values of all Nodes in the Network as a pandas Series.
 
@@ -298,14 +369,15 @@ def get_ycoordinate(network: Network) -> pd.Series:
       Pandas Series with Node IDs as index and y coordinates as values.
 
     """
-    values = [x.ycoordinate for x in get_nodes(network)]
+    values = attribute_values(network._nodes.values(), "ycoordinate")
     names = get_node_ids(network)
-    series = pd.Series(data=values, index=names, dtype=np.float64)
+    series = pd.Series(data=values, index=names, dtype=np.float64, copy=False)
     series.name = "node y-coordinate"
     series.units = "1"
     return series
 
 
+@_memoised
 def get_coordinates(network: Network) -> pd.DataFrame:
     """Gets all x and y coordinate values of all Nodes in the Network as a pandas Dataframe
 
@@ -321,6 +393,7 @@ def get_coordinates(network: Network) -> pd.DataFrame:
     return pd.concat([s1, s2], axis=1)
 
 
+@_memoised
 def get_elevation(network: Network) -> pd.Series:
     """Gets all elevation values of all Nodes in the Network as a pandas Series.
 
@@ -331,14 +404,15 @@ def get_elevation(network: Network) -> pd.Series:
       Pandas Series with Node IDs as index and elevations as values.
 
     """
-    values = [x.elevation for x in get_nodes(network)]
+    values = attribute_values(network._nodes.values(), "elevation")
     names = get_node_ids(network)
-    series = pd.Series(data=values, index=names, dtype=np.float64)
+    series = pd.Series(data=values, index=names, dtype=np.float64, copy=False)
     series.name = "node elevation"
     series.units = "m"
     return series
 
 
+@_memoised
 def get_basedemand(network: Network) -> pd.Series:
     """Gets all base demand values of all Junctions in the Network as a pandas Series.
 
@@ -351,12 +425,14 @@ def get_basedemand(network: Network) -> pd.Series:
       Pandas Series with Node IDs as index and base demands as values.
 
     """
-    values = [
-        sum(x.demand) if isinstance(x.demand, list) else x.demand
-        for x in get_junctions(network)
-    ]
+    values = stored_values([network._nodes["junctions"]], "demand")
+    if values is None:
+        values = [
+            sum(x.demand) if isinstance(x.demand, list) else x.demand
+            for x in get_junctions(network)
+        ]
     names = get_junction_ids(network)
-    series = pd.Series(data=values, index=names, dtype=np.float64)
+    series = pd.Series(data=values, index=names, dtype=np.float64, copy=False)
     series.name = "base demand"
     series.units = "L/s"
     return series
@@ -28,6 +28,33 @@ def _filter_sort(alist: list[Union[Node, Link]]) -> list[Union[Node, Link]]:
     return list(adict.values())
 
 
+def _adjacency(network: Network) -> tuple[dict[str, dict[str, Link]], dict[str, int]]:
+    """Gets the Network's Node-Link adjacency index.
+
+    The index is created on first use and cached in the Network. It is recreated when the Node or Link registry's version
+    changes, i.e. when Nodes or Links are added, removed or renamed or a Link's start or end node changes.
+
+    Args:
+        network: Network the index is based on
+
+    Returns:
+        dictionary with Node IDs as keys and dictionaries with the IDs of the Links connected to the Node as keys and
+        the Links as values, and a dictionary with the Link IDs as keys and the Links' positions in get_links as values
+
+    """
+    version = (network._nodes.version, network._links.version)
+    if network._adjacency_ is None or network._adjacency_[0] != version:
+        adjacency = {}
+        positions = {}
+        for position, link in enumerate(get_links(network)):
+            positions[link.id] = position
+            for node in (link.startnode, link.endnode):
+                if node is not None:
+                    adjacency.setdefault(node.id, {})[link.id] = link
+        network._adjacency_ = (version, (adjacency, positions))
+    return network._adjacency_[1]
+
+
 def get_neighbor_links(network: Network, query_link: Link) -> list[Link]:
     """Gets Links that share a Node with the passed Link.
 
@@ -39,13 +66,13 @@ def get_neighbor_links(network: Network, query_link: Link) -> list[Link]:
         list of Links that are connected to the passed Link
 
     """
-    nodes = [query_link.startnode, query_link.endnode]
-    return [
-        link
-        for link in get_links(network)
-        if any(node in nodes for node in [link.startnode, link.endnode])
-        and link != query_link
-    ]
+    adjacency, positions = _adjacency(network)
+    links = {}
+    for node in (query_link.startnode, query_link.endnode):
+        if node is not None:
+            links.update(adjacency.get(node.id, {}))
+    links.pop(query_link.id, None)
+    return sorted(links.values(), key=lambda link: positions[link.id])
 
 
 def get_next_neighbor_links(network: Network, query_link: Link) -> list[Link]:
@@ -60,11 +87,12 @@ def get_next_neighbor_links(network: Network, query_link: Link) -> list[Link]:
 
     """
     neigh_links = get_neighbor_links(network, query_link)
+    neigh_ids = {link.id for link in neigh_links}
     nextneigh_links = [
         x
         for link in neigh_links
         for x in get_neighbor_links(network, link)
-        if x != query_link and x not in neigh_links
+        if x.id != query_link.id and x.id not in neigh_ids
     ]
     return _filter_sort(nextneigh_links)
 
@@ -80,10 +108,8 @@ def get_adjacent_links(network: Network, query_node: Node) -> list[Link]:
         list of Links that are connected to the passed Node
 
     """
-    adj_links = [
-        x for x in get_links(network) if query_node in [x.startnode, x.endnode]
-    ]
-    return _filter_sort(adj_links)
+    adjacency, _ = _adjacency(network)
+    return _filter_sort(list(adjacency.get(query_node.id, {}).values()))
 
 
 def get_neighbor_nodes(network: Network, query_node: Node) -> list[Node]:
@@ -99,7 +125,8 @@ def get_neighbor_nodes(network: Network, query_node: Node) -> list[Node]:
     """
     adj_links = get_adjacent_links(network, query_node)
     neigh_nodes = [
-        x.startnode if x.startnode != query_node else x.endnode for x in adj_links
+        x.startnode if x.startnode.id != query_node.id else x.endnode
+        for x in adj_links
     ]
     return _filter_sort(neigh_nodes)
 
@@ -116,11 +143,12 @@ def get_next_neighbor_nodes(network: Network, query_node: Node) -> list[Node]:
 
     """
     neigh_nodes = get_neighbor_nodes(network, query_node)
+    neigh_ids = {node.id for node in neigh_nodes}
     nextneigh_nodes = [
         x
         for node in neigh_nodes
         for x in get_neighbor_nodes(network, node)
-        if x != query_node and x not in neigh_nodes
+        if x.id != query_node.id and x.id not in neigh_ids
     ]
     return _filter_sort(nextneigh_nodes)
 
@@ -3,16 +3,10 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 
+from oopnet.elements.column_store import attribute_values
+
 if TYPE_CHECKING:
     from oopnet.elements.network import Network
-from oopnet.utils.getters.element_lists import (
-    get_pipes,
-    get_junctions,
-    get_nodes,
-    get_tanks,
-    get_reservoirs,
-    get_valves,
-)
 
 
 def v_length(network: Network) -> np.array:
@@ -25,7 +19,7 @@ def v_length(network: Network) -> np.array:
       length as numpy.ndarray
 
     """
-    return np.asarray([x.length for x in get_pipes(network)])
+    return attribute_values([network._links["pipes"]], "length")
 
 
 def v_diameter(network: Network) -> np.array:
@@ -38,7 +32,9 @@ def v_diameter(network: Network) -> np.array:
       diameter as numpy.ndarray
 
     """
-    return np.asarray([x.diameter for x in get_pipes(network) + get_valves(network)])
+    return attribute_values(
+        [network._links["pipes"], network._links["valves"]], "diameter"
+    )
 
 
 def v_roughness(network: Network) -> np.array:
@@ -51,7 +47,7 @@ def v_roughness(network: Network) -> np.array:
       roughness as numpy.ndarray
 
     """
-    return np.asarray([x.roughness for x in get_pipes(network)])
+    return attribute_values([network._links["pipes"]], "roughness")
 
 
 def v_minorloss(network: Network) -> np.array:
@@ -64,7 +60,7 @@ def v_minorloss(network: Network) -> np.array:
       minor loss coefficient as numpy.ndarray
 
     """
-    return np.asarray([x.minorloss for x in get_pipes(network)])
+    return attribute_values([network._links["pipes"]], "minorloss")
 
 
 def v_elevation(network: Network) -> np.array:
@@ -77,7 +73,9 @@ def v_elevation(network: Network) -> np.array:
       elevation as numpy.ndarray
 
     """
-    return np.asarray([x.elevation for x in get_nodes(network)])
+    return attribute_values(
+        [network._nodes["junctions"], network._nodes["tanks"], network._nodes["reservoirs"]], "elevation"
+    )
 
 
 def v_emittercoefficient(network: Network) -> np.array:
@@ -90,7 +88,7 @@ def v_emittercoefficient(network: Network) -> np.array:
       elevation as numpy.ndarray
 
     """
-    return np.asarray([x.emittercoefficient for x in get_junctions(network)])
+    return attribute_values([network._nodes["junctions"]], "emittercoefficient")
 
 
 def v_demand(network: Network) -> np.array:
@@ -103,7 +101,7 @@ def v_demand(network: Network) -> np.array:
       demand as numpy.ndarray
 
     """
-    return np.asarray([x.demand for x in get_junctions(network)])
+    return attribute_values([network._nodes["junctions"]], "demand")
 
 
 def v_head(network: Network) -> np.array:
@@ -116,7 +114,7 @@ def v_head(network: Network) -> np.array:
       head as numpy.ndarray
 
     """
-    return np.asarray([x.head for x in get_reservoirs(network)])
+    return attribute_values([network._nodes["reservoirs"]], "head")
 
 
 def v_initlevel(network: Network) -> np.array:
@@ -129,7 +127,7 @@ def v_initlevel(network: Network) -> np.array:
       initial levels as numpy.ndarray
 
     """
-    return np.asarray([x.initlevel for x in get_tanks(network)])
+    return attribute_values([network._nodes["tanks"]], "initlevel")
 
 
 def v_minlevel(network: Network) -> np.array:
@@ -142,7 +140,7 @@ def v_minlevel(network: Network) -> np.array:
       minimum levels as numpy.ndarray
 
     """
-    return np.asarray([x.minlevel for x in get_tanks(network)])
+    return attribute_values([network._nodes["tanks"]], "minlevel")
 
 
 def v_maxlevel(network: Network) -> np.array:
@@ -155,7 +153,7 @@ def v_maxlevel(network: Network) -> np.array:
       maximum levels as numpy.ndarray
 
     """
-    return np.asarray([x.maxlevel for x in get_tanks(network)])
+    return attribute_values([network._nodes["tanks"]], "maxlevel")
 
 
 def v_tankdiameter(network: Network) -> np.array:
@@ -168,7 +166,7 @@ def v_tankdiameter(network: Network) -> np.array:
       tank diameters as numpy.ndarray
 
     """
-    return np.asarray([x.diameter for x in get_tanks(network)])
+    return attribute_values([network._nodes["tanks"]], "diameter")
 
 
 def v_minvolume(network: Network) -> np.array:
@@ -181,7 +179,7 @@ def v_minvolume(network: Network) -> np.array:
       minimal volumes as numpy.ndarray
 
     """
-    return np.asarray([x.minvolume for x in get_tanks(network)])
+    return attribute_values([network._nodes["tanks"]], "minvolume")
 
 
 # todo: remove
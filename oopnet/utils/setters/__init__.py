@@ -0,0 +1,11 @@
+from .property_setters import (
+    set_attribute,
+    set_length,
+    set_diameter,
+    set_roughness,
+    set_minorloss,
+    set_xcoordinate,
+    set_ycoordinate,
+    set_elevation,
+    set_basedemand,
+)
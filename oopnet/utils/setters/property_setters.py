@@ -0,0 +1,345 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from oopnet.elements.component_registry import ComponentNotExistingError
+
+if TYPE_CHECKING:
+    from oopnet.elements.network import Network
+    from oopnet.elements.base import NetworkComponent
+    from oopnet.elements.component_registry import ComponentRegistry
+
+
+def _group_components(
+    registries: list[ComponentRegistry], ids: list[str]
+) -> list[tuple[ComponentRegistry, list[NetworkComponent], list[int]]]:
+    """Looks up components by their IDs and groups them by their ComponentRegistries.
+
+    All IDs are validated before anything is changed.
+
+    Args:
+        registries: ComponentRegistries the components are looked up in
+        ids: component IDs
+
+    Raises:
+        ComponentNotExistingError if an ID isn't found in the registries
+
+    Returns:
+        list of ComponentRegistries, the components found in them and the components' positions in ids
+
+    """
+    groups = [(registry, [], []) for registry in registries]
+    missing = []
+    for position, id in enumerate(ids):
+        for registry, components, positions in groups:
+            component = dict.get(registry, id)
+            if component is not None:
+                components.append(component)
+                positions.append(position)
+                break
+        else:
+            missing.append(str(id))
+    if missing:
+        raise ComponentNotExistingError(", ".join(missing))
+    return [group for group in groups if group[1]]
+
+
+def _assign(
+    registry: ComponentRegistry,
+    attribute: str,
+    values: np.ndarray,
+    components: Optional[list[NetworkComponent]] = None,
+):
+    """Assigns values to an attribute of all or several components of a ComponentRegistry.
+
+    If the registry has a column store containing the attribute, the values are assigned in a single vectorised
+    operation. Otherwise, the components are updated one after the other.
+
+    Args:
+        registry: ComponentRegistry
+        attribute: attribute name
+        values: scalar array or array with one value per component
+        components: components to be changed or None, to change all components of the registry
+
+    """
+    columns = registry.columns
+    if columns is not None and attribute in columns.names and values.dtype.kind in "fiu":
+        rows = None
+        if components is not None:
+            rows = np.fromiter(
+                (component._row_ for component in components),
+                dtype=np.intp,
+                count=len(components),
+            )
+        columns.assign(attribute, values, rows)
+        return
+    if components is None:
+        components = list(registry.values())
+    values = [values.item()] * len(components) if values.ndim == 0 else values.tolist()
+    for component, value in zip(components, values):
+        setattr(component, attribute, value)
+
+
+def _set_values(
+    registries: Iterable[ComponentRegistry],
+    attribute: str,
+    values: Union[pd.Series, np.ndarray, list, float],
+    ids: Optional[Iterable[str]] = None,
+):
+    """Assigns values to an attribute of the components in one or several ComponentRegistries.
+
+    Args:
+        registries: ComponentRegistries containing the components
+        attribute: attribute name
+        values: pandas Series with component IDs as index, a single value or an array-like with one value per component
+        ids: IDs of the components to be changed. If None, the index of the passed Series or all components in the
+            ComponentRegistries are used.
+
+    Raises:
+        ComponentNotExistingError if an ID isn't found in the ComponentRegistries. ValueError if the number of values
+        doesn't match the number of components.
+
+    """
+    registries = list(registries)
+    if isinstance(values, pd.Series):
+        if ids is not None:
+            raise ValueError("IDs can't be passed together with a pandas Series.")
+        ids = values.index
+        values = values.to_numpy()
+    values = np.asarray(values)
+    if ids is not None:
+        ids = list(ids)
+        # IDs in the order of the registries (e.g. from a getter) don't have to be looked up
+        if ids == [id for registry in registries for id in registry]:
+            ids = None
+    if ids is None:
+        groups = []
+        n = 0
+        for registry in registries:
+            groups.append((registry, None, slice(n, n + len(registry))))
+            n += len(registry)
+    else:
+        groups = _group_components(registries, ids)
+        n = len(ids)
+    if values.ndim > 1 or values.ndim == 1 and len(values) != n:
+        raise ValueError(
+            f"Number of values ({len(values)}) doesn't match the number of components ({n})."
+        )
+    for registry, components, positions in groups:
+        group_values = values if values.ndim == 0 else values[positions]
+        _assign(registry, attribute, group_values, components)
+
+
+def set_attribute(
+    network: Network,
+    attribute: str,
+    values: Union[pd.Series, np.ndarray, list, float],
+    ids: Optional[Iterable[str]] = None,
+):
+    """Sets an attribute of several Nodes or Links in a single pass.
+
+    All IDs are validated before anything is changed. If :func:`~oopnet.elements.column_store.enable_column_store` was
+    used, stored attributes are changed with a single vectorised operation per component type.
+
+    Args:
+      network: OOPNET network object
+      attribute: name of the attribute, e.g. "demand" or "roughness"
+      values: pandas Series with component IDs as index, a single value that is assigned to all components or an
+        array-like with one value per component
+      ids: IDs of the components to be changed. If None, the index of the passed Series or all Nodes and Links with the
+        attribute (ordered like :func:`~oopnet.utils.getters.get_node_ids` followed by
+        :func:`~oopnet.utils.getters.get_link_ids`) are used. Nodes are preferred over Links with the same ID.
+
+    Raises:
+        ComponentNotExistingError if no Node or Link with the attribute has one of the IDs. ValueError if the number of
+        values doesn't match the number of components.
+
+    Examples:
+        The following will increase all Junction demands by 10 %:
+        >>> set_attribute(network, "demand", get_basedemand(network) * 1.1)
+
+    """
+    registries = [
+        registry
+        for super_registry in (network._nodes, network._links)
+        for registry in super_registry.values()
+        if registry and hasattr(next(iter(registry.values())), attribute)
+    ]
+    _set_values(registries, attribute, values, ids)
+
+
+# Pipes
+def set_length(
+    network: Network,
+    values: Union[pd.Series, np.ndarray, list, float],
+    ids: Optional[Iterable[str]] = None,
+):
+    """Sets the lengths of several Pipes in a single pass.
+
+    Args:
+      network: OOPNET network object
+      values: pandas Series with Pipe IDs as index, a single value or an array-like ordered like
+        :func:`~oopnet.utils.getters.get_length`
+      ids: IDs of the Pipes to be changed or None, to change the Pipes in the Series' index or all Pipes
+
+    Raises:
+        ComponentNotExistingError if a Pipe doesn't exist. ValueError if the number of values doesn't match the number
+        of Pipes.
+
+    """
+    _set_values([network._links["pipes"]], "length", values, ids)
+
+
+def set_diameter(
+    network: Network,
+    values: Union[pd.Series, np.ndarray, list, float],
+    ids: Optional[Iterable[str]] = None,
+):
+    """Sets the diameters of several Pipes and Valves in a single pass.
+
+    Args:
+      network: OOPNET network object
+      values: pandas Series with Pipe/Valve IDs as index, a single value or an array-like ordered like
+        :func:`~oopnet.utils.getters.get_diameter`
+      ids: IDs of the Pipes/Valves to be changed or None, to change the Pipes/Valves in the Series' index or all Pipes
+        and Valves
+
+    Raises:
+        ComponentNotExistingError if a Pipe/Valve doesn't exist. ValueError if the number of values doesn't match the
+        number of Pipes/Valves.
+
+    """
+    _set_values(
+        [network._links["pipes"], network._links["valves"]], "diameter", values, ids
+    )
+
+
+def set_roughness(
+    network: Network,
+    values: Union[pd.Series, np.ndarray, list, float],
+    ids: Optional[Iterable[str]] = None,
+):
+    """Sets the roughness values of several Pipes in a single pass.
+
+    Args:
+      network: OOPNET network object
+      values: pandas Series with Pipe IDs as index, a single value or an array-like ordered like
+        :func:`~oopnet.utils.getters.get_roughness`
+      ids: IDs of the Pipes to be changed or None, to change the Pipes in the Series' index or all Pipes
+
+    Raises:
+        ComponentNotExistingError if a Pipe doesn't exist. ValueError if the number of values doesn't match the number
+        of Pipes.
+
+    """
+    _set_values([network._links["pipes"]], "roughness", values, ids)
+
+
+def set_minorloss(
+    network: Network,
+    values: Union[pd.Series, np.ndarray, list, float],
+    ids: Optional[Iterable[str]] = None,
+):
+    """Sets the minor loss coefficients of several Pipes in a single pass.
+
+    Args:
+      network: OOPNET network object
+      values: pandas Series with Pipe IDs as index, a single value or an array-like ordered like
+        :func:`~oopnet.utils.getters.get_minorloss`
+      ids: IDs of the Pipes to be changed or None, to change the Pipes in the Series' index or all Pipes
+
+    Raises:
+        ComponentNotExistingError if a Pipe doesn't exist. ValueError if the number of values doesn't match the number
+        of Pipes.
+
+    """
+    _set_values([network._links["pipes"]], "minorloss", values, ids)
+
+
+# Nodes
+def set_xcoordinate(
+    network: Network,
+    values: Union[pd.Series, np.ndarray, list, float],
+    ids: Optional[Iterable[str]] = None,
+):
+    """Sets the x coordinates of several Nodes in a single pass.
+
+    Args:
+      network: OOPNET network object
+      values: pandas Series with Node IDs as index, a single value or an array-like ordered like
+        :func:`~oopnet.utils.getters.get_xcoordinate`
+      ids: IDs of the Nodes to be changed or None, to change the Nodes in the Series' index or all Nodes
+
+    Raises:
+        ComponentNotExistingError if a Node doesn't exist. ValueError if the number of values doesn't match the number
+        of Nodes.
+
+    """
+    _set_values(network._nodes.values(), "xcoordinate", values, ids)
+
+
+def set_ycoordinate(
+    network: Network,
+    values: Union[pd.Series, np.ndarray, list, float],
+    ids: Optional[Iterable[str]] = None,
+):
+    """Sets the y coordinates of several Nodes in a single pass.
+
+    Args:
+      network: OOPNET network object
+      values: pandas Series with Node IDs as index, a single value or an array-like ordered like
+        :func:`~oopnet.utils.getters.get_ycoordinate`
+      ids: IDs of the Nodes to be changed or None, to change the Nodes in the Series' index or all Nodes
+
+    Raises:
+        ComponentNotExistingError if a Node doesn't exist. ValueError if the number of values doesn't match the number
+        of Nodes.
+
+    """
+    _set_values(network._nodes.values(), "ycoordinate", values, ids)
+
+
+def set_elevation(
+    network: Network,
+    values: Union[pd.Series, np.ndarray, list, float],
+    ids: Optional[Iterable[str]] = None,
+):
+    """Sets the elevations of several Nodes in a single pass.
+
+    Args:
+      network: OOPNET network object
+      values: pandas Series with Node IDs as index, a single value or an array-like ordered like
+        :func:`~oopnet.utils.getters.get_elevation`
+      ids: IDs of the Nodes to be changed or None, to change the Nodes in the Series' index or all Nodes
+
+    Raises:
+        ComponentNotExistingError if a Node doesn't exist. ValueError if the number of values doesn't match the number
+        of Nodes.
+
+    """
+    _set_values(network._nodes.values(), "elevation", values, ids)
+
+
+def set_basedemand(
+    network: Network,
+    values: Union[pd.Series, np.ndarray, list, float],
+    ids: Optional[Iterable[str]] = None,
+):
+    """Sets the base demands of several Junctions in a single pass.
+
+    Lists of demands are replaced by the new values.
+
+    Args:
+      network: OOPNET network object
+      values: pandas Series with Junction IDs as index, a single value or an array-like ordered like
+        :func:`~oopnet.utils.getters.get_basedemand`
+      ids: IDs of the Junctions to be changed or None, to change the Junctions in the Series' index or all Junctions
+
+    Raises:
+        ComponentNotExistingError if a Junction doesn't exist. ValueError if the number of values doesn't match the
+        number of Junctions.
+
+    """
+    _set_values([network._nodes["junctions"]], "demand", values, ids)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 import os
 from typing import Optional, TYPE_CHECKING
-from copy import deepcopy
 
 import numpy as np
 
@@ -73,13 +72,16 @@ def make_measurement(
 
 
 def copy(network):
-    """This function makes a deepcopy of an OOPNET network object
+    """This function makes an independent copy of an OOPNET network object
+
+    The copy is created with :meth:`~oopnet.elements.network.Network.clone`, which is considerably faster than a
+    deepcopy.
 
     Args:
       network: OOPNET network object
 
     Returns:
-      deepcopy of OOPNET network object
+      copy of OOPNET network object
 
     """
-    return deepcopy(network)
+    return network.clone()
@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+import io
+from typing import TextIO, TYPE_CHECKING
 import logging
 
 from oopnet.writer.module_reader import list_section_writer_callables
@@ -18,20 +19,14 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-@logging_decorator(logger)
-def write(network: Network, filename: str) -> int:
-    """Converts an OOPNET network to an EPANET input file and saves it with a desired filename.
+def _write_sections(network: Network, fid: TextIO):
+    """Writes all sections of an EPANET input file to a text stream.
 
     Args:
-      network: OOPNET network object which one wants to be written to a file
-      filename: desired filename/path were the user wants to store the file
-
-    Returns:
-      0 if successful
+      network: OOPNET network object to be written
+      fid: text stream the sections are written to
 
     """
-    logger.info(f"Writing network to {filename!r}")
-
     modules = [
         write_network_components,
         write_network_map_tags,
@@ -43,8 +38,41 @@ def write(network: Network, filename: str) -> int:
     all_functions = list_section_writer_callables(modules)
 
     newlist = sorted(all_functions, key=lambda x: x.priority)
+    for f in newlist:
+        f.writerfunction(network, fid)
+
+
+@logging_decorator(logger)
+def write(network: Network, filename: str) -> int:
+    """Converts an OOPNET network to an EPANET input file and saves it with a desired filename.
+
+    Args:
+      network: OOPNET network object which one wants to be written to a file
+      filename: desired filename/path were the user wants to store the file
+
+    Returns:
+      0 if successful
+
+    """
+    logger.info(f"Writing network to {filename!r}")
     with open(filename, "w") as fid:
-        for f in newlist:
-            f.writerfunction(network, fid)
+        _write_sections(network, fid)
 
     return 0
+
+
+@logging_decorator(logger)
+def write_string(network: Network) -> str:
+    """Converts an OOPNET network to the content of an EPANET input file in memory.
+
+    Args:
+      network: OOPNET network object to be converted
+
+    Returns:
+      content of the EPANET input file
+
+    """
+    logger.debug("Writing network to string")
+    buffer = io.StringIO()
+    _write_sections(network, buffer)
+    return buffer.getvalue()
@@ -31,10 +31,11 @@ def write_title(network: Network, fid: TextIOWrapper):
 
     """
     logger.debug("Writing title")
-    print("[TITLE]", file=fid)
+    lines = ["[TITLE]\n"]
     if network.title:
-        print(network.title, file=fid)
-    print("\n", file=fid)
+        lines.append(f"{network.title}\n")
+    lines.append("\n\n")
+    fid.write("".join(lines))
 
 
 @section_writer("JUNCTIONS", 1)
@@ -47,24 +48,20 @@ def write_junctions(network: Network, fid: TextIOWrapper):
 
     """
     logger.debug("Writing Junctions section")
-    print("[JUNCTIONS]", file=fid)
-    print(";id elevation demand demandpattern", file=fid)
+    lines = ["[JUNCTIONS]\n;id elevation demand demandpattern\n"]
     for j in get_junctions(network):
-        print(j.id, end=" ", file=fid)
-        print(j.elevation, end=" ", file=fid)
-        if isinstance(j.demand, list):
-            print(j.demand[0], end=" ", file=fid)
-        else:
-            print(j.demand, end=" ", file=fid)
+        demand = j.demand[0] if isinstance(j.demand, list) else j.demand
+        line = f"{j.id} {j.elevation} {demand} "
         if j.demandpattern is not None:
             if isinstance(j.demandpattern, list):
-                print(j.demandpattern[0].id, end=" ", file=fid)
+                line += f"{j.demandpattern[0].id} "
             else:
-                print(j.demandpattern.id, end=" ", file=fid)
+                line += f"{j.demandpattern.id} "
         if j.comment is not None:
-            print(";", j.comment, end=" ", file=fid)
-        print("\n", end=" ", file=fid)
-    print("\n", end=" ", file=fid)
+            line += f"; {j.comment} "
+        lines.append(line + "\n ")
+    lines.append("\n ")
+    fid.write("".join(lines))
 
 
 @section_writer("RESERVOIRS", 1)
@@ -77,17 +74,16 @@ def write_reservoirs(network: Network, fid: TextIOWrapper):
 
     """
     logger.debug("Writing Reservoirs section")
-    print("[RESERVOIRS]", file=fid)
-    print(";id head pattern", file=fid)
+    lines = ["[RESERVOIRS]\n;id head pattern\n"]
     for r in get_reservoirs(network):
-        print(r.id, end=" ", file=fid)
-        print(r.head, end=" ", file=fid)
+        line = f"{r.id} {r.head} "
         if r.headpattern is not None:
-            print(r.headpattern.id, end=" ", file=fid)
+            line += f"{r.headpattern.id} "
         if r.comment is not None:
-            print(";", r.comment, end=" ", file=fid)
-        print("\n", end=" ", file=fid)
-    print("\n", end=" ", file=fid)
+            line += f"; {r.comment} "
+        lines.append(line + "\n ")
+    lines.append("\n ")
+    fid.write("".join(lines))
 
 
 @section_writer("TANKS", 1)
@@ -100,30 +96,24 @@ def write_tanks(network: Network, fid: TextIOWrapper):
 
     """
     logger.debug("Writing Tanks section")
-    print("[TANKS]", file=fid)
-    print(
-        ";id elevation initlevel minlevel maxlevel diameter minvolume volumecurve",
-        file=fid,
-    )
+    lines = [
+        "[TANKS]\n;id elevation initlevel minlevel maxlevel diameter minvolume volumecurve\n"
+    ]
     for t in get_tanks(network):
-        print(t.id, end=" ", file=fid)
-        print(t.elevation, end=" ", file=fid)
-        print(t.initlevel, end=" ", file=fid)
-        print(t.minlevel, end=" ", file=fid)
-        print(t.maxlevel, end=" ", file=fid)
-        print(t.diameter, end=" ", file=fid)
+        line = f"{t.id} {t.elevation} {t.initlevel} {t.minlevel} {t.maxlevel} {t.diameter} "
         if t.minvolume is not None:
-            print(t.minvolume, end=" ", file=fid)
+            line += f"{t.minvolume} "
         if t.volumecurve is not None:
-            print(t.volumecurve.id, end=" ", file=fid)
-        elif t.overflow is not None: # in case the tank is overflowing and needs a placeholder
-            print("*", end=" ", file=fid)    
-        if t.overflow is not None: # Check if the tank is overflowing
-            print(t.overflow, end=" ", file=fid)
+            line += f"{t.volumecurve.id} "
+        elif t.overflow is not None:  # in case the tank is overflowing and needs a placeholder
+            line += "* "
+        if t.overflow is not None:  # Check if the tank is overflowing
+            line += f"{t.overflow} "
         if t.comment is not None:
-            print(";", t.comment, end=" ", file=fid)
-        print("\n", end=" ", file=fid)
-    print("\n", end=" ", file=fid)
+            line += f"; {t.comment} "
+        lines.append(line + "\n ")
+    lines.append("\n ")
+    fid.write("".join(lines))
 
 
 @section_writer("PIPES", 2)
@@ -136,26 +126,23 @@ def write_pipes(network: Network, fid: TextIOWrapper):
 
     """
     logger.debug("Writing Pipes section")
-    print("[PIPES]", file=fid)
-    print(
-        ";id startnode endnode length diameter roughness minorloss", file=fid
-    )  # status', file=fid)
+    lines = [
+        "[PIPES]\n;id startnode endnode length diameter roughness minorloss\n"
+    ]  # status'
     for p in get_pipes(network):
-        print(p.id, end=" ", file=fid)
+        line = f"{p.id} "
         if p.startnode is not None:
-            print(p.startnode.id, end=" ", file=fid)
+            line += f"{p.startnode.id} "
         if p.endnode is not None:
-            print(p.endnode.id, end=" ", file=fid)
-        print(p.length, end=" ", file=fid)
-        print(p.diameter, end=" ", file=fid)
-        print(p.roughness, end=" ", file=fid)
-        print(p.minorloss, end=" ", file=fid)
+            line += f"{p.endnode.id} "
+        line += f"{p.length} {p.diameter} {p.roughness} {p.minorloss} "
         if p.status == "CV":
-            print(p.status, end=" ", file=fid)
+            line += f"{p.status} "
         if p.comment is not None:
-            print(";", p.comment, end=" ", file=fid)
-        print("\n", end=" ", file=fid)
-    print("\n", end=" ", file=fid)
+            line += f"; {p.comment} "
+        lines.append(line + "\n ")
+    lines.append("\n ")
+    fid.write("".join(lines))
 
 
 @section_writer("PUMPS", 2)
@@ -168,26 +155,26 @@ def write_pumps(network: Network, fid: TextIOWrapper):
 
     """
     logger.debug("Writing Pumps section")
-    print("[PUMPS]", file=fid)
-    print(";id startnode endnode keyword value", file=fid)
+    lines = ["[PUMPS]\n;id startnode endnode keyword value\n"]
     for p in get_pumps(network):
-        print(p.id, end=" ", file=fid)
+        line = f"{p.id} "
         if p.startnode is not None:
-            print(p.startnode.id, end=" ", file=fid)
+            line += f"{p.startnode.id} "
         if p.endnode is not None:
-            print(p.endnode.id, end=" ", file=fid)
+            line += f"{p.endnode.id} "
         if p.power is not None:
-            print("POWER", p.power, end=" ", file=fid)
+            line += f"POWER {p.power} "
         if p.head is not None:
-            print("HEAD", p.head.id, end=" ", file=fid)
+            line += f"HEAD {p.head.id} "
         if p.speed is not None:
-            print("SPEED", p.speed, end=" ", file=fid)
+            line += f"SPEED {p.speed} "
         if p.pattern is not None:
-            print("PATTERN", p.pattern.id, end=" ", file=fid)
+            line += f"PATTERN {p.pattern.id} "
         if p.comment is not None:
-            print(";", p.comment, end=" ", file=fid)
-        print("\n", end=" ", file=fid)
-    print("\n", end=" ", file=fid)
+            line += f"; {p.comment} "
+        lines.append(line + "\n ")
+    lines.append("\n ")
+    fid.write("".join(lines))
 
 
 @section_writer("VALVES", 2)
@@ -200,33 +187,32 @@ def write_valves(network: Network, fid: TextIOWrapper):
 
     """
     logger.debug("Writing Valves section")
-    print("[VALVES]", file=fid)
-    print(";id startnode endnode diameter valvetype setting minorloss", file=fid)
+    lines = ["[VALVES]\n;id startnode endnode diameter valvetype setting minorloss\n"]
     for v in get_valves(network):
-        print(v.id, end=" ", file=fid)
+        line = f"{v.id} "
         if v.startnode is not None:
-            print(v.startnode.id, end=" ", file=fid)
+            line += f"{v.startnode.id} "
         if v.endnode is not None:
-            print(v.endnode.id, end=" ", file=fid)
-        print(v.diameter, end=" ", file=fid)
-        print(v.__class__.__name__, end=" ", file=fid)
+            line += f"{v.endnode.id} "
+        line += f"{v.diameter} {v.__class__.__name__} "
         if isinstance(v, PRV):
-            print(v.maximum_pressure, end=" ", file=fid)
+            line += f"{v.maximum_pressure} "
         elif isinstance(v, TCV):
-            print(v.headloss_coefficient, end=" ", file=fid)
+            line += f"{v.headloss_coefficient} "
         elif isinstance(v, PSV):
-            print(v.pressure_limit, end=" ", file=fid)
+            line += f"{v.pressure_limit} "
         elif isinstance(v, GPV):
-            print(v.headloss_curve.id, end=" ", file=fid)
+            line += f"{v.headloss_curve.id} "
         elif isinstance(v, PBV):
-            print(v.pressure_drop, end=" ", file=fid)
+            line += f"{v.pressure_drop} "
         elif isinstance(v, FCV):
-            print(v.maximum_flow, end=" ", file=fid)
-        print(v.minorloss, end=" ", file=fid)
+            line += f"{v.maximum_flow} "
+        line += f"{v.minorloss} "
         if v.comment is not None:
-            print(";", v.comment, end=" ", file=fid)
-        print("\n", end=" ", file=fid)
-    print("\n", end=" ", file=fid)
+            line += f"; {v.comment} "
+        lines.append(line + "\n ")
+    lines.append("\n ")
+    fid.write("".join(lines))
 
 
 @section_writer("EMITTERS", 3)
@@ -239,9 +225,9 @@ def write_emitter(network: Network, fid: TextIOWrapper):
 
     """
     logger.debug("Writing Emitter section")
-    print("[EMITTERS]", file=fid)
-    print(";id emittercoefficient", file=fid)
+    lines = ["[EMITTERS]\n;id emittercoefficient\n"]
     for j in get_junctions(network):
         if j.emittercoefficient > 0.0:
-            print(j.id, j.emittercoefficient, file=fid)
-    print("\n", file=fid)
+            lines.append(f"{j.id} {j.emittercoefficient}\n")
+    lines.append("\n\n")
+    fid.write("".join(lines))
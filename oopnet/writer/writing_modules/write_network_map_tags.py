@@ -22,11 +22,10 @@ def write_coordinates(network: Network, fid: TextIOWrapper):
 
     """
     logger.debug("Writing Coordinates section")
-    print("[COORDINATES]", file=fid)
-    print(";nodeid xcoordinate ycoordinate", file=fid)
-    for n in get_nodes(network):
-        print(n.id, n.xcoordinate, n.ycoordinate, file=fid)
-    print("\n", end=" ", file=fid)
+    lines = ["[COORDINATES]\n;nodeid xcoordinate ycoordinate\n"]
+    lines.extend(f"{n.id} {n.xcoordinate} {n.ycoordinate}\n" for n in get_nodes(network))
+    lines.append("\n ")
+    fid.write("".join(lines))
 
 
 @section_writer("VERTICES", 4)
@@ -39,12 +38,12 @@ def write_vertices(network: Network, fid: TextIOWrapper):
 
     """
     logger.debug("Writing Vertices section")
-    print("[VERTICES]", file=fid)
-    print(";linkkid xcoordinate ycoordinate", file=fid)
+    lines = ["[VERTICES]\n;linkkid xcoordinate ycoordinate\n"]
     for l in get_links(network):
         for v in l.vertices:
-            print(l.id, v.xcoordinate, v.ycoordinate, file=fid)
-    print("\n", end=" ", file=fid)
+            lines.append(f"{l.id} {v.xcoordinate} {v.ycoordinate}\n")
+    lines.append("\n ")
+    fid.write("".join(lines))
 
 
 @section_writer("LABELS", 4)
@@ -58,9 +57,7 @@ def write_labels(network: Network, fid: TextIOWrapper):
     """
     # ToDo: Implement Printer for Labels
     # logger.debug('Writing Labels section')
-    print("[LABELS]", file=fid)
-    print(";xcoordinate ycoordinate label anchornode", file=fid)
-    print("\n", end=" ", file=fid)
+    fid.write("[LABELS]\n;xcoordinate ycoordinate label anchornode\n\n ")
 
 
 @section_writer("BACKDROP", 4)
@@ -74,8 +71,7 @@ def write_backdrop(network: Network, fid: TextIOWrapper):
     """
     # ToDo: Implement Printer for Backdrop
     # logger.debug('Writing Backdrop section')
-    print("[BACKDROP]", file=fid)
-    print("\n", end=" ", file=fid)
+    fid.write("[BACKDROP]\n\n ")
 
 
 @section_writer("TAGS", 4)
@@ -89,5 +85,4 @@ def write_tags(network: Network, fid: TextIOWrapper):
     """
     # ToDo: Implement Printer for Tags
     # logger.debug('Writing Tags section')
-    print("[TAGS]", file=fid)
-    print("\n", end=" ", file=fid)
+    fid.write("[TAGS]\n\n ")
@@ -84,47 +84,45 @@ def write_options(network: Network, fid: TextIOWrapper):
 
     """
     logger.debug("Writing Options section")
-    print("[OPTIONS]", file=fid)
     o = network.options
-    print("UNITS", o.units, file=fid)
-    print("HEADLOSS", o.headloss, file=fid)
+    lines = ["[OPTIONS]\n", f"UNITS {o.units}\n", f"HEADLOSS {o.headloss}\n"]
     if o.hydraulics:
-        print("HYDRAULICS", o.hydraulics[0], o.hydraulics[1], file=fid)
+        lines.append(f"HYDRAULICS {o.hydraulics[0]} {o.hydraulics[1]}\n")
     if not isinstance(o.quality, list):
-        print("QUALITY", o.quality, file=fid)
+        lines.append(f"QUALITY {o.quality}\n")
     elif o.quality[0] == "AGE":
-        print("QUALITY", o.quality[0], file=fid)
+        lines.append(f"QUALITY {o.quality[0]}\n")
     elif o.quality[0] == "CHEMICAL":
-        print("QUALITY", o.quality[0], o.quality[1], o.quality[2], file=fid)
+        lines.append(f"QUALITY {o.quality[0]} {o.quality[1]} {o.quality[2]}\n")
     elif o.quality[0] == "TRACE":
-        print("QUALITY", o.quality[0], o.quality[1].id, file=fid)
+        lines.append(f"QUALITY {o.quality[0]} {o.quality[1].id}\n")
     else:
-        print("QUALTIY", "NONE", file=fid)
-    print("VISCOSITY", o.viscosity, file=fid)
-    print("DIFFUSIVITY", o.diffusivity, file=fid)
-    print("SPECIFIC GRAVITY", o.specificgravity, file=fid)
-    print("TRIALS", o.trials, file=fid)
-    print("ACCURACY", str(o.accuracy).replace("e", "E"), file=fid)
+        lines.append("QUALTIY NONE\n")
+    lines.append(f"VISCOSITY {o.viscosity}\n")
+    lines.append(f"DIFFUSIVITY {o.diffusivity}\n")
+    lines.append(f"SPECIFIC GRAVITY {o.specificgravity}\n")
+    lines.append(f"TRIALS {o.trials}\n")
+    lines.append(f"ACCURACY {str(o.accuracy).replace('e', 'E')}\n")
     if not isinstance(o.unbalanced, tuple):
-        print("UNBALANCED", o.unbalanced, file=fid)
+        lines.append(f"UNBALANCED {o.unbalanced}\n")
     else:
-        print("UNBALANCED", o.unbalanced[0], o.unbalanced[1], file=fid)
-    print("PATTERN", end=" ", file=fid)
+        lines.append(f"UNBALANCED {o.unbalanced[0]} {o.unbalanced[1]}\n")
     try:
-        print(o.pattern.id, file=fid)
-    except:
-        print(o.pattern, file=fid)
-    print("DEMAND MULTIPLIER", o.demandmultiplier, file=fid)
-    print("EMITTER EXPONENT", o.emitterexponent, file=fid)
-    print("TOLERANCE", str(o.tolerance).replace("e", "E"), file=fid)
+        lines.append(f"PATTERN {o.pattern.id}\n")
+    except AttributeError:
+        lines.append(f"PATTERN {o.pattern}\n")
+    lines.append(f"DEMAND MULTIPLIER {o.demandmultiplier}\n")
+    lines.append(f"EMITTER EXPONENT {o.emitterexponent}\n")
+    lines.append(f"TOLERANCE {str(o.tolerance).replace('e', 'E')}\n")
     if o.map:
-        print("MAP", o.map, file=fid)
+        lines.append(f"MAP {o.map}\n")
     if o.demandmodel == "PDA":
-        print("DEMAND MODEL", o.demandmodel, file=fid)
-        print("MINIMUM PRESSURE", o.minimumpressure, file=fid)
-        print("REQUIRED PRESSURE", o.requiredpressure, file=fid)
-        print("PRESSURE EXPONENT", o.pressureexponent, file=fid)
-    print("\n", end=" ", file=fid)
+        lines.append(f"DEMAND MODEL {o.demandmodel}\n")
+        lines.append(f"MINIMUM PRESSURE {o.minimumpressure}\n")
+        lines.append(f"REQUIRED PRESSURE {o.requiredpressure}\n")
+        lines.append(f"PRESSURE EXPONENT {o.pressureexponent}\n")
+    lines.append("\n ")
+    fid.write("".join(lines))
 
 
 @section_writer("TIMES", 3)
@@ -137,22 +135,28 @@ def write_times(network: Network, fid: TextIOWrapper):
 
     """
     logger.debug("Writing Times section")
-    print("[TIMES]", file=fid)
     t = network.times
-    print("DURATION", timedelta2hours(t.duration), file=fid)
-    print("HYDRAULIC TIMESTEP", timedelta2hours(t.hydraulictimestep), file=fid)
+    lines = [
+        "[TIMES]\n",
+        f"DURATION {timedelta2hours(t.duration)}\n",
+        f"HYDRAULIC TIMESTEP {timedelta2hours(t.hydraulictimestep)}\n",
+    ]
     if t.qualitytimestep:
-        print("QUALITY TIMESTEP", timedelta2hours(t.qualitytimestep), file=fid)
+        lines.append(f"QUALITY TIMESTEP {timedelta2hours(t.qualitytimestep)}\n")
     if t.ruletimestep:
-        print("RULE TIMESTEP", timedelta2hours(t.ruletimestep), file=fid)
+        lines.append(f"RULE TIMESTEP {timedelta2hours(t.ruletimestep)}\n")
     if t.patterntimestep:
-        print("PATTERN TIMESTEP", timedelta2hours(t.patterntimestep), file=fid)
-    print("PATTERN START", timedelta2hours(t.patternstart), file=fid)
-    print("REPORT TIMESTEP", timedelta2hours(t.reporttimestep), file=fid)
-    print("REPORT START", timedelta2hours(t.reportstart), file=fid)
-    print("START CLOCKTIME", timedelta2startclocktime(t.startclocktime), file=fid)
-    print("STATISTIC", t.statistic, file=fid)
-    print("\n", end=" ", file=fid)
+        lines.append(f"PATTERN TIMESTEP {timedelta2hours(t.patterntimestep)}\n")
+    lines.append(f"PATTERN START {timedelta2hours(t.patternstart)}\n")
+    lines.append(f"REPORT TIMESTEP {timedelta2hours(t.reporttimestep)}\n")
+    lines.append(f"REPORT START {timedelta2hours(t.reportstart)}\n")
+    lines.append(f"START CLOCKTIME {timedelta2startclocktime(t.startclocktime)}\n")
+    lines.append(f"STATISTIC {t.statistic}\n")
+    lines.append("\n ")
+    fid.write("".join(lines))
+
+
+REPORT_IDS_PER_LINE = 30
 
 
 @section_writer("REPORT", 3)
@@ -165,54 +169,41 @@ def write_report(network: Network, fid: TextIOWrapper):
 
     """
     logger.debug("Writing Report section")
-    print("[REPORT]", file=fid)
     r = network.report
-    print("PAGESIZE", r.pagesize, file=fid)
+    lines = ["[REPORT]\n", f"PAGESIZE {r.pagesize}\n"]
     if r.file:
-        print("FILE", r.file, file=fid)
-    print("STATUS", r.status, file=fid)
-    print("SUMMARY", r.summary, file=fid)
-    print("ENERGY", r.energy, file=fid)
-    if isinstance(r.nodes, str):
-        print("NODES", r.nodes, file=fid)
-    else:
-        print("NODES", end=" ", file=fid)
-        for n in r.nodes:
-            print(n.id, end=" ", file=fid)
-        print("\n", end=" ", file=fid)
-    if isinstance(r.links, str):
-        print("LINKS", r.links, file=fid)
-    else:
-        print("LINKS", end=" ", file=fid)
-        for l in r.links:
-            print(l.id, end=" ", file=fid)
-        print("\n", end=" ", file=fid)
+        lines.append(f"FILE {r.file}\n")
+    lines.append(f"STATUS {r.status}\n")
+    lines.append(f"SUMMARY {r.summary}\n")
+    lines.append(f"ENERGY {r.energy}\n")
+    for keyword, components in (("NODES", r.nodes), ("LINKS", r.links)):
+        if isinstance(components, str):
+            lines.append(f"{keyword} {components}\n")
+            continue
+        # EPANET ignores all but the first 40 tokens of a line, so long lists are split across several lines
+        for start in range(0, len(components), REPORT_IDS_PER_LINE):
+            chunk = components[start : start + REPORT_IDS_PER_LINE]
+            lines.append(f"{keyword} " + "".join(f"{c.id} " for c in chunk) + "\n")
+    parameters = [
+        ("ELEVATION", "elevation"),
+        ("DEMAND", "demand"),
+        ("HEAD", "head"),
+        ("PRESSURE", "pressure"),
+        ("QUALITY", "quality"),
+        ("LENGTH", "length"),
+        ("DIAMETER", "diameter"),
+        ("FLOW", "flow"),
+        ("VELOCITY", "velocity"),
+        ("HEADLOSS", "headloss"),
+        ("SETTING", "setting"),
+        ("REACTION", "reaction"),
+        ("F-FACTOR", "ffactor"),
+    ]
     r = network.reportparameter
-    print("ELEVATION", reportparameter2str(r.elevation), file=fid)
-    print("DEMAND", reportparameter2str(r.demand), file=fid)
-    print("HEAD", reportparameter2str(r.head), file=fid)
-    print("PRESSURE", reportparameter2str(r.pressure), file=fid)
-    print("QUALITY", reportparameter2str(r.quality), file=fid)
-    print("LENGTH", reportparameter2str(r.length), file=fid)
-    print("DIAMETER", reportparameter2str(r.diameter), file=fid)
-    print("FLOW", reportparameter2str(r.flow), file=fid)
-    print("VELOCITY", reportparameter2str(r.velocity), file=fid)
-    print("HEADLOSS", reportparameter2str(r.headloss), file=fid)
-    print("SETTING", reportparameter2str(r.setting), file=fid)
-    print("REACTION", reportparameter2str(r.reaction), file=fid)
-    print("F-FACTOR", reportparameter2str(r.ffactor), file=fid)
+    for keyword, attribute in parameters:
+        lines.append(f"{keyword} {reportparameter2str(getattr(r, attribute))}\n")
     r = network.reportprecision
-    print("ELEVATION", reportprecision2str(r.elevation), file=fid)
-    print("DEMAND", reportprecision2str(r.demand), file=fid)
-    print("HEAD", reportprecision2str(r.head), file=fid)
-    print("PRESSURE", reportprecision2str(r.pressure), file=fid)
-    print("QUALITY", reportprecision2str(r.quality), file=fid)
-    print("LENGTH", reportprecision2str(r.length), file=fid)
-    print("DIAMETER", reportprecision2str(r.diameter), file=fid)
-    print("FLOW", reportprecision2str(r.flow), file=fid)
-    print("VELOCITY", reportprecision2str(r.velocity), file=fid)
-    print("HEADLOSS", reportprecision2str(r.headloss), file=fid)
-    print("SETTING", reportprecision2str(r.setting), file=fid)
-    print("REACTION", reportprecision2str(r.reaction), file=fid)
-    print("F-FACTOR", reportprecision2str(r.ffactor), file=fid)
-    print("\n", end=" ", file=fid)
+    for keyword, attribute in parameters:
+        lines.append(f"{keyword} {reportprecision2str(getattr(r, attribute))}\n")
+    lines.append("\n ")
+    fid.write("".join(lines))
@@ -36,12 +36,12 @@ def write_curves(network: Network, fid: TextIOWrapper):
 
     """
     logger.debug("Writing Curves section")
-    print("[CURVES]", file=fid)
-    print(";id xvalue yvalue", file=fid)
+    lines = ["[CURVES]\n;id xvalue yvalue\n"]
     for c in get_curves(network):
         for x, y in zip(c.xvalues, c.yvalues):
-            print(c.id, x, y, file=fid)
-    print("\n", end=" ", file=fid)
+            lines.append(f"{c.id} {x} {y}\n")
+    lines.append("\n ")
+    fid.write("".join(lines))
 
 
 @section_writer("PATTERNS", 3)
@@ -54,14 +54,13 @@ def write_patterns(network: Network, fid: TextIOWrapper):
 
     """
     logger.debug("Writing Patterns section")
-    print("[PATTERNS]", file=fid)
-    print(";id multipliers", file=fid)
+    lines = ["[PATTERNS]\n;id multipliers\n"]
     for p in get_patterns(network):
         for m in p.multipliers:
-            print(p.id, end=" ", file=fid)
-            print(m, file=fid)
-        print("\n", end=" ", file=fid)
-    print("\n", end=" ", file=fid)
+            lines.append(f"{p.id} {m}\n")
+        lines.append("\n ")
+    lines.append("\n ")
+    fid.write("".join(lines))
 
 
 @section_writer("ENERGY", 3)
@@ -74,21 +73,23 @@ def write_energy(network: Network, fid: TextIOWrapper):
 
     """
     logger.debug("Writing Energy section")
-    print("[ENERGY]", file=fid)
+    lines = ["[ENERGY]\n"]
     for e in get_energy_entries(network):
         keyword = e.keyword if e.keyword != "DEMAND_CHARGE" else "DEMAND CHARGE"
-        print(keyword, end=" ", file=fid)
+        line = f"{keyword} "
         if keyword == "PUMP":
-            print(e.pumpid.id, end=" ", file=fid)
+            line += f"{e.pumpid.id} "
         if e.parameter is not None:
-            print(e.parameter, end=" ", file=fid)
+            line += f"{e.parameter} "
         if e.value is not None:
             if isinstance(e.value, (Curve, Pattern)):
-                print(e.value.id, end=" ", file=fid)
+                line += f"{e.value.id} "
             else:
-                print(e.value, end=" ", file=fid)
-            print("\n", end=" ", file=fid)
-    print("\n", end=" ", file=fid)
+                line += f"{e.value} "
+            line += "\n "
+        lines.append(line)
+    lines.append("\n ")
+    fid.write("".join(lines))
 
 
 @section_writer("STATUS", 3)
@@ -101,20 +102,20 @@ def write_status(network: Network, fid: TextIOWrapper):
 
     """
     logger.debug("Writing Status section")
-    print("[STATUS]", file=fid)
-    print(";id status/setting", file=fid)
+    lines = ["[STATUS]\n;id status/setting\n"]
     for l in get_pipes(network):
         if l.status == "CLOSED":
-            print(l.id, l.status, file=fid)
+            lines.append(f"{l.id} {l.status}\n")
     for v in get_valves(network):
         if v.status == "CLOSED":
-            print(v.id, v.status, file=fid)
+            lines.append(f"{v.id} {v.status}\n")
     for pu in get_pumps(network):
         if pu.status == "CLOSED":
-            print(pu.id, pu.status, file=fid)
+            lines.append(f"{pu.id} {pu.status}\n")
         # elif pu.keyword == 'SPEED':
-        #     print(pu.id, pu, file=fid)
-    print("\n", end=" ", file=fid)
+        #     lines.append(f"{pu.id} {pu}\n")
+    lines.append("\n ")
+    fid.write("".join(lines))
 
 
 @section_writer("CONTROLS", 3)
@@ -127,26 +128,19 @@ def write_controls(network: Network, fid: TextIOWrapper):
 
     """
     logger.debug("Writing Controls section")
-    print("[CONTROLS]", file=fid)
+    lines = ["[CONTROLS]\n"]
     for c in get_controls(network):
-        print("LINK", c.action.object.id, c.action.value, end=" ", file=fid)
+        line = f"LINK {c.action.object.id} {c.action.value} "
         if c.condition.object is not None:
-            print(
-                "IF NODE",
-                c.condition.object.id,
-                c.condition.relation,
-                c.condition.value,
-                file=fid,
-            )
+            line += f"IF NODE {c.condition.object.id} {c.condition.relation} {c.condition.value}\n"
         elif c.condition.time is not None:
-            print("AT TIME", str(c.condition.time)[:-3], file=fid)
+            line += f"AT TIME {str(c.condition.time)[:-3]}\n"
         elif c.condition.clocktime is not None:
-            print(
-                "AT CLOCKTIME",
-                datetime.datetime.strftime(c.condition.clocktime, "%I:%M %p"),
-                file=fid,
-            )
-    print("\n", end=" ", file=fid)
+            clocktime = datetime.datetime.strftime(c.condition.clocktime, "%I:%M %p")
+            line += f"AT CLOCKTIME {clocktime}\n"
+        lines.append(line)
+    lines.append("\n ")
+    fid.write("".join(lines))
 
 
 @section_writer("RULES", 3)
@@ -159,44 +153,29 @@ def write_rules(network: Network, fid: TextIOWrapper):
 
     """
     logger.debug("Writing Rules section")
-    print("[RULES]", file=fid)
+    lines = ["[RULES]\n"]
     for r in get_rules(network):
-        print("RULE", r.id, file=fid)
+        lines.append(f"RULE {r.id}\n")
         for c in r.condition:
             if isinstance(c.object, NetworkComponent):
                 object_type = "Valve" if isinstance(c.object, Valve) else c.object.__class__.__name__
-
-                print(
-                    c.logical,
-                    object_type,
-                    c.object.id,
-                    c.attribute,
-                    c.relation,
-                    c.value,
-                    file=fid,
+                lines.append(
+                    f"{c.logical} {object_type} {c.object.id} {c.attribute} {c.relation} {c.value}\n"
                 )
             elif c.attribute is not None:
                 object_type = "SYSTEM"
                 if c.attribute == "TIME":
-                    print(
-                        c.logical,
-                        object_type,
-                        c.attribute,
-                        c.relation,
-                        str(c.value)[:-3],
-                        file=fid,
+                    lines.append(
+                        f"{c.logical} {object_type} {c.attribute} {c.relation} {str(c.value)[:-3]}\n"
                     )
                 elif c.attribute == "CLOCKTIME":
                     timeformat = "%I:%M %p"
-                    print(
-                        c.logical,
-                        object_type,
-                        c.attribute,
-                        c.relation,
-                        datetime.datetime.strftime(c.value, timeformat),
-                        file=fid,
+                    clocktime = datetime.datetime.strftime(c.value, timeformat)
+                    lines.append(
+                        f"{c.logical} {object_type} {c.attribute} {c.relation} {clocktime}\n"
                     )
-    print("\n", end=" ", file=fid)
+    lines.append("\n ")
+    fid.write("".join(lines))
 
 
 @section_writer("DEMANDS", 3)
@@ -209,21 +188,20 @@ def write_demands(network: Network, fid: TextIOWrapper):
 
     """
     logger.debug("Writing Demands section")
-    print("[DEMANDS]", file=fid)
-    print(";id demand pattern category", file=fid)
+    lines = ["[DEMANDS]\n;id demand pattern category\n"]
     for j in get_junctions(network):
         if j.demand is None or isinstance(j.demand, (float, int)):
             pass
         elif isinstance(j.demand, list):
             for i, d in enumerate(j.demand):
-                print(j.id, end=" ", file=fid)
-                print(d, end=" ", file=fid)
+                line = f"{j.id} {d} "
                 # todo: replace try except
                 try:
-                    print(j.demandpattern[i].id, end=" ", file=fid)
+                    line += f"{j.demandpattern[i].id} "
                 except:
                     pass
-                print("\n", end=" ", file=fid)
+                lines.append(line + "\n ")
         else:
             raise TypeError(f"Unknown demand dtype {type(j.demand)}")
-    print("\n", end=" ", file=fid)
+    lines.append("\n ")
+    fid.write("".join(lines))
@@ -22,12 +22,12 @@ def write_quality(network: Network, fid: TextIOWrapper):
 
     """
     logger.debug("Writing Quality section")
-    print("[QUALITY]", file=fid)
-    print(";id initialquality", file=fid)
+    lines = ["[QUALITY]\n;id initialquality\n"]
     for n in get_nodes(network):
         if n.initialquality > 0.0:
-            print(n.id, n.initialquality, file=fid)
-    print("\n", end=" ", file=fid)
+            lines.append(f"{n.id} {n.initialquality}\n")
+    lines.append("\n ")
+    fid.write("".join(lines))
 
 
 @section_writer("REACTIONS", 3)
@@ -40,27 +40,30 @@ def write_reactions(network: Network, fid: TextIOWrapper):
 
     """
     logger.debug("Writing Reactions section")
-    print("[REACTIONS]", file=fid)
     r = network.reactions
-    print("ORDER BULK", r.orderbulk, file=fid)
-    print("ORDER WALL", r.orderwall, file=fid)
-    print("ORDER TANK", r.ordertank, file=fid)
-    print("GLOBAL BULK", r.globalbulk, file=fid)
-    print("GLOBAL WALL", r.globalwall, file=fid)
+    lines = [
+        "[REACTIONS]\n",
+        f"ORDER BULK {r.orderbulk}\n",
+        f"ORDER WALL {r.orderwall}\n",
+        f"ORDER TANK {r.ordertank}\n",
+        f"GLOBAL BULK {r.globalbulk}\n",
+        f"GLOBAL WALL {r.globalwall}\n",
+    ]
     if r.limitingpotential is not None:
-        print("LIMITING POTENTIAL", r.limitingpotential, file=fid)
+        lines.append(f"LIMITING POTENTIAL {r.limitingpotential}\n")
     if r.roughnesscorrelation is not None:
-        print("ROUGHNESS CORRELATION", r.roughnesscorrelation, file=fid)
+        lines.append(f"ROUGHNESS CORRELATION {r.roughnesscorrelation}\n")
     if r.bulk:
         for p in r.bulk:
-            print("BULK", p.id, p.reactionbulk, file=fid)
+            lines.append(f"BULK {p.id} {p.reactionbulk}\n")
     if r.wall:
         for p in r.wall:
-            print("WALL", p.id, p.reactionwall, file=fid)
+            lines.append(f"WALL {p.id} {p.reactionwall}\n")
     if r.tank:
         for p in r.tank:
-            print("TANK", p.id, p.tank, file=fid)
-    print("\n", end=" ", file=fid)
+            lines.append(f"TANK {p.id} {p.tank}\n")
+    lines.append("\n ")
+    fid.write("".join(lines))
 
 
 @section_writer("SOURCES", 3)
@@ -73,17 +76,17 @@ def write_sources(network: Network, fid: TextIOWrapper):
 
     """
     logger.debug("Writing Sources section")
-    print("[SOURCES]", file=fid)
-    print(";id sourcetype strength sourcepattern", file=fid)
+    lines = ["[SOURCES]\n;id sourcetype strength sourcepattern\n"]
     for n in get_nodes(network):
         if n.sourcetype:
-            print(n.id, n.sourcetype, end=" ", file=fid)
+            line = f"{n.id} {n.sourcetype} "
             if n.strength > 0.0:
-                print(n.strength, end=" ", file=fid)
+                line += f"{n.strength} "
             if n.sourcepattern:
-                print(n.sourcepattern.id, end=" ", file=fid)
-            print("\n", end=" ", file=fid)
-    print("\n", end=" ", file=fid)
+                line += f"{n.sourcepattern.id} "
+            lines.append(line + "\n ")
+    lines.append("\n ")
+    fid.write("".join(lines))
 
 
 @section_writer("MIXING", 3)
@@ -96,12 +99,12 @@ def write_mixing(network: Network, fid: TextIOWrapper):
 
     """
     logger.debug("Writing Mixing section")
-    print("[MIXING]", file=fid)
-    print(";tankid mixingmodel compartmentvolume", file=fid)
+    lines = ["[MIXING]\n;tankid mixingmodel compartmentvolume\n"]
     for t in get_tanks(network):
         if t.mixingmodel:
-            print(t.id, t.mixingmodel, end=" ", file=fid)
+            line = f"{t.id} {t.mixingmodel} "
             if t.compartmentvolume and t.compartmentvolume != 0.0:
-                print(t.compartmentvolume, end=" ", file=fid)
-            print("\n", end=" ", file=fid)
-    print("\n", end=" ", file=fid)
+                line += f"{t.compartmentvolume} "
+            lines.append(line + "\n ")
+    lines.append("\n ")
+    fid.write("".join(lines))
@@ -137,5 +137,40 @@ class ExistingModelTest(unittest.TestCase):
             add_pump(self.network, Pump(id='P-1'))
 
 
+class BulkAddTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.network = create_dummy_spa_network()
+
+    def test_add_nodes(self):
+        n_nodes = len(get_nodes(self.network))
+        add_nodes(self.network, [Junction(id='J-10'), Tank(id='T-10'), Reservoir(id='R-10')])
+        self.assertEqual(n_nodes + 3, len(get_nodes(self.network)))
+        self.assertIsInstance(get_tank(self.network, 'T-10'), Tank)
+        self.assertIs(self.network, get_junction(self.network, 'J-10')._network)
+
+    def test_add_links(self):
+        n_links = len(get_links(self.network))
+        add_links(self.network, [Pipe(id='P-10'), Pump(id='PU-10'), PRV(id='V-10')])
+        self.assertEqual(n_links + 3, len(get_links(self.network)))
+        self.assertIsInstance(get_valve(self.network, 'V-10'), PRV)
+
+    def test_add_existing_id(self):
+        with self.assertRaises(IdenticalIDError):
+            add_nodes(self.network, [Junction(id='J-10'), Tank(id='J-1')])
+        self.assertNotIn('J-1', self.network._nodes['tanks'])
+        self.assertNotIn('J-10', self.network._nodes['junctions'])
+
+    def test_add_duplicate_ids(self):
+        with self.assertRaises(IdenticalIDError):
+            add_links(self.network, [Pipe(id='P-10'), Pipe(id='P-10')])
+        with self.assertRaises(IdenticalIDError):
+            add_nodes(self.network, [Junction(id='X'), Tank(id='X')])
+
+    def test_invalid_node(self):
+        with self.assertRaises(TypeError):
+            add_nodes(self.network, [Junction(id='J-10'), Pipe(id='P-10')])
+        self.assertNotIn('J-10', self.network._nodes['junctions'])
+
+
 if __name__ == '__main__':
     unittest.main()
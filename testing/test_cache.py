@@ -0,0 +1,124 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+
+import xarray as xr
+
+from oopnet.simulator import BinaryFileReader, LazyBinaryFileReader
+from oopnet.simulator.cache import ResultCache
+from oopnet.simulator.simulation_errors import EPANETSimulationError
+from oopnet.elements.network_components import Junction
+from oopnet.utils.adders import add_junction
+from oopnet.utils.getters import get_pipe
+
+from testing.base import PoulakisEnhancedPDAModel, RulesModel, set_dir_testing
+
+
+class ResultCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        set_dir_testing()
+        self.network = PoulakisEnhancedPDAModel().network
+        self.directory = tempfile.mkdtemp()
+        self.cache = ResultCache(maxsize=2, directory=self.directory)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def assertReportsIdentical(self, expected, actual):
+        xr.testing.assert_identical(expected.nodes, actual.nodes)
+        xr.testing.assert_identical(expected.links, actual.links)
+
+    def test_memory_hit(self):
+        expected = self.network.run(cache=self.cache)
+        self.assertEqual(1, self.cache.statistics.misses)
+        self.assertReportsIdentical(expected, self.network.run(cache=self.cache))
+        self.assertEqual(1, self.cache.statistics.memory_hits)
+        self.assertEqual(0.5, self.cache.statistics.hit_rate)
+
+    def test_copy_hit(self):
+        self.network.run(cache=self.cache)
+        PoulakisEnhancedPDAModel().network.run(cache=self.cache)
+        self.assertEqual(1, self.cache.statistics.hits)
+
+    def test_modified_network(self):
+        rpt = self.network.run(cache=self.cache)
+        get_pipe(self.network, 'P-01').diameter = 300.0
+        modified = self.network.run(cache=self.cache)
+        self.assertEqual(2, self.cache.statistics.misses)
+        self.assertFalse(rpt.pressure.equals(modified.pressure))
+
+    def test_readers(self):
+        self.network.run(cache=self.cache)
+        self.network.run(cache=self.cache, reader=BinaryFileReader)
+        self.assertEqual(2, self.cache.statistics.misses)
+        self.network.run(cache=self.cache, reader=LazyBinaryFileReader)
+        self.assertEqual(2, self.cache.statistics.misses)
+        self.assertEqual(2, len(self.cache))
+
+    def test_disk_hit(self):
+        for model in (PoulakisEnhancedPDAModel, RulesModel):
+            for reader in (BinaryFileReader, None):
+                network = model().network
+                kwargs = {'reader': reader} if reader else {}
+                expected = network.run(cache=self.cache, **kwargs)
+                cache = ResultCache(directory=self.directory)
+                self.assertReportsIdentical(expected, network.run(cache=cache, **kwargs))
+                self.assertEqual(1, cache.statistics.disk_hits)
+
+    def test_copies(self):
+        rpt = self.network.run(cache=self.cache)
+        rpt.nodes[:] = 0.0
+        self.assertNotEqual(0.0, self.network.run(cache=self.cache).pressure.max())
+
+    def test_memory_eviction(self):
+        cache = ResultCache(maxsize=1)
+        self.network.run(cache=cache)
+        RulesModel().network.run(cache=cache)
+        self.assertEqual(1, len(cache))
+        self.assertEqual(1, cache.statistics.evictions)
+        self.network.run(cache=cache)
+        self.assertEqual(3, cache.statistics.misses)
+
+    def test_disk_eviction(self):
+        self.network.run(cache=self.cache)
+        size = sum(entry.stat().st_size for entry in os.scandir(self.directory))
+        cache = ResultCache(maxsize=0, directory=self.directory, max_disk_bytes=int(1.5 * size))
+        get_pipe(self.network, 'P-01').diameter = 300.0
+        self.network.run(cache=cache)
+        self.assertEqual(1, len(os.listdir(self.directory)))
+        self.assertEqual(1, cache.statistics.evictions)
+
+    def test_projection(self):
+        self.network.run(cache=self.cache, reader=BinaryFileReader)
+        rpt = self.network.run(cache=self.cache, reader=BinaryFileReader, nodes=['J-03'], variables=['pressure'])
+        self.assertEqual(1, self.cache.statistics.hits)
+        self.assertEqual((1, 1), rpt.nodes.shape)
+        rpt = self.network.run(cache=self.cache, nodes=['J-03'], variables=['pressure'])
+        self.assertEqual(2, self.cache.statistics.misses)
+        self.assertEqual((1, 1), rpt.nodes.shape)
+
+    def test_async(self):
+        expected = self.network.run(cache=self.cache)
+        self.assertReportsIdentical(expected, asyncio.run(self.network.run_async(cache=self.cache)))
+        self.assertEqual(1, self.cache.statistics.hits)
+
+    def test_error(self):
+        add_junction(self.network, Junction(id='unconnected'))
+        for _ in range(2):
+            with self.assertRaises(EPANETSimulationError):
+                self.network.run(cache=self.cache)
+        self.assertEqual(2, self.cache.statistics.misses)
+
+    def test_clear(self):
+        self.network.run(cache=self.cache)
+        self.cache.clear()
+        self.assertEqual(0, len(self.cache))
+        self.assertEqual([], os.listdir(self.directory))
+        self.network.run(cache=self.cache)
+        self.assertEqual(1, self.cache.statistics.misses)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,192 @@
+import pickle
+import unittest
+from copy import deepcopy
+
+import numpy as np
+import pandas as pd
+
+import oopnet as on
+from oopnet.elements.column_store import enable_column_store, disable_column_store
+from oopnet.utils.getters.vectors import v_length, v_diameter, v_roughness, v_minorloss, v_elevation, \
+    v_emittercoefficient, v_demand, v_head, v_initlevel, v_minlevel, v_maxlevel, v_tankdiameter, v_minvolume
+from oopnet.writer.write import write_string
+
+from testing.base import SimpleModel, CTownModel
+
+
+class ColumnStoreTest(unittest.TestCase):
+    getters = (
+        on.get_length,
+        on.get_diameter,
+        on.get_roughness,
+        on.get_minorloss,
+        on.get_xcoordinate,
+        on.get_ycoordinate,
+        on.get_elevation,
+        on.get_basedemand,
+    )
+    vectors = (
+        v_length,
+        v_diameter,
+        v_roughness,
+        v_minorloss,
+        v_elevation,
+        v_emittercoefficient,
+        v_demand,
+        v_head,
+        v_initlevel,
+        v_minlevel,
+        v_maxlevel,
+        v_tankdiameter,
+        v_minvolume,
+    )
+
+    def setUp(self) -> None:
+        self.model = CTownModel()
+        self.network = self.model.network
+        self.expected_series = [getter(self.network) for getter in self.getters]
+        self.expected_vectors = [vector(self.network) for vector in self.vectors]
+        self.expected_inp = write_string(self.network)
+        enable_column_store(self.network)
+
+    def assert_unchanged(self, network: on.Network):
+        for getter, expected in zip(self.getters, self.expected_series):
+            pd.testing.assert_series_equal(expected, getter(network))
+        for vector, expected in zip(self.vectors, self.expected_vectors):
+            np.testing.assert_array_equal(expected, vector(network))
+
+    def test_getters(self):
+        self.assert_unchanged(self.network)
+
+    def test_views(self):
+        lengths = v_length(self.network)
+        self.assertFalse(lengths.flags.writeable)
+        self.assertIs(lengths.base, self.network._links['pipes'].columns.arrays['length'])
+        pipe = on.get_pipes(self.network)[3]
+        pipe.length = 1234.5
+        self.assertEqual(1234.5, lengths[3])
+        self.assertEqual(1234.5, pipe.length)
+        self.assertNotIn('length', pipe.__dict__)
+        self.assertIsInstance(pipe, on.Pipe)
+        self.assertEqual('Pipe', type(pipe).__name__)
+
+    def test_series_are_views(self):
+        columns = self.network._links['pipes'].columns
+        self.assertTrue(np.shares_memory(columns.arrays['length'], on.get_length(self.network).to_numpy()))
+        self.assertTrue(np.shares_memory(columns.arrays['roughness'], on.get_roughness(self.network).to_numpy()))
+
+    def test_numbers(self):
+        columns = self.network._links['pipes'].columns
+        pipe = on.get_pipes(self.network)[0]
+        for value in (100, np.int64(200), np.float32(300.0)):
+            pipe.length = value
+            self.assertTrue(columns.is_numeric('length'))
+            self.assertEqual(float(value), v_length(self.network)[0])
+            self.assertIs(float, type(pipe.length))
+        pipe.length = True
+        self.assertFalse(columns.is_numeric('length'))
+        self.assertIs(True, pipe.length)
+
+    def test_series_are_read_only(self):
+        lengths = on.get_length(self.network)
+        with self.assertRaises(ValueError):
+            lengths.iloc[0] = -1.0
+        self.assertEqual(self.expected_vectors[0][0], on.get_pipes(self.network)[0].length)
+
+    def test_assign(self):
+        columns = self.network._nodes['junctions'].columns
+        columns.assign('demand', columns.array('demand') * 2)
+        expected = [x * 2 for x in self.expected_series[-1]]
+        self.assertEqual(expected, [j.demand for j in on.get_junctions(self.network)])
+
+    def test_list_demand(self):
+        junction = on.get_junctions(self.network)[0]
+        junction.demand = [1.0, 2.0]
+        self.assertEqual([1.0, 2.0], junction.demand)
+        columns = self.network._nodes['junctions'].columns
+        self.assertTrue(np.isnan(columns.array('demand')[0]))
+        self.assertFalse(columns.is_numeric('demand'))
+        self.assertEqual(3.0, on.get_basedemand(self.network).iloc[0])
+        junction.demand = 4.0
+        self.assertTrue(columns.is_numeric('demand'))
+        self.assertEqual(4.0, v_demand(self.network)[0])
+        self.assertEqual(4.0, on.get_basedemand(self.network).iloc[0])
+
+    def test_add_and_remove(self):
+        pipes = on.get_pipes(self.network)
+        on.remove_pipe(self.network, pipes[0].id)
+        on.add_pipe(
+            self.network,
+            on.Pipe(id='new', startnode=pipes[1].startnode, endnode=pipes[1].endnode, length=42.0),
+        )
+        self.assertEqual([p.length for p in on.get_pipes(self.network)], list(v_length(self.network)))
+        self.assertEqual(42.0, v_length(self.network)[-1])
+        self.assertNotIn('_columns_', pipes[0].__dict__)
+        self.assertNotIsInstance(getattr(type(pipes[0]), 'length'), property)
+        self.assertEqual(self.expected_vectors[0][0], pipes[0].length)
+
+        junction = on.get_junctions(self.network)[5]
+        on.remove_junction(self.network, junction.id)
+        self.assertEqual(
+            [j.elevation for j in on.get_nodes(self.network)], list(v_elevation(self.network))
+        )
+
+    def test_write(self):
+        self.assertEqual(self.expected_inp, write_string(self.network))
+
+    def test_copies(self):
+        for network in (deepcopy(self.network), pickle.loads(pickle.dumps(self.network))):
+            self.assert_unchanged(network)
+            on.get_pipes(network)[0].length = 1.0
+            self.assertEqual(self.expected_vectors[0][0], on.get_pipes(self.network)[0].length)
+
+    def test_plain_components(self):
+        network = SimpleModel().network
+        pipe = on.get_pipes(network)[0]
+        self.assertIn('length', pipe.__dict__)
+        self.assertNotIsInstance(getattr(type(pipe), 'length'), property)
+        self.assertNotIsInstance(getattr(on.Pipe, 'length'), property)
+        self.assertEqual(on.Pipe(id='new'), on.Pipe(id='new'))
+
+    def test_disable(self):
+        disable_column_store(self.network)
+        self.assertIsNone(self.network._links['pipes'].columns)
+        self.assertIn('length', on.get_pipes(self.network)[0].__dict__)
+        self.assertNotIsInstance(getattr(type(on.get_pipes(self.network)[0]), 'length'), property)
+        self.assert_unchanged(self.network)
+
+
+class SimpleColumnStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = SimpleModel()
+        self.network = self.model.network
+        self.expected_inp = write_string(self.network)
+        enable_column_store(self.network)
+
+    def test_write(self):
+        # integers are stored as floats
+        self.assertEqual(on.Network.read(content=self.expected_inp), on.Network.read(content=write_string(self.network)))
+
+    def test_equality(self):
+        plain = SimpleModel().network
+        for expected, pipe in zip(on.get_pipes(plain), on.get_pipes(self.network)):
+            self.assertEqual(expected, pipe)
+            self.assertEqual(pipe, expected)
+            self.assertEqual(repr(expected).split('(')[0], repr(pipe).split('(')[0])
+        on.get_pipes(self.network)[0].length = 1.0
+        self.assertNotEqual(on.get_pipes(plain)[0], on.get_pipes(self.network)[0])
+        self.assertNotEqual(on.get_pipes(self.network)[0], on.get_junctions(self.network)[0])
+
+    def test_split(self):
+        pipe = on.get_pipes(self.network)[0]
+        length = pipe.length
+        junction, new_pipe = pipe.split(split_ratio=0.25)
+        self.assertAlmostEqual(length * 0.25, pipe.length)
+        self.assertAlmostEqual(length * 0.25, new_pipe.length)
+        self.assertIs(self.network._links['pipes'].columns, new_pipe._columns_)
+        self.assertEqual([p.length for p in on.get_pipes(self.network)], list(v_length(self.network)))
+        self.assertEqual([n.elevation for n in on.get_nodes(self.network)], list(v_elevation(self.network)))
+
+
+if __name__ == '__main__':
+    unittest.main()
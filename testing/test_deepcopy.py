@@ -2,10 +2,13 @@ import datetime
 import unittest
 from copy import deepcopy
 
+from oopnet.elements.column_store import enable_column_store
 from oopnet.elements.network import Network
+from oopnet.elements.network_map_tags import Vertex
 from oopnet.utils.getters import *
+from oopnet.writer.write import write_string
 
-from testing.base import SimpleModel, PatternCurveModel
+from testing.base import SimpleModel, PatternCurveModel, CTownModel
 
 
 class DeepcopyTest(unittest.TestCase):
@@ -170,7 +173,68 @@ class PatternCurveDeepcopyTest(DeepcopyTest):
 
     def test_patterns(self):
         self.compare_patterns(self.old_network, self.new_network)
-        
+
+
+class SimpleCloneTest(SimpleDeepcopyTest):
+    def setUp(self) -> None:
+        self.model = SimpleModel()
+        self.old_network = self.model.network
+        self.new_network = self.model.network.clone()
+
+    def test_references(self):
+        for link in get_links(self.new_network):
+            self.assertIs(self.new_network, link._network)
+            self.assertIs(link.startnode, get_node(self.new_network, link.startnode.id))
+            self.assertIs(link.endnode, get_node(self.new_network, link.endnode.id))
+        for node in get_nodes(self.new_network):
+            self.assertIs(self.new_network, node._network)
+            self.assertIsNot(node, get_node(self.old_network, node.id))
+
+    def test_write(self):
+        self.assertEqual(write_string(self.old_network), write_string(self.new_network))
+
+
+class PatternCurveCloneTest(PatternCurveDeepcopyTest):
+    def setUp(self) -> None:
+        self.model = PatternCurveModel()
+        self.old_network = self.model.network
+        self.new_network = self.model.network.clone()
+
+    def test_pattern_references(self):
+        for junction in get_junctions(self.new_network):
+            if junction.demandpattern is not None:
+                self.assertIs(junction.demandpattern, get_pattern(self.new_network, junction.demandpattern.id))
+
+
+class CTownCloneTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = CTownModel()
+        self.network = self.model.network
+
+    def test_rules(self):
+        new_network = self.network.clone()
+        for rule in get_rules(new_network):
+            for condition in rule.condition:
+                if hasattr(condition.object, 'id'):
+                    self.assertIs(new_network, condition.object._network)
+
+    def test_share_static(self):
+        pipe = get_pipes(self.network)[0]
+        pipe.vertices = [Vertex(1.0, 2.0)]
+        new_network = self.network.clone(share_static=True)
+        self.assertIs(pipe.vertices, get_pipe(new_network, pipe.id).vertices)
+        new_network = self.network.clone()
+        self.assertEqual(pipe.vertices, get_pipe(new_network, pipe.id).vertices)
+        self.assertIsNot(pipe.vertices[0], get_pipe(new_network, pipe.id).vertices[0])
+
+    def test_column_store(self):
+        enable_column_store(self.network)
+        new_network = self.network.clone()
+        self.assertEqual(write_string(self.network), write_string(new_network))
+        get_junctions(new_network)[0].demand = 123.0
+        self.assertNotEqual(123.0, get_junctions(self.network)[0].demand)
+        self.assertIs(new_network._nodes['junctions'].columns, get_junctions(new_network)[0]._columns_)
+
 
 if __name__ == '__main__':
     unittest.main()
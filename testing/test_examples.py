@@ -59,6 +59,9 @@ class ExampleTest(unittest.TestCase):
     def test_mc_make_some_noise(self, mock_show):
         import examples.mc_make_some_noise
 
+    def test_mc_stereo_batch(self, mock_show):
+        import examples.mc_stereo_batch
+
     def test_mc_stereo_multiprocessing(self, mock_show):
         import examples.mc_stereo_multiprocessing
 
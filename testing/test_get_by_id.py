@@ -114,5 +114,42 @@ class SimpleElementGetterTest(unittest.TestCase):
             get_link(self.model.network, 'test')
 
 
+class RegistryIndexTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = SimpleModel()
+
+    def test_rename(self):
+        j = get_junction(self.model.network, 'J-1')
+        j.id = 'new-ID'
+        self.assertIs(j, get_node(self.model.network, 'new-ID'))
+        with self.assertRaises(ComponentNotExistingError):
+            get_node(self.model.network, 'J-1')
+
+    def test_rename_existing_id(self):
+        from oopnet.elements.component_registry import IdenticalIDError
+        j = get_junction(self.model.network, 'J-1')
+        with self.assertRaises(IdenticalIDError):
+            j.id = 'T-1'
+        self.assertEqual('J-1', j.id)
+        self.assertIs(j, get_node(self.model.network, 'J-1'))
+        self.assertIsInstance(get_node(self.model.network, 'T-1'), Tank)
+
+    def test_remove(self):
+        from oopnet.utils.removers import remove_node
+        remove_node(self.model.network, 'J-1')
+        self.assertFalse(self.model.network._nodes.check_id_exists('J-1'))
+        with self.assertRaises(ComponentNotExistingError):
+            get_node(self.model.network, 'J-1')
+
+    def test_copy(self):
+        import pickle
+        from copy import deepcopy
+        for network in (deepcopy(self.model.network), pickle.loads(pickle.dumps(self.model.network))):
+            j = get_node(network, 'J-1')
+            self.assertIs(network, j._network)
+            self.assertIs(j, get_junction(network, 'J-1'))
+            self.assertIsNot(j, get_node(self.model.network, 'J-1'))
+
+
 if __name__ == '__main__':
     unittest.main()
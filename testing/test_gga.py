@@ -0,0 +1,92 @@
+import unittest
+from datetime import timedelta
+
+import numpy as np
+
+from oopnet.hydraulics import GGASolver, UnbalancedSystemError
+from oopnet.simulator import BinaryFileReader
+from oopnet.simulator.simulation_errors import HydraulicEquationError
+from oopnet.elements.network_components import Junction
+from oopnet.utils.adders import add_junction
+from oopnet.utils.getters import get_node_ids
+
+from testing.base import CTownModel, PoulakisEnhancedPDAModel, PatternCurveModel, RulesModel, set_dir_testing
+
+
+class GGASolverTest(unittest.TestCase):
+    """Compares the GGASolver's results with EPANET's results for the first time step."""
+    model = None
+
+    def setUp(self) -> None:
+        if self.model is None:
+            self.skipTest('base class')
+        set_dir_testing()
+        self.network = self.model().network
+        self.network.times.duration = timedelta(0)
+        self.network.controls = []
+        for rule_id in list(self.network._rules.keys()):
+            del self.network._rules[rule_id]
+        self.rpt = GGASolver(self.network).run()
+        self.expected = self.network.run(reader=BinaryFileReader)
+
+    def compare(self, var: str, atol: float):
+        actual = getattr(self.rpt, var)
+        expected = getattr(self.expected, var).reindex(actual.index)
+        np.testing.assert_allclose(actual.to_numpy(), expected.to_numpy(), rtol=1e-5, atol=atol)
+
+    def test_nodes(self):
+        self.compare('pressure', 1e-3)
+        self.compare('head', 1e-3)
+        self.compare('demand', 1e-3)
+
+    def test_links(self):
+        self.compare('flow', 1e-3)
+        self.compare('velocity', 1e-4)
+        self.compare('headloss', 1e-3)
+
+
+class PoulakisEnhancedPDAGGASolverTest(GGASolverTest):
+    model = PoulakisEnhancedPDAModel
+
+
+class CTownGGASolverTest(GGASolverTest):
+    model = CTownModel
+
+
+class RulesModelGGASolverTest(GGASolverTest):
+    model = RulesModel
+
+
+class PatternCurveModelGGASolverTest(GGASolverTest):
+    model = PatternCurveModel
+
+
+class GGASolverErrorTest(unittest.TestCase):
+    def setUp(self) -> None:
+        set_dir_testing()
+        self.network = PoulakisEnhancedPDAModel().network
+
+    def test_unbalanced(self):
+        self.network.options.unbalanced = 'STOP'
+        solver = GGASolver(self.network, trials=2)
+        with self.assertRaises(UnbalancedSystemError):
+            solver.run()
+        self.assertFalse(solver.converged)
+
+    def test_unbalanced_continue(self):
+        self.network.options.unbalanced = 'CONTINUE'
+        solver = GGASolver(self.network, trials=2)
+        with self.assertLogs('oopnet.hydraulics.gga', level='WARNING'):
+            rpt = solver.run()
+        self.assertFalse(solver.converged)
+        self.assertEqual(len(get_node_ids(self.network)), len(rpt.pressure))
+
+    def test_disconnected_node(self):
+        network = RulesModel().network
+        add_junction(network, Junction(id='disconnected', demand=1.0))
+        with self.assertRaises(HydraulicEquationError):
+            GGASolver(network).run()
+
+
+if __name__ == '__main__':
+    unittest.main()
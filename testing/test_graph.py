@@ -1,11 +1,16 @@
 import unittest
 
 import networkx as nx
+import pandas as pd
 
 from oopnet.graph.graph import Graph, DiGraph, MultiGraph, MultiDiGraph, onlinks2nxlinks, nxlinks2onlinks, \
     nxedge2onlink_id, edgeresult2pandas
+from oopnet.graph.cache import get_cached_graph, invalidate_graph_cache
+from oopnet.graph.matrices import incidence_matrix, adjacency_matrix, laplacian_matrix
+from oopnet.graph.csr import CSRGraph
 from oopnet.elements.network_components import Pipe
 from oopnet.utils.getters.get_by_id import get_link
+from oopnet.utils.getters.element_lists import get_node_ids, get_link_ids
 
 from testing.base import ETownModel, CTownModel, PoulakisEnhancedPDAModel
 
@@ -133,6 +138,41 @@ class ETownModelGraphTest(unittest.TestCase):
         for lid in onlinks:
             l = get_link(self.model.network, lid)
 
+    def test_nxlinks2onlinks_parallel(self):
+        from oopnet.utils.getters import get_link_ids
+        for graph_type in (MultiGraph, MultiDiGraph):
+            onlinks = nxlinks2onlinks(graph_type(self.model.network))
+            self.assertEqual(sorted(get_link_ids(self.model.network)), sorted(onlinks))
+
+    def test_edgeresult2pandas_edge_link_ids(self):
+        g = MultiGraph(self.model.network)
+        copy = g.copy()
+        for graph in (g, copy):
+            result = {edge: i for i, edge in enumerate(graph.edges(keys=True))}
+            s = edgeresult2pandas(graph, result)
+            self.assertEqual(self.model.n_links, len(s))
+            for (u, v, key), value in result.items():
+                self.assertEqual(value, s[graph.edges[u, v, key]['id']])
+        result = {(v, u): 1.0 for u, v in g.edges()}
+        s = edgeresult2pandas(g, result)
+        self.assertEqual(self.model.n_links, len(s))
+
+    def test_edge_link_ids_changed_graph(self):
+        for graph_type in (Graph, MultiGraph):
+            g = graph_type(self.model.network)
+            edge = next(iter(g.edges(keys=True) if g.is_multigraph() else g.edges()))
+            link_id = g.edges[edge]['id']
+            g.remove_edge(*edge)
+            g.add_edge('new_start', 'new_end', id='new_link')
+            g.add_edge('new_end', 'new_start2', id='new_link2')
+            self.assertEqual('new_link', nxedge2onlink_id(g, ('new_start', 'new_end')))
+            edges = list(g.edges(keys=True) if g.is_multigraph() else g.edges())
+            s = edgeresult2pandas(g, {edge: 1.0 for edge in edges})
+            self.assertEqual(len(edges), len(s))
+            self.assertNotIn(link_id, s.index)
+            self.assertIn('new_link', s.index)
+            self.assertIn('new_link2', s.index)
+
     def test_nxedge2onlinkid_multigraph(self):
         g = MultiGraph(self.model.network)
         for edge in [('40144', '40143'), ('40170', '40169')]:
@@ -150,5 +190,181 @@ class ETownModelGraphTest(unittest.TestCase):
                 get_link(self.model.network, lid)
 
 
+class CachedGraphTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = ETownModel()
+        self.network = self.model.network
+        self.pipe = get_link(self.network, '40144')
+
+    def assertSameGraph(self, graph_type):
+        def edges(g):
+            if g.is_directed():
+                return sorted((u, v, d['id'], d['weight']) for u, v, d in g.edges(data=True))
+            return sorted((min(u, v), max(u, v), d['id'], d['weight']) for u, v, d in g.edges(data=True))
+
+        cached = get_cached_graph(self.network, graph_type, 'diameter')
+        self.assertIsInstance(cached, type(graph_type(self.network, 'diameter')))
+        self.assertEqual(edges(graph_type(self.network, 'diameter')), edges(cached))
+        self.assertEqual(set(graph_type(self.network, 'diameter').nodes), set(cached.nodes))
+
+    def test_cached(self):
+        for graph_type in (Graph, DiGraph, MultiGraph, MultiDiGraph):
+            g = get_cached_graph(self.network, graph_type)
+            self.assertIs(g, get_cached_graph(self.network, graph_type))
+
+    def test_change_weight(self):
+        for graph_type in (Graph, DiGraph, MultiGraph, MultiDiGraph):
+            self.assertSameGraph(graph_type)
+            self.pipe.diameter = 123.0
+            self.assertSameGraph(graph_type)
+            self.pipe.diameter = -1.0
+            self.assertSameGraph(graph_type)
+            self.pipe.diameter = 100.0
+
+    def test_change_topology(self):
+        from oopnet.utils.adders import add_pipe
+        from oopnet.utils.removers import remove_link
+        from oopnet.utils.getters import get_node, get_link_ids
+        for index, graph_type in enumerate((Graph, DiGraph, MultiGraph, MultiDiGraph)):
+            self.assertSameGraph(graph_type)
+            self.pipe.revert()
+            self.assertSameGraph(graph_type)
+            remove_link(self.network, get_link_ids(self.network)[index])
+            self.assertSameGraph(graph_type)
+            add_pipe(self.network, Pipe(id=f'new-{index}', startnode=self.pipe.startnode, endnode=self.pipe.endnode))
+            self.assertSameGraph(graph_type)
+            self.pipe.endnode = get_node(self.network, '40170')
+            self.assertSameGraph(graph_type)
+
+    def test_edgeresult2pandas(self):
+        from oopnet.utils.removers import remove_link
+        from oopnet.utils.adders import add_pipe
+        g = get_cached_graph(self.network)
+        edgeresult2pandas(g, {edge: 1.0 for edge in g.edges(keys=True)})
+        remove_link(self.network, self.pipe.id)
+        add_pipe(self.network, Pipe(id='new', startnode=self.pipe.startnode, endnode=self.pipe.endnode))
+        g = get_cached_graph(self.network)
+        s = edgeresult2pandas(g, {edge: 1.0 for edge in g.edges(keys=True)})
+        self.assertIn('new', s.index)
+        self.assertNotIn(self.pipe.id, s.index)
+        self.assertEqual(len(g.edges), len(s))
+
+    def test_invalidate(self):
+        g = get_cached_graph(self.network)
+        invalidate_graph_cache(self.network)
+        self.assertIsNot(g, get_cached_graph(self.network))
+
+
+class MatrixTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = CTownModel()
+        self.network = self.model.network
+        self.nodes = get_node_ids(self.network)
+
+    def assertSameMatrix(self, expected, actual):
+        self.assertEqual(expected.shape, actual.shape)
+        self.assertAlmostEqual(0, abs(expected - actual).max(), places=6)
+
+    def test_incidence_matrix(self):
+        for oriented in (False, True):
+            m = incidence_matrix(self.network, oriented=oriented)
+            self.assertEqual((self.model.n_nodes, self.model.n_links), m.shape)
+            g = MultiDiGraph(self.network, switch_direction=False)
+            edges = {data['id']: (u, v, key) for u, v, key, data in g.edges(keys=True, data=True)}
+            edgelist = [edges[link_id] for link_id in get_link_ids(self.network)]
+            expected = nx.incidence_matrix(g, nodelist=self.nodes, edgelist=edgelist, oriented=oriented)
+            self.assertSameMatrix(expected, m)
+
+    def test_adjacency_matrix(self):
+        m = adjacency_matrix(self.network)
+        self.assertSameMatrix(nx.adjacency_matrix(MultiGraph(self.network), nodelist=self.nodes, weight=None), m)
+        m = adjacency_matrix(self.network, directed=True, weight='length')
+        expected = nx.adjacency_matrix(MultiDiGraph(self.network, switch_direction=False), nodelist=self.nodes)
+        self.assertSameMatrix(expected, m)
+
+    def test_laplacian_matrix(self):
+        m = laplacian_matrix(self.network, weight='length')
+        self.assertSameMatrix(nx.laplacian_matrix(MultiGraph(self.network), nodelist=self.nodes), m)
+        self.assertAlmostEqual(0, abs(m.sum(axis=1)).max(), places=6)
+
+    def test_parallel_links(self):
+        from oopnet.utils.adders import add_pipe
+        pipe = get_link(self.network, 'P1')
+        add_pipe(self.network, Pipe(id='parallel', startnode=pipe.startnode, endnode=pipe.endnode))
+        self.assertEqual(self.model.n_links + 1, incidence_matrix(self.network).shape[1])
+        m = adjacency_matrix(self.network)
+        self.assertEqual(2, m[self.nodes.index(pipe.startnode.id), self.nodes.index(pipe.endnode.id)])
+
+
+class CSRGraphTest(unittest.TestCase):
+    def setUp(self) -> None:
+        from oopnet.utils.getters import get_reservoir_ids, get_tank_ids
+        self.model = CTownModel()
+        self.network = self.model.network
+        self.graph = CSRGraph(self.network)
+        self.nx_graph = MultiGraph(self.network, switch_direction=False)
+        self.sources = get_reservoir_ids(self.network) + get_tank_ids(self.network)
+
+    def test_shortest_path_lengths(self):
+        lengths = self.graph.shortest_path_lengths(self.sources)
+        expected = pd.Series(nx.multi_source_dijkstra_path_length(self.nx_graph, self.sources))
+        self.assertEqual(self.model.n_nodes, len(lengths))
+        pd.testing.assert_series_equal(expected, lengths[expected.index], check_names=False)
+
+    def test_directed(self):
+        graph = CSRGraph(self.network, directed=True)
+        source = self.sources[0]
+        lengths = graph.shortest_path_lengths(source)
+        nx_graph = MultiDiGraph(self.network, switch_direction=False)
+        expected = pd.Series(nx.single_source_dijkstra_path_length(nx_graph, source))
+        pd.testing.assert_series_equal(expected, lengths[expected.index], check_names=False)
+        self.assertEqual(len(expected), lengths.lt(float('inf')).sum())
+
+    def test_hop_distances(self):
+        distances = self.graph.hop_distances(self.sources[0])
+        expected = pd.Series(nx.single_source_shortest_path_length(self.nx_graph, self.sources[0]), dtype=float)
+        pd.testing.assert_series_equal(expected, distances[expected.index], check_names=False)
+
+    def test_shortest_path(self):
+        target = get_link(self.network, 'P1').startnode.id
+        path = self.graph.shortest_path(self.sources[0], target)
+        self.assertEqual(nx.dijkstra_path(self.nx_graph, self.sources[0], target), path)
+        self.assertEqual([target], self.graph.shortest_path(target, target))
+
+    def test_components(self):
+        from oopnet.utils.removers import remove_link
+        self.assertEqual(1, self.graph.connected_components().nunique())
+        self.assertTrue(self.graph.reachable(self.sources).all())
+        bridges = self.graph.bridges()
+        bridge = bridges[bridges].index[0]
+        remove_link(self.network, bridge)
+        graph = CSRGraph(self.network)
+        self.assertEqual(2, graph.connected_components().nunique())
+        self.assertFalse(graph.reachable(self.sources[0]).all())
+        self.assertEqual(float('inf'), graph.hop_distances(self.sources[0]).max())
+        with self.assertRaises(ValueError):
+            graph.shortest_path(self.sources[0], graph.hop_distances(self.sources[0]).idxmax())
+
+    def test_bridges(self):
+        bridges = self.graph.bridges()
+        expected = {nxedge2onlink_id(self.nx_graph, edge) for edge in nx.bridges(self.nx_graph)}
+        self.assertEqual(self.model.n_links, len(bridges))
+        self.assertEqual(expected, set(bridges[bridges].index))
+
+    def test_parallel_bridge(self):
+        from oopnet.utils.adders import add_pipe
+        bridges = self.graph.bridges()
+        pipe = get_link(self.network, bridges[bridges].index[0])
+        add_pipe(self.network, Pipe(id='parallel', startnode=pipe.startnode, endnode=pipe.endnode))
+        bridges = CSRGraph(self.network).bridges()
+        self.assertFalse(bridges[pipe.id])
+        self.assertFalse(bridges['parallel'])
+
+    def test_missing_node(self):
+        from oopnet.elements.component_registry import ComponentNotExistingError
+        with self.assertRaises(ComponentNotExistingError):
+            self.graph.shortest_path_lengths('nonsense')
+
+
 if __name__ == '__main__':
     unittest.main()
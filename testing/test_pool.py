@@ -0,0 +1,116 @@
+import os
+import signal
+import unittest
+
+import pandas as pd
+
+from oopnet.elements.component_registry import ComponentNotExistingError
+from oopnet.simulator import BinaryFileReader
+from oopnet.simulator.pool import SimulationPool, WorkerCrashedError
+from oopnet.simulator.toolkit import ToolkitSimulator
+from oopnet.utils.getters import get_junction
+
+from testing.base import PoulakisEnhancedPDAModel, set_dir_testing
+
+
+class SimulationPoolTest(unittest.TestCase):
+    backend = 'toolkit'
+
+    def setUp(self) -> None:
+        set_dir_testing()
+        self.network = PoulakisEnhancedPDAModel().network
+        self.modifications = [
+            {'demand': {'J-03': 100.0}},
+            {},
+            {'demand': {'J-03': 50.0, 'J-31': 20.0}, 'diameter': {'P-01': 300.0}},
+        ]
+        self.pool = SimulationPool(self.network, workers=2, backend=self.backend)
+
+    def tearDown(self) -> None:
+        self.pool.close()
+
+    def expected(self):
+        with ToolkitSimulator(self.network) as simulator:
+            return [simulator.run(modification) for modification in self.modifications]
+
+    def compare(self, reports):
+        self.assertEqual(len(self.modifications), len(reports))
+        for expected, rpt in zip(self.expected(), reports):
+            pd.testing.assert_series_equal(expected.pressure, rpt.pressure, rtol=1e-4, atol=1e-3)
+            pd.testing.assert_series_equal(expected.flow, rpt.flow, rtol=1e-4, atol=1e-3)
+
+    def test_map(self):
+        self.compare(list(self.pool.map(self.modifications)))
+        self.compare(list(self.pool.map(self.modifications)))
+
+    def test_run(self):
+        pd.testing.assert_series_equal(
+            self.network.run(reader=BinaryFileReader).pressure, self.pool.run().pressure, rtol=1e-4, atol=1e-3
+        )
+
+    def test_resize(self):
+        self.pool.resize(3)
+        self.assertEqual(3, self.pool.workers)
+        self.compare(list(self.pool.map(self.modifications)))
+        self.pool.resize(1)
+        self.assertEqual(1, self.pool.workers)
+        self.assertEqual(1, len(self.pool._workers))
+        self.compare(list(self.pool.map(self.modifications)))
+        with self.assertRaises(ValueError):
+            self.pool.resize(0)
+
+    def test_crash_recovery(self):
+        reports = self.pool.map(self.modifications)
+        for worker in self.pool._workers:
+            os.kill(worker.process.pid, signal.SIGKILL)
+        with self.assertLogs('oopnet.simulator.pool'):
+            self.compare(list(reports))
+        self.assertEqual(2, self.pool.workers)
+        self.compare(list(self.pool.map(self.modifications)))
+
+    def test_unknown_component(self):
+        with self.assertRaises(ComponentNotExistingError):
+            self.pool.run({'demand': {'not_existing': 1.0}})
+        # the worker keeps the base network
+        pd.testing.assert_series_equal(self.expected()[1].pressure, self.pool.run().pressure, rtol=1e-4, atol=1e-3)
+        self.assertEqual(50.0, get_junction(self.network, 'J-03').demand)
+
+    def test_discarded_first_result(self):
+        # the second worker's first result is discarded after the first modification failed
+        with self.assertRaises(ComponentNotExistingError):
+            list(self.pool.map([{'diameter': {'not_existing': 1.0}}, self.modifications[2]]))
+        self.pool.resize(1)
+        self.modifications = self.modifications[2:]
+        self.compare([self.pool.run(self.modifications[0])])
+
+    def test_closed(self):
+        self.pool.close()
+        self.assertEqual(0, self.pool.workers)
+        with self.assertRaises(ValueError):
+            self.pool.run()
+
+
+class EPANETSimulationPoolTest(SimulationPoolTest):
+    backend = 'epanet'
+
+
+class SimulationPoolErrorTest(unittest.TestCase):
+    def setUp(self) -> None:
+        set_dir_testing()
+        self.network = PoulakisEnhancedPDAModel().network
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            SimulationPool(self.network, backend='not_existing')
+
+    def test_repeated_crashes(self):
+        with SimulationPool(self.network, workers=1, retries=0) as pool:
+            reports = pool.map([{}])
+            os.kill(pool._workers[0].process.pid, signal.SIGKILL)
+            with self.assertLogs('oopnet.simulator.pool'), self.assertRaises(WorkerCrashedError):
+                list(reports)
+            self.assertEqual(1, pool.workers)
+
+
+if __name__ == '__main__':
+    unittest.main()
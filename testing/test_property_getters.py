@@ -1,10 +1,16 @@
 import unittest
 
+import numpy as np
 import pandas as pd
 
+from oopnet.elements.column_store import enable_column_store
 from oopnet.utils.getters import *
+from oopnet.utils.adders import add_pipe
+from oopnet.utils.removers import remove_pipe
+from oopnet.utils.setters import set_basedemand
+from oopnet.elements.network_components import Pipe
 
-from testing.base import SimpleModel
+from testing.base import SimpleModel, CTownModel
 
 
 class SimplePropertyGetterTest(unittest.TestCase):
@@ -106,5 +112,80 @@ class SimplePropertyGetterTest(unittest.TestCase):
         self.assertIsInstance(comment, pd.Series)
         self.assertEqual(self.model.n_nodes, len(comment))
 
+
+class MemoisedPropertyGetterTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = CTownModel()
+        self.network = self.model.network
+
+    def test_cached(self):
+        length = get_length(self.network)
+        version, cached = self.network._getters_['get_length']
+        pd.testing.assert_series_equal(length, get_length(self.network))
+        self.assertIs(cached, self.network._getters_['get_length'][1])
+        self.assertTrue(np.shares_memory(cached.to_numpy(), get_length(self.network).to_numpy()))
+        self.assertEqual('m', get_length(self.network).units)
+
+    def test_read_only(self):
+        length = get_length(self.network)
+        with self.assertRaises(ValueError):
+            length.iloc[0] = -1.0
+        coordinates = get_coordinates(self.network)
+        with self.assertRaises(ValueError):
+            coordinates.iloc[0, 0] = -1.0
+        length = length.copy()
+        length.iloc[0] = -1.0
+        length.name = 'changed'
+        self.assertNotEqual(-1.0, get_length(self.network).iloc[0])
+        self.assertEqual('pipe lengths', get_length(self.network).name)
+
+    def test_version(self):
+        version = self.network._version_
+        get_pipes(self.network)[0].comment = 'changed'
+        self.assertEqual(version + 1, self.network._version_)
+        Pipe(id='new').length = 1.0
+        self.assertEqual(version + 1, self.network._version_)
+
+    def test_attribute_change(self):
+        self.check_attribute_change()
+
+    def test_attribute_change_column_store(self):
+        enable_column_store(self.network)
+        self.check_attribute_change()
+
+    def check_attribute_change(self):
+        pipe = get_pipes(self.network)[0]
+        get_length(self.network)
+        get_linkcenter_coordinates(self.network)
+        pipe.length = 123.0
+        self.assertEqual(123.0, get_length(self.network)[pipe.id])
+        pipe.startnode.xcoordinate = 1000.0
+        self.assertEqual(1000.0, get_startendcoordinates(self.network).loc[pipe.id, 'start x-coordinate'])
+        self.assertEqual(
+            (1000.0 + pipe.endnode.xcoordinate) / 2,
+            get_linkcenter_coordinates(self.network).loc[pipe.id, 'center x-coordinate'],
+        )
+        self.assertEqual(1000.0, get_coordinates(self.network).loc[pipe.startnode.id, 'node x-coordinate'])
+
+    def test_topology_change(self):
+        pipe = get_pipes(self.network)[0]
+        startnodes = get_startnodes(self.network)
+        pipe.startnode, pipe.endnode = pipe.endnode, pipe.startnode
+        self.assertEqual(startnodes[pipe.id], get_endnodes(self.network)[pipe.id])
+        remove_pipe(self.network, pipe.id)
+        self.assertNotIn(pipe.id, get_length(self.network).index)
+        add_pipe(self.network, Pipe(id='new', startnode=pipe.startnode, endnode=pipe.endnode, length=5.0))
+        self.assertEqual(5.0, get_length(self.network)['new'])
+
+    def test_column_store(self):
+        enable_column_store(self.network)
+        demand = get_basedemand(self.network)
+        expected = demand * 2
+        set_basedemand(self.network, expected)
+        pd.testing.assert_series_equal(expected, get_basedemand(self.network))
+        # the results are views of the column store
+        pd.testing.assert_series_equal(expected, demand)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from oopnet.elements.column_store import enable_column_store
+from oopnet.elements.component_registry import ComponentNotExistingError
+from oopnet.utils.getters import *
+from oopnet.utils.setters import *
+
+from testing.base import SimpleModel, CTownModel
+
+
+class SimplePropertySetterTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = SimpleModel()
+        self.network = self.model.network
+
+    def test_set_length_series(self):
+        length = get_length(self.network) * 2
+        set_length(self.network, length)
+        pd.testing.assert_series_equal(length, get_length(self.network))
+
+    def test_set_diameter_array(self):
+        diameter = get_diameter(self.network).values + 10
+        set_diameter(self.network, diameter)
+        np.testing.assert_array_equal(diameter, get_diameter(self.network).values)
+
+    def test_set_roughness_scalar(self):
+        set_roughness(self.network, 0.5)
+        self.assertTrue((get_roughness(self.network) == 0.5).all())
+
+    def test_set_minorloss_ids(self):
+        ids = get_pipe_ids(self.network)[:2]
+        set_minorloss(self.network, [1.0, 2.0], ids=ids)
+        self.assertEqual([1.0, 2.0], get_minorloss(self.network)[ids].tolist())
+
+    def test_set_coordinates(self):
+        set_xcoordinate(self.network, 1.0)
+        set_ycoordinate(self.network, 2.0)
+        self.assertTrue((get_xcoordinate(self.network) == 1.0).all())
+        self.assertTrue((get_ycoordinate(self.network) == 2.0).all())
+
+    def test_set_elevation(self):
+        elevation = get_elevation(self.network) + 1
+        set_elevation(self.network, elevation)
+        pd.testing.assert_series_equal(elevation, get_elevation(self.network))
+
+    def test_set_basedemand(self):
+        demand = get_basedemand(self.network) * 1.1
+        set_basedemand(self.network, demand)
+        pd.testing.assert_series_equal(demand, get_basedemand(self.network))
+
+    def test_set_attribute(self):
+        set_attribute(self.network, "elevation", 5.0)
+        self.assertTrue((get_elevation(self.network) == 5.0).all())
+        junction_id = get_junction_ids(self.network)[0]
+        set_attribute(self.network, "demand", pd.Series([3.0], index=[junction_id]))
+        self.assertEqual(3.0, get_junction(self.network, junction_id).demand)
+
+    def test_not_existing_id(self):
+        roughness = get_roughness(self.network)
+        with self.assertRaises(ComponentNotExistingError):
+            set_roughness(self.network, [1.0, 2.0], ids=[get_pipe_ids(self.network)[0], "not existing"])
+        pd.testing.assert_series_equal(roughness, get_roughness(self.network))
+
+    def test_wrong_length(self):
+        with self.assertRaises(ValueError):
+            set_length(self.network, [1.0])
+        with self.assertRaises(ValueError):
+            set_length(self.network, get_length(self.network), ids=get_pipe_ids(self.network))
+
+
+class CTownColumnStorePropertySetterTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = CTownModel()
+        self.network = self.model.network
+        enable_column_store(self.network)
+
+    def test_set_basedemand(self):
+        demand = get_basedemand(self.network) * 1.1
+        set_basedemand(self.network, demand)
+        pd.testing.assert_series_equal(demand, get_basedemand(self.network))
+        self.assertEqual(demand.tolist(), [j.demand for j in get_junctions(self.network)])
+
+    def test_set_diameter_ids(self):
+        ids = [get_valve_ids(self.network)[0], get_pipe_ids(self.network)[3]]
+        set_diameter(self.network, [11.0, 22.0], ids=ids)
+        self.assertEqual(11.0, get_valve(self.network, ids[0]).diameter)
+        self.assertEqual(22.0, get_pipe(self.network, ids[1]).diameter)
+
+    def test_set_attribute_not_stored(self):
+        set_attribute(self.network, "initialquality", 1.0)
+        self.assertTrue(all(n.initialquality == 1.0 for n in get_nodes(self.network)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,7 @@ from oopnet.elements.network_components import Junction, Tank, Reservoir, Pipe,
 from oopnet.elements.system_operation import Curve
 from oopnet.utils.getters import *
 from oopnet.utils.getters.element_lists import get_patterns
+from oopnet.writer.write import write_string
 from testing.base import set_dir_testing, PoulakisEnhancedPDAModel
 
 
@@ -33,6 +34,38 @@ class ContentReaderTest(unittest.TestCase):
         self.assertEqual(PoulakisEnhancedPDAModel.n_valves, len(get_valves(net)))
 
 
+class SectionOrderReaderTest(unittest.TestCase):
+    def setUp(self) -> None:
+        set_dir_testing()
+        with open(os.path.join('..', 'examples', 'data', 'C-town.inp')) as f:
+            self.content = f.read()
+
+    def _reorder(self, sections: list[str]) -> str:
+        from oopnet import Network
+        return write_string(Network.read(filename=None, content=''.join(sections)))
+
+    def _sections(self) -> list[str]:
+        parts = self.content.split('\n[')
+        return [parts[0] + '\n'] + ['[' + part + '\n' for part in parts[1:]]
+
+    def test_patterns_and_curves_last(self):
+        sections = self._sections()
+        index = next(i for i, section in enumerate(sections) if section.startswith('[PATTERNS]'))
+        self.assertEqual(self._reorder(sections), self._reorder(sections[index:] + sections[:index]))
+
+    def test_duplicate_section(self):
+        sections = self._sections()
+        duplicate = '[JUNCTIONS]\nJ-01 0 0\n'
+        network_string = self._reorder([duplicate] + sections)
+        self.assertEqual(self._reorder(sections), network_string)
+
+    def test_filesplitter(self):
+        from oopnet.reader.read import filesplitter
+        blocks = filesplitter(self.content.splitlines())
+        self.assertEqual(388, len(blocks['JUNCTIONS']))
+        self.assertEqual({'values': ['PU1', 'J285', 'J273', 'HEAD', '1'], 'comments': ''}, blocks['PUMPS'][0])
+
+
 class PoulakisEnhancedReaderTest(unittest.TestCase):
     def setUp(self) -> None:
         from testing.base import PoulakisEnhancedPDAModel
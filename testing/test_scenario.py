@@ -0,0 +1,91 @@
+import os
+import unittest
+
+import pandas as pd
+
+from oopnet.elements.component_registry import ComponentNotExistingError
+from oopnet.elements.scenario import Scenario
+from oopnet.utils.getters import get_basedemand, get_diameter, get_junction, get_pipe
+from oopnet.writer.write import write_string
+
+from testing.base import SimpleModel, PoulakisEnhancedPDAModel
+
+
+class SimpleScenarioTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = SimpleModel()
+        self.network = self.model.network
+        self.base_inp = write_string(self.network)
+        self.scenario = Scenario(self.network, name='test')
+        self.scenario.set_node('J-1', demand=123.0)
+        self.scenario.set_link('P-1', diameter=321.0, status='CLOSED')
+
+    def test_applied(self):
+        with self.scenario.applied() as network:
+            self.assertIs(self.network, network)
+            self.assertEqual(123.0, get_junction(network, 'J-1').demand)
+            self.assertEqual(321.0, get_pipe(network, 'P-1').diameter)
+            self.assertEqual('CLOSED', get_pipe(network, 'P-1').status)
+        self.assertEqual(self.base_inp, write_string(self.network))
+
+    def test_restore_after_error(self):
+        with self.assertRaises(RuntimeError):
+            with self.scenario.applied():
+                raise RuntimeError
+        self.assertEqual(self.base_inp, write_string(self.network))
+
+    def test_get(self):
+        self.assertEqual(123.0, self.scenario.get(get_basedemand)['J-1'])
+        self.assertEqual(321.0, self.scenario.get(get_diameter)['P-1'])
+        self.assertNotEqual(123.0, get_basedemand(self.network)['J-1'])
+
+    def test_write(self):
+        expected = write_string(self.scenario.materialise())
+        filename = 'scenario_test.inp'
+        try:
+            self.scenario.write(filename)
+            with open(filename) as file:
+                self.assertEqual(expected, file.read())
+        finally:
+            os.remove(filename)
+        self.assertNotEqual(self.base_inp, expected)
+        self.assertEqual(self.base_inp, write_string(self.network))
+
+    def test_base_changes(self):
+        get_pipe(self.network, 'P-0').diameter = 111.0
+        self.assertEqual(111.0, self.scenario.get(get_diameter)['P-0'])
+
+    def test_invalid_overrides(self):
+        with self.assertRaises(ComponentNotExistingError):
+            self.scenario.set_node('not existing', demand=1.0)
+        with self.assertRaises(AttributeError):
+            self.scenario.set_link('P-1', not_existing=1.0)
+
+    def test_to_modification(self):
+        self.assertEqual(
+            {'demand': {'J-1': 123.0}, 'diameter': {'P-1': 321.0}, 'status': {'P-1': 'CLOSED'}},
+            self.scenario.to_modification(),
+        )
+
+    def test_reset(self):
+        self.scenario.reset()
+        self.assertEqual(self.base_inp, write_string(self.scenario.materialise()))
+
+
+class PoulakisScenarioTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = PoulakisEnhancedPDAModel()
+        self.network = self.model.network
+
+    def test_run(self):
+        scenario = Scenario(self.network)
+        scenario.set_link('P-01', status='CLOSED')
+        rpt = scenario.run()
+        expected = scenario.materialise().run()
+        pd.testing.assert_series_equal(expected.pressure, rpt.pressure)
+        pd.testing.assert_series_equal(self.network.run().pressure, Scenario(self.network).run().pressure)
+        self.assertNotEqual('CLOSED', get_pipe(self.network, 'P-01').status)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,19 @@
+import asyncio
+import gc
 import os
 import unittest
+from datetime import timedelta
 
 import numpy as np
 import pandas as pd
 
 from oopnet.report import *
+from oopnet.simulator import BinaryFileReader, LazyBinaryFileReader, InvalidBinaryFileError, ReportFileReader
+from oopnet.simulator.batch import run_batch
+from oopnet.simulator.scratch import scratch_directory
+from oopnet.simulator.simulation_errors import EPANETSimulationError
+from oopnet.elements.component_registry import ComponentNotExistingError
+from oopnet.utils.getters import get_junction, get_pipe
 
 from testing.base import CTownModel, MicropolisModel, PoulakisEnhancedPDAModel, RulesModel, SimpleModel, \
     activate_all_report_parameters, set_dir_testing, PatternCurveModel
@@ -127,5 +136,269 @@ class PatternCurveModelSimulatorTest(SimulatorTest):
         self.model.network.run()
 
 
+class BinaryFileReaderTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = CTownModel()
+        activate_all_report_parameters(self.model.network)
+        self.model.network.times.duration = timedelta(hours=6)
+
+    def compare_reports(self, rpt, binary_rpt):
+        for prop in ['demand', 'head', 'pressure', 'flow', 'velocity', 'length', 'diameter']:
+            expected = getattr(rpt, prop)
+            actual = getattr(binary_rpt, prop).loc[expected.index, expected.columns]
+            # the report file contains values rounded to two decimals or to three significant digits
+            np.testing.assert_allclose(actual.values, expected.values, atol=0.0051, rtol=5e-3)
+
+    def test_eps(self):
+        rpt = self.model.network.run()
+        binary_rpt = self.model.network.run(reader=BinaryFileReader)
+        self.assertEqual(rpt.nodes.dims, binary_rpt.nodes.dims)
+        self.assertEqual(rpt.links.dims, binary_rpt.links.dims)
+        self.assertEqual(7, len(binary_rpt.pressure.index))
+        self.assertEqual(self.model.n_nodes, len(binary_rpt.pressure.columns))
+        self.assertEqual(self.model.n_links, len(binary_rpt.flow.columns))
+        self.compare_reports(rpt, binary_rpt)
+
+    def test_report_settings_unchanged(self):
+        self.model.network.report.nodes = 'NONE'
+        self.model.network.run(reader=BinaryFileReader)
+        self.assertEqual('NONE', self.model.network.report.nodes)
+        self.assertEqual('ALL', self.model.network.report.links)
+
+    def test_invalid_file(self):
+        with self.assertRaises(InvalidBinaryFileError):
+            BinaryFileReader(os.path.join('networks', 'C-town.inp'))
+
+
+class LazyBinaryFileReaderTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = CTownModel()
+        self.model.network.times.duration = timedelta(hours=6)
+
+    def test_eps(self):
+        binary_rpt = self.model.network.run(reader=BinaryFileReader)
+        lazy_rpt = self.model.network.run(reader=LazyBinaryFileReader)
+        self.assertEqual(binary_rpt.nodes.dims, lazy_rpt.nodes.dims)
+        self.assertEqual(binary_rpt.links.shape, lazy_rpt.links.shape)
+        pd.testing.assert_frame_equal(binary_rpt.pressure, lazy_rpt.pressure)
+        pd.testing.assert_frame_equal(binary_rpt.headloss, lazy_rpt.headloss)
+        pd.testing.assert_frame_equal(binary_rpt.get_node_info('J1'), lazy_rpt.get_node_info('J1'))
+        pd.testing.assert_frame_equal(binary_rpt.get_link_info('P1'), lazy_rpt.get_link_info('P1'))
+
+    def test_spa(self):
+        self.model.network.times.duration = timedelta()
+        binary_rpt = self.model.network.run(reader=BinaryFileReader)
+        lazy_rpt = self.model.network.run(reader=LazyBinaryFileReader)
+        pd.testing.assert_series_equal(binary_rpt.flow, lazy_rpt.flow)
+        pd.testing.assert_series_equal(binary_rpt.get_node_info('J1'), lazy_rpt.get_node_info('J1'))
+        np.testing.assert_array_equal(binary_rpt.nodes.isel(id=[3, 1], vars=slice(1, 3)).values,
+                                      lazy_rpt.nodes.isel(id=[3, 1], vars=slice(1, 3)).values)
+
+    def test_delete(self):
+        path = os.path.join('tmp', 'lazy')
+        rpt = self.model.network.run(reader=LazyBinaryFileReader, path=path)
+        self.assertEqual(1, len(os.listdir(path)))
+        rpt.pressure
+        del rpt
+        gc.collect()
+        self.assertEqual(0, len(os.listdir(path)))
+
+
+class ReportFileReaderTest(unittest.TestCase):
+    report = """  Page 1
+
+  Analysis begun Sun Oct 18 19:48:48 2026
+
+  Node Results at 0:00:00 hrs:
+  --------------------------------------------------------
+                     Demand      Head  Pressure   Quality
+  Node                  L/s         m         m
+  --------------------------------------------------------
+  J-1                  1.00    100.00     50.00      0.00
+  J2             -1234567.89-123456.78     50.00      0.00
+  T1                -12.80    116.27      3.37      0.00  Tank
+
+  Node Results at 1:00:00 hrs:
+  --------------------------------------------------------
+                     Demand      Head  Pressure   Quality
+  Node                  L/s         m         m
+  --------------------------------------------------------
+  J-1                  2.00    101.00     51.00      0.00
+  J2                   1.50 -1.23e+06     52.00      0.00
+  T1                -13.80    117.27      4.37      0.00  Tank
+
+  Link Results at 0:00:00 hrs:
+  ----------------------------------------------
+                       Flow  Velocity  Headloss
+  Link                  L/s       m/s    /1000m
+  ----------------------------------------------
+  P1                   0.95      0.03      0.02
+
+  Link Results at 1:00:00 hrs:
+  ----------------------------------------------
+                       Flow  Velocity  Headloss
+  Link                  L/s       m/s    /1000m
+  ----------------------------------------------
+  P1                  -1.60      0.35      3.44
+  PU1                  0.00      0.00      0.00  Pump
+
+  Analysis ended Sun Oct 18 19:48:48 2026
+"""
+
+    def setUp(self) -> None:
+        os.makedirs('tmp', exist_ok=True)
+        self.filename = os.path.join('tmp', 'report_reader.rpt')
+        with open(self.filename, 'w') as fid:
+            fid.write(self.report)
+
+    def tearDown(self) -> None:
+        os.remove(self.filename)
+
+    def test_nodes(self):
+        nodes, _ = ReportFileReader(self.filename)
+        self.assertEqual(('time', 'id', 'vars'), nodes.dims)
+        self.assertListEqual(['J-1', 'J2', 'T1'], list(nodes.id.values))
+        self.assertListEqual(['Demand', 'Head', 'Pressure', 'Quality'], list(nodes.vars.values))
+        np.testing.assert_array_equal([-1234567.89, -123456.78, 50.0, 0.0], nodes.isel(time=0).sel(id='J2').values)
+        np.testing.assert_array_equal([1.5, -1.23e6, 52.0, 0.0], nodes.isel(time=1).sel(id='J2').values)
+        np.testing.assert_array_equal([-13.8, 117.27, 4.37, 0.0], nodes.isel(time=1).sel(id='T1').values)
+
+    def test_differing_ids(self):
+        _, links = ReportFileReader(self.filename)
+        self.assertListEqual(['P1', 'PU1'], list(links.id.values))
+        np.testing.assert_array_equal([-1.6, 0.35, 3.44], links.isel(time=1).sel(id='P1').values)
+        self.assertTrue(np.isnan(links.isel(time=0).sel(id='PU1').values).all())
+
+
+class BatchTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = PoulakisEnhancedPDAModel()
+        self.modifications = [
+            {'demand': {'J-03': 100.0}},
+            {},
+            {'demand': {'J-03': 50.0, 'J-31': 20.0}, 'diameter': {'P-01': 300.0}},
+        ]
+
+    def test_results(self):
+        reports = list(run_batch(self.model.network, self.modifications, workers=2))
+        self.assertEqual(len(self.modifications), len(reports))
+
+        for modification, rpt in zip(self.modifications, reports):
+            network = PoulakisEnhancedPDAModel().network
+            for attribute, values in modification.items():
+                for id, value in values.items():
+                    component = get_pipe(network, id) if attribute == 'diameter' else get_junction(network, id)
+                    setattr(component, attribute, value)
+            expected = network.run(reader=BinaryFileReader)
+            pd.testing.assert_series_equal(expected.pressure, rpt.pressure)
+            pd.testing.assert_series_equal(expected.flow, rpt.flow)
+
+    def test_network_unchanged(self):
+        demand = get_junction(self.model.network, 'J-03').demand
+        list(run_batch(self.model.network, self.modifications, workers=1))
+        self.assertEqual(demand, get_junction(self.model.network, 'J-03').demand)
+
+    def test_unknown_component(self):
+        with self.assertRaises(ComponentNotExistingError):
+            list(run_batch(self.model.network, [{'demand': {'P-01': 1.0}}], workers=1))
+
+
+class ProjectionTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = MicropolisModel()
+        self.network = self.model.network
+        self.nodes = ['IN6', 'TN1', 'IN0']
+        self.links = ['SC3', 'SC1']
+
+    def test_report_file(self):
+        rpt = self.network.run(nodes=self.nodes, links=self.links, variables=['pressure', 'Flow'])
+        self.assertEqual(self.nodes, list(rpt.nodes.id.values))
+        self.assertEqual(self.links, list(rpt.links.id.values))
+        self.assertEqual(['Pressure'], list(rpt.nodes.vars.values))
+        self.assertEqual(['Flow'], list(rpt.links.vars.values))
+        expected = self.network.run()
+        pd.testing.assert_frame_equal(expected.pressure[self.nodes], rpt.pressure)
+        pd.testing.assert_frame_equal(expected.flow[self.links], rpt.flow)
+
+    def test_settings_unchanged(self):
+        demand = self.network.reportparameter.demand
+        nodes = self.network.report.nodes
+        self.network.run(nodes=self.nodes, variables=['pressure'])
+        self.assertEqual(demand, self.network.reportparameter.demand)
+        self.assertEqual(nodes, self.network.report.nodes)
+
+    def test_binary_file(self):
+        rpt = self.network.run(reader=BinaryFileReader, nodes=self.nodes, links=[], variables=['pressure', 'flow'])
+        self.assertEqual(self.nodes, list(rpt.nodes.id.values))
+        self.assertEqual(['Pressure'], list(rpt.nodes.vars.values))
+        self.assertIsNone(rpt.links)
+        expected = self.network.run(reader=BinaryFileReader)
+        pd.testing.assert_frame_equal(expected.pressure[self.nodes], rpt.pressure)
+
+    def test_variables_only(self):
+        rpt = self.network.run(variables=['pressure'])
+        self.assertEqual(['Pressure'], list(rpt.nodes.vars.values))
+        self.assertIsNone(rpt.links)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.network.run(variables=['not_existing'])
+        with self.assertRaises(ComponentNotExistingError):
+            self.network.run(nodes=['not_existing'])
+
+
+class AsyncSimulatorTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = CTownModel()
+
+    def test_concurrent_runs(self):
+        expected = self.model.network.run()
+
+        async def run_all():
+            semaphore = asyncio.Semaphore(2)
+            return await asyncio.gather(*[self.model.network.run_async(semaphore=semaphore) for _ in range(4)])
+
+        for rpt in asyncio.run(run_all()):
+            pd.testing.assert_series_equal(expected.pressure, rpt.pressure)
+            pd.testing.assert_series_equal(expected.flow, rpt.flow)
+
+    def test_binary_reader(self):
+        expected = self.model.network.run(reader=BinaryFileReader)
+        rpt = asyncio.run(self.model.network.run_async(reader=BinaryFileReader))
+        pd.testing.assert_series_equal(expected.pressure, rpt.pressure)
+
+    def test_error(self):
+        get_pipe(self.model.network, 'P1').diameter = -100
+        with self.assertRaises(EPANETSimulationError):
+            asyncio.run(self.model.network.run_async())
+
+
+class ScratchDirectoryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = PoulakisEnhancedPDAModel()
+
+    def test_results(self):
+        for reader in [ReportFileReader, BinaryFileReader, LazyBinaryFileReader]:
+            expected = self.model.network.run(reader=reader)
+            rpt = self.model.network.run(reader=reader, scratch=True)
+            pd.testing.assert_series_equal(expected.pressure, rpt.pressure)
+            pd.testing.assert_series_equal(expected.flow, rpt.flow)
+
+    def test_files_reused(self):
+        self.model.network.run(scratch=True)
+        files = sorted(os.listdir(scratch_directory.path))
+        get_junction(self.model.network, 'J-03').demand = 100.0
+        rpt = self.model.network.run(scratch=True)
+        self.assertListEqual(files, sorted(os.listdir(scratch_directory.path)))
+        self.assertAlmostEqual(100.0, rpt.demand['J-03'], places=1)
+
+    def test_concurrent_runs(self):
+        async def run_all():
+            return await asyncio.gather(*[self.model.network.run_async(scratch=True) for _ in range(3)])
+
+        for rpt in asyncio.run(run_all()):
+            self.assertEqual(len(rpt.pressure), len(self.model.network.run(scratch=True).pressure))
+
+
 if __name__ == '__main__':
     unittest.main()
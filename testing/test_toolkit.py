@@ -0,0 +1,126 @@
+import os
+import unittest
+
+import numpy as np
+
+from oopnet.elements.component_registry import ComponentNotExistingError
+from oopnet.elements.network_components import Junction
+from oopnet.simulator import BinaryFileReader, UnconnectedNodeError
+from oopnet.simulator.simulation_errors import EPANETSimulationError
+from oopnet.simulator.toolkit import ToolkitSimulator
+from oopnet.utils.adders import add_junction
+from oopnet.utils.getters import get_junction, get_pipe
+
+from testing.base import CTownModel, PoulakisEnhancedPDAModel, RulesModel, set_dir_testing
+
+
+class ToolkitSimulatorTest(unittest.TestCase):
+    """Compares the ToolkitSimulator's results with the results of command line EPANET."""
+    model = None
+
+    def setUp(self) -> None:
+        if self.model is None:
+            self.skipTest('base class')
+        set_dir_testing()
+        self.network = self.model().network
+        self.simulator = ToolkitSimulator(self.network)
+
+    def tearDown(self) -> None:
+        self.simulator.close()
+
+    def compare(self, rpt, expected):
+        for array in ('nodes', 'links'):
+            actual, desired = getattr(rpt, array), getattr(expected, array)
+            self.assertEqual(desired.shape, actual.shape)
+            desired = desired.sel(id=actual.id.values)
+            for var in ('Demand', 'Head', 'Pressure', 'Flow', 'Velocity', 'Length', 'Diameter'):
+                if var in actual.vars:
+                    np.testing.assert_allclose(
+                        actual.sel(vars=var).values, desired.sel(vars=var).values, rtol=1e-4, atol=1e-3
+                    )
+
+    def test_run(self):
+        self.compare(self.simulator.run(), self.network.run(reader=BinaryFileReader))
+
+    def test_repeated_runs(self):
+        rpt = self.simulator.run()
+        self.simulator.run()
+        np.testing.assert_array_equal(rpt.nodes.values, self.simulator.run().nodes.values)
+
+
+class PoulakisEnhancedPDAToolkitSimulatorTest(ToolkitSimulatorTest):
+    model = PoulakisEnhancedPDAModel
+
+    def test_set_link_value(self):
+        self.simulator.set_link_value('P-01', 'diameter', 400.0)
+        self.assertAlmostEqual(400.0, self.simulator.get_link_value('P-01', 'diameter'))
+        get_pipe(self.network, 'P-01').diameter = 400.0
+        self.compare(self.simulator.run(), self.network.run(reader=BinaryFileReader))
+
+    def test_valve_status(self):
+        self.simulator.set_link_value('P-52', 'status', 'CLOSED')
+        self.assertEqual('CLOSED', self.simulator.get_link_value('P-52', 'status'))
+        self.assertEqual(0.0, self.simulator.run().flow['P-52'])
+        self.simulator.set_link_value('P-52', 'status', 'OPEN')
+        self.assertEqual('OPEN', self.simulator.get_link_value('P-52', 'status'))
+        self.compare(self.simulator.run(), self.network.run(reader=BinaryFileReader))
+
+    def test_unknown_parameter(self):
+        with self.assertRaises(ValueError):
+            self.simulator.set_link_value('P-01', 'not_existing', 1.0)
+
+
+class CTownToolkitSimulatorTest(ToolkitSimulatorTest):
+    model = CTownModel
+
+    def test_modification(self):
+        base = self.simulator.run()
+        modification = {'demand': {'J1': 10.0}, 'diameter': {'P2': 100.0}, 'roughness': {'P3': 80.0}}
+        rpt = self.simulator.run(modification)
+        np.testing.assert_array_equal(base.nodes.values, self.simulator.run().nodes.values)
+
+        get_junction(self.network, 'J1').demand = 10.0
+        get_pipe(self.network, 'P2').diameter = 100.0
+        get_pipe(self.network, 'P3').roughness = 80.0
+        with ToolkitSimulator(self.network) as simulator:
+            np.testing.assert_array_equal(simulator.run().nodes.values, rpt.nodes.values)
+        self.compare(rpt, self.network.run(reader=BinaryFileReader))
+
+    def test_invalid_modification(self):
+        base = self.simulator.run()
+        with self.assertRaises(ComponentNotExistingError):
+            self.simulator.run({'diameter': {'P2': 100.0, 'not_existing': 100.0}})
+        self.assertAlmostEqual(get_pipe(self.network, 'P2').diameter, self.simulator.get_link_value('P2', 'diameter'))
+        np.testing.assert_array_equal(base.nodes.values, self.simulator.run().nodes.values)
+
+
+class RulesModelToolkitSimulatorTest(ToolkitSimulatorTest):
+    model = RulesModel
+
+    def test_times(self):
+        rpt = self.simulator.run()
+        expected = self.network.run(reader=BinaryFileReader)
+        self.assertTrue((expected.nodes.time.values == rpt.nodes.time.values).all())
+
+
+class ToolkitSimulatorErrorTest(unittest.TestCase):
+    def setUp(self) -> None:
+        set_dir_testing()
+        self.network = RulesModel().network
+
+    def test_unconnected_node(self):
+        add_junction(self.network, Junction(id='unconnected', demand=1.0))
+        with self.assertRaises(EPANETSimulationError) as context:
+            ToolkitSimulator(self.network)
+        self.assertTrue(context.exception.check_contained_errors(UnconnectedNodeError))
+
+    def test_closed(self):
+        simulator = ToolkitSimulator(self.network)
+        simulator.close()
+        self.assertFalse(os.path.isfile(simulator._report_filename))
+        with self.assertRaises(ValueError):
+            simulator.run()
+
+
+if __name__ == '__main__':
+    unittest.main()
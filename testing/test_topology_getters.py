@@ -2,8 +2,10 @@ import unittest
 
 from oopnet.elements.network_components import Junction, Tank, Reservoir, Pipe, Pump, Valve, Node, Link
 from oopnet.utils.getters import *
+from oopnet.utils.adders import add_pipe
+from oopnet.utils.removers import remove_link
 
-from testing.base import PoulakisEnhancedPDAModel
+from testing.base import PoulakisEnhancedPDAModel, SimpleModel
 
 
 class PoulakisEnhancedPDAModelTopologyGetterTest(unittest.TestCase):
@@ -52,3 +54,39 @@ class PoulakisEnhancedPDAModelTopologyGetterTest(unittest.TestCase):
             self.assertIsInstance(n, Node)
         for nid in ['J-02', 'J-26', 'J-06', 'J-13']:
             self.assertTrue(get_node(self.model.network, nid) in neighs)
+
+
+class AdjacencyCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = SimpleModel()
+        self.network = self.model.network
+        self.assertEqual(['J-1'], [n.id for n in get_neighbor_nodes(self.network, get_node(self.network, 'J-2'))])
+
+    def _neighbor_ids(self, node_id: str) -> list[str]:
+        return [n.id for n in get_neighbor_nodes(self.network, get_node(self.network, node_id))]
+
+    def test_change_endnode(self):
+        get_link(self.network, 'PU-1').endnode = get_node(self.network, 'T-1')
+        self.assertEqual([], self._neighbor_ids('J-2'))
+        self.assertEqual(['J-1'], self._neighbor_ids('T-1'))
+        self.assertEqual(['P-0', 'PU-1'], [l.id for l in get_adjacent_links(self.network, get_node(self.network, 'T-1'))])
+
+    def test_revert(self):
+        get_link(self.network, 'PU-1').revert()
+        self.assertEqual(['J-1'], self._neighbor_ids('J-2'))
+
+    def test_add_link(self):
+        add_pipe(self.network, Pipe(id='P-10', startnode=get_node(self.network, 'J-2'),
+                                    endnode=get_node(self.network, 'J-3')))
+        self.assertEqual(['J-1', 'J-3'], self._neighbor_ids('J-2'))
+
+    def test_remove_link(self):
+        remove_link(self.network, 'PU-1')
+        self.assertEqual([], self._neighbor_ids('J-2'))
+        self.assertNotIn('J-2', self._neighbor_ids('J-1'))
+
+    def test_rename(self):
+        get_node(self.network, 'J-1').id = 'J-new'
+        get_link(self.network, 'PU-1').id = 'PU-new'
+        self.assertEqual(['J-new'], self._neighbor_ids('J-2'))
+        self.assertEqual(['PU-new'], [l.id for l in get_adjacent_links(self.network, get_node(self.network, 'J-2'))])
@@ -2,6 +2,8 @@ import os
 import unittest
 
 from oopnet.elements.network import Network
+from oopnet.utils.getters import get_junction_ids, get_junctions, get_pipe_ids, get_pipes
+from oopnet.writer.write import write_string
 
 from testing.base import CTownModel, MicropolisModel, PoulakisEnhancedPDAModel, RulesModel, SimpleModel
 
@@ -24,6 +26,37 @@ class CTownWriterTest(unittest.TestCase):
         self.assertEqual(self.model.network, new_network)
 
 
+class WriteStringTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = RulesModel()
+
+    def test_identical_to_file(self):
+        filename = os.path.join('tmp', 'test.inp')
+        self.model.network.write(filename)
+        with open(filename) as fid:
+            content = fid.read()
+        os.remove(filename)
+        self.assertEqual(content, write_string(self.model.network))
+
+    def test_read(self):
+        new_network = Network.read(filename=None, content=write_string(self.model.network))
+        self.assertEqual(self.model.network, new_network)
+
+
+class ReportWriterTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = CTownModel()
+
+    def test_long_lists(self):
+        network = self.model.network
+        network.report.nodes = get_junctions(network)[:70]
+        network.report.links = get_pipes(network)[:5]
+        new_network = Network.read(filename=None, content=write_string(network))
+        self.assertEqual(get_junction_ids(network)[:70], [node.id for node in new_network.report.nodes])
+        self.assertEqual(get_pipe_ids(network)[:5], [link.id for link in new_network.report.links])
+        self.assertEqual(70, network.run().nodes.sizes['id'])
+
+
 class MicropolisWriterTest(unittest.TestCase):
     def setUp(self) -> None:
         self.model = MicropolisModel()